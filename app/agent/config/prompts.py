@@ -47,6 +47,17 @@ Format your response using appropriate XML tags:
 <priority>...</priority>
 <thought>...</thought>"""
 
+CONVERSATION_SUMMARY_SYSTEM_PROMPT = """You are an AI assistant that maintains the memory of a conversation about Jira.
+Your task is to merge the existing summary and the new conversation turns into one updated summary.
+
+Keep:
+1. Ticket keys and what was done with them
+2. Decisions, filters and projects the user referred to
+3. Pending requests or follow-up actions
+
+Drop greetings, repeated ticket contents and tool details.
+Respond with the updated summary only, in at most 150 words."""
+
 # Example prompts for few-shot learning
 TICKET_LINKING_EXAMPLES = [
     {
@@ -79,6 +90,7 @@ def create_agent_prompt() -> ChatPromptTemplate:
     return ChatPromptTemplate.from_messages(
         [
             SystemMessage(content=JIRA_AGENT_SYSTEM_PROMPT),
+            MessagesPlaceholder(variable_name="chat_history", optional=True),
             ("human", "{input}"),
             MessagesPlaceholder(variable_name="agent_scratchpad"),
         ]
@@ -103,3 +115,13 @@ def create_ticket_analysis_prompt() -> ChatPromptTemplate:
             ("human", "{input}"),
         ]
     )
+
+
+def create_conversation_summary_prompt() -> ChatPromptTemplate:
+    """Create the conversation summary prompt template."""
+    return ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(content=CONVERSATION_SUMMARY_SYSTEM_PROMPT),
+            ("human", "{input}"),
+        ]
+    )
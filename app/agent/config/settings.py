@@ -22,6 +22,38 @@ class LLMSettings(BaseModel):
     presence_penalty: float = Field(
         default=0.0, description="Presence penalty for token generation"
     )
+    cascade_enabled: bool = Field(
+        default=True,
+        description="Whether ticket linking asks a small model before the large one",
+    )
+    cascade_small_model_name: str = Field(
+        default="gpt-4o-mini", description="Model judging ticket pairs first"
+    )
+    cascade_large_model_name: Optional[str] = Field(
+        default=None,
+        description="Model judging low-confidence pairs; defaults to llm_model_name",
+    )
+    cascade_confidence_threshold: float = Field(
+        default=0.9,
+        description="Minimum answer probability of the small model to skip escalation",
+    )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Whether deterministic call sites reuse persisted LLM responses",
+    )
+    cache_database_url: Optional[str] = Field(
+        default=None,
+        description="Database of the LLM cache, e.g. sqlite:///llm_cache.db; defaults to the application database",
+    )
+    cache_max_entries: int = Field(
+        default=100_000, description="Maximum number of cached LLM responses"
+    )
+    cache_max_age_days: float = Field(
+        default=30.0, description="Maximum age of a cached LLM response"
+    )
+    cache_eviction_interval: int = Field(
+        default=500, description="Number of cache writes between eviction runs"
+    )
 
     model_config = {"protected_namespaces": ()}
 
@@ -41,6 +73,130 @@ class AgentSettings(BaseModel):
         default=True,
         description="Whether to handle parsing errors gracefully",
     )
+    memory_max_tokens: int = Field(
+        default=1500,
+        description="Token ceiling for the conversation history added to the prompt",
+    )
+    memory_min_recent_turns: int = Field(
+        default=2,
+        description="Number of most recent turns kept verbatim when summarizing",
+    )
+    jira_max_concurrency: int = Field(
+        default=8, description="Maximum concurrent Jira requests of one tool call"
+    )
+    jira_requests_per_second: float = Field(
+        default=10.0,
+        description="Sustained rate of Jira requests across all tools; zero disables limiting",
+    )
+    jira_rate_limit_burst: int = Field(
+        default=10, description="Number of Jira requests allowed back to back"
+    )
+    tool_page_size: int = Field(
+        default=20, description="Number of tickets per page returned to the agent"
+    )
+    tool_result_token_cap: int = Field(
+        default=1000,
+        description="Maximum estimated tokens of a single tool result returned to the agent",
+    )
+    memory_max_ticket_refs: int = Field(
+        default=20,
+        description="Maximum number of recently fetched tickets kept as references",
+    )
+    request_timeout_seconds: float = Field(
+        default=120.0,
+        description="Time budget of one agent request; zero disables the deadline",
+    )
+    llm_timeout_seconds: float = Field(
+        default=60.0, description="Timeout of a single LLM call"
+    )
+    jira_timeout_seconds: float = Field(
+        default=20.0, description="Timeout of a single Jira call"
+    )
+    link_ledger_ttl_seconds: float = Field(
+        default=300.0,
+        description="How long a known Jira issue link is trusted without reading it again",
+    )
+    llm_max_concurrent_calls: int = Field(
+        default=16, description="Maximum concurrent LLM calls across all requests"
+    )
+    jira_max_concurrent_calls: int = Field(
+        default=16, description="Maximum concurrent Jira calls across all requests"
+    )
+    interactive_reserved_slots: int = Field(
+        default=4,
+        description="LLM and Jira call slots batch work may never take from chat requests",
+    )
+    interactive_lane_weight: int = Field(
+        default=4,
+        description="Share of freed call slots given to chat requests under contention",
+    )
+    batch_lane_weight: int = Field(
+        default=1,
+        description="Share of freed call slots given to batch work under contention",
+    )
+
+    model_config = {"protected_namespaces": ()}
+
+
+class TriageSettings(BaseModel):
+    """Settings for ticket triage."""
+
+    minhash_num_perm: int = Field(
+        default=128, description="Number of MinHash permutations per ticket signature"
+    )
+    minhash_bands: int = Field(
+        default=32, description="Number of LSH bands used to find candidate tickets"
+    )
+    minhash_shingle_size: int = Field(
+        default=3, description="Number of words per shingle when hashing tickets"
+    )
+    minhash_min_shingles: int = Field(
+        default=8,
+        description="Number of shingles a ticket needs to be linked as a near-duplicate without an LLM call",
+    )
+    duplicate_threshold: float = Field(
+        default=0.9,
+        description="Estimated Jaccard similarity above which tickets are linked without an LLM call",
+    )
+    link_classifier_path: str = Field(
+        default="models/link_classifier.json",
+        description="Path of the trained link classifier; triage uses only the LLM if missing",
+    )
+    link_classifier_confidence: float = Field(
+        default=0.95,
+        description="Minimum probability of the classifier's answer to skip the LLM",
+    )
+    record_link_decisions: bool = Field(
+        default=True,
+        description="Whether LLM linking decisions are stored as classifier training data",
+    )
+
+    model_config = {"protected_namespaces": ()}
+
+
+class EmbeddingSettings(BaseModel):
+    """Settings for ticket embeddings."""
+
+    provider: str = Field(
+        default="openai", description="Embedding backend, either openai or hashing"
+    )
+    openai_model_name: str = Field(
+        default="text-embedding-3-small", description="OpenAI embedding model"
+    )
+    batch_size: int = Field(
+        default=256, description="Number of texts embedded per provider call"
+    )
+    hashing_dimensions: int = Field(
+        default=1024, description="Vector size of the local hashing backend"
+    )
+    hashing_workers: Optional[int] = Field(
+        default=None,
+        description="Processes of the local hashing backend; defaults to the CPU count",
+    )
+    database_url: Optional[str] = Field(
+        default=None,
+        description="Database of the embedding cache; defaults to the application database",
+    )
 
     model_config = {"protected_namespaces": ()}
 
@@ -50,6 +206,8 @@ class Settings(BaseSettings):
 
     llm: LLMSettings = Field(default_factory=LLMSettings)
     agent: AgentSettings = Field(default_factory=AgentSettings)
+    triage: TriageSettings = Field(default_factory=TriageSettings)
+    embeddings: EmbeddingSettings = Field(default_factory=EmbeddingSettings)
     openai_api_key: str = Field(..., description="OpenAI API key")
     jira_api_token: str = Field(..., description="Jira API token")
     jira_username: str = Field(..., description="Jira username")
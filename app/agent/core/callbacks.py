@@ -5,6 +5,7 @@ from uuid import UUID
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 from logger import logger
+from tracing import Span, current_span, start_span
 
 
 class AgentCallbackHandler(BaseCallbackHandler):
@@ -188,3 +189,150 @@ class AgentCallbackHandler(BaseCallbackHandler):
             },
             exc_info=True,
         )
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """Callback handler turning agent executor iterations and LLM calls into spans.
+
+    Callbacks cannot change the caller's context, so spans are tracked by run
+    ID: runs that are not traced themselves resolve to the span of their
+    closest traced ancestor. Each run of the agent's planning chain under an
+    executor starts a new iteration span, which also parents the tool calls
+    of that iteration.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        # Run ID mapped to the span children of the run belong to
+        self._run_spans: Dict[UUID, Span] = {}
+        # Executor run ID mapped to its own span and its iteration count
+        self._executors: Dict[UUID, tuple[Span, int]] = {}
+        # Spans started by this handler, ended with their run
+        self._owned: Dict[UUID, Span] = {}
+
+    def span_for_run(self, run_id: Optional[UUID]) -> Optional[Span]:
+        """Get the span that children of a run belong to, if it is traced."""
+        return self._run_spans.get(run_id) if run_id else None
+
+    def _parent_span(self, parent_run_id: Optional[UUID]) -> Optional[Span]:
+        return self.span_for_run(parent_run_id) or current_span.get()
+
+    def _end_run(self, run_id: UUID, error: Optional[BaseException] = None) -> None:
+        self._run_spans.pop(run_id, None)
+        if owned := self._owned.pop(run_id, None):
+            owned.end(error=error)
+        if executor := self._executors.pop(run_id, None):
+            executor[0].set_attribute("agent.iterations", executor[1])
+            executor[0].end(error=error)
+
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Handle chain start event."""
+        name = kwargs.get("name") or (serialized or {}).get("id", [""])[-1]
+        if name == "AgentExecutor":
+            executor_span = start_span(
+                "agent.executor", parent=self._parent_span(parent_run_id)
+            )
+            self._executors[run_id] = (executor_span, 0)
+            self._run_spans[run_id] = executor_span
+        elif parent_run_id in self._executors:
+            # The agent plans the next step: a new iteration begins
+            executor_span, iteration = self._executors[parent_run_id]
+            if previous := self._run_spans.get(parent_run_id):
+                if previous is not executor_span:
+                    previous.end()
+            iteration_span = start_span(
+                "agent.iteration",
+                parent=executor_span,
+                attributes={"agent.iteration": iteration + 1},
+            )
+            self._executors[parent_run_id] = (executor_span, iteration + 1)
+            self._run_spans[parent_run_id] = iteration_span
+            self._run_spans[run_id] = iteration_span
+        elif parent := self.span_for_run(parent_run_id):
+            self._run_spans[run_id] = parent
+
+    def on_chain_end(
+        self,
+        outputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Handle chain end event."""
+        if run_id in self._executors:
+            if (last := self._run_spans.get(run_id)) is not self._executors[run_id][0]:
+                last.end()
+        self._end_run(run_id)
+
+    def on_chain_error(
+        self,
+        error: Union[Exception, KeyboardInterrupt],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Handle chain error event."""
+        if run_id in self._executors:
+            if (last := self._run_spans.get(run_id)) is not self._executors[run_id][0]:
+                last.end(error=error)
+        self._end_run(run_id, error)
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Handle LLM start event."""
+        if run_id in self._owned:
+            return
+        params = kwargs.get("invocation_params") or {}
+        model_name = params.get("model_name") or params.get("model")
+        llm_span = start_span(
+            "llm.chat",
+            kind="client",
+            parent=self._parent_span(parent_run_id),
+            attributes={"llm.model": model_name or "unknown"},
+        )
+        self._owned[run_id] = llm_span
+        self._run_spans[run_id] = llm_span
+
+    def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Handle LLM end event."""
+        if llm_span := self._owned.get(run_id):
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            for key in ("prompt_tokens", "completion_tokens"):
+                if key in usage:
+                    llm_span.set_attribute(f"llm.{key}", usage[key])
+        self._end_run(run_id)
+
+    def on_llm_error(
+        self,
+        error: Union[Exception, KeyboardInterrupt],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Handle LLM error event."""
+        self._end_run(run_id, error)
+
+
+tracing_handler = TracingCallbackHandler()
@@ -0,0 +1,63 @@
+"""Per-request deadlines shared by every call an agent run makes."""
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call would start after the request deadline has passed."""
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """Bound the calls made inside the block by a time budget.
+
+    A nested deadline never extends the deadline of an enclosing block.
+
+    Args:
+        seconds: The time budget; None or zero leaves the calls unbounded
+
+    Yields:
+        The monotonic time of the deadline, or None if there is none
+    """
+    deadline = current_deadline.get()
+    if seconds:
+        new_deadline = time.monotonic() + seconds
+        deadline = min(deadline, new_deadline) if deadline else new_deadline
+    token = current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        current_deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Get the seconds left until the current deadline, or None without one."""
+    deadline = current_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def call_timeout(timeout: float) -> float:
+    """Get the timeout of a call, shortened to fit the current deadline.
+
+    Args:
+        timeout: The configured timeout of the call
+
+    Returns:
+        The smaller of the timeout and the time left until the deadline
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded")
+    return min(timeout, remaining)
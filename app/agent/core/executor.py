@@ -1,16 +1,48 @@
 """Agent executor implementation."""
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain.agents import AgentExecutor, create_openai_functions_agent
+from langchain_core.agents import AgentAction
 from langchain.tools import BaseTool
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.prompts import BasePromptTemplate
 from langchain_openai import ChatOpenAI
+from logger import logger
 
 from ..config.prompts import create_agent_prompt
 from ..config.settings import settings
 from ..llm.models import get_llm
 from .base import BaseAgent
+from .callbacks import tracing_handler
+from .deadline import DeadlineExceededError, remaining_time, request_deadline
+from .memory import ConversationMemory
+from .telemetry import telemetry_handler
+
+
+# Longest part of a tool observation quoted in a partial answer
+PARTIAL_OBSERVATION_CHARS = 500
+
+
+def format_partial_output(steps: List[Tuple[AgentAction, Any]]) -> str:
+    """Render the steps finished before the deadline as the agent's answer.
+
+    Args:
+        steps: The (action, observation) pairs completed in time
+
+    Returns:
+        An answer stating that the request ran out of time, with the results
+        gathered so far
+    """
+    if not steps:
+        return "The request ran out of time before any results were available."
+    lines = ["The request ran out of time. Results gathered so far:"]
+    for action, observation in steps:
+        text = str(observation)
+        if len(text) > PARTIAL_OBSERVATION_CHARS:
+            text = text[:PARTIAL_OBSERVATION_CHARS] + "..."
+        lines.append(f"- {action.tool}({action.tool_input}): {text}")
+    return "\n".join(lines)
 
 
 class JiraAgent(BaseAgent):
@@ -65,19 +97,84 @@ class JiraAgent(BaseAgent):
             max_iterations=self.max_iterations,
             early_stopping_method=self.early_stopping_method,
             handle_parsing_errors=settings.agent.handle_parsing_errors,
+            return_intermediate_steps=True,
             verbose=settings.agent.verbose,
         )
 
-    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute(
+        self,
+        input_data: Dict[str, Any],
+        memory: Optional[ConversationMemory] = None,
+    ) -> Dict[str, Any]:
         """Execute the agent with the given input.
 
         Args:
             input_data: The input data for the agent
+            memory: Optional session memory, rendered as chat history and
+                updated with the finished turn
 
         Returns:
-            The agent's response
+            The agent's response; when the request deadline passes first, an
+            answer built from the finished steps, flagged as partial
         """
-        result = await self.executor.ainvoke(input_data)
-        if not isinstance(result, dict):
-            return {"output": str(result)}
+        if memory is not None:
+            input_data = {**input_data, "chat_history": memory.to_messages()}
+
+        with request_deadline(settings.agent.request_timeout_seconds):
+            result = await self._run_until_deadline(input_data)
+            remaining = remaining_time()
+
+        if memory is not None and result.get("output"):
+            memory.add_turn(
+                input_data["input"],
+                str(result["output"]),
+                result.get("intermediate_steps", []),
+            )
+            # Summarizing calls the LLM, which is not allowed past the deadline;
+            # the history is then compacted after the next turn instead
+            if not result.get("partial") and (remaining is None or remaining > 0):
+                await memory.compact(self.llm)
         return result
+
+    async def _run_until_deadline(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the executor step by step until it finishes or time runs out.
+
+        Streaming the steps keeps the ones finished before the deadline, and
+        running out of time cancels the step in flight, so no further LLM or
+        Jira calls are made.
+
+        Args:
+            input_data: The input data for the agent
+
+        Returns:
+            The executor's output, or a partial answer from the finished steps
+            if the deadline passed
+        """
+        steps: List[Tuple[AgentAction, Any]] = []
+        timeout = asyncio.timeout(remaining_time())
+        try:
+            async with timeout:
+                # Passed at run time so that they are inherited by every child run
+                async for chunk in self.executor.astream(
+                    input_data,
+                    config={"callbacks": [telemetry_handler, tracing_handler]},
+                ):
+                    if "output" in chunk:
+                        return dict(chunk)
+                    steps.extend(
+                        (step.action, step.observation)
+                        for step in chunk.get("steps", [])
+                    )
+            # The stream ended without an answer, which is not a timeout
+            return {"intermediate_steps": steps}
+        except (TimeoutError, DeadlineExceededError):
+            # Timeouts of single calls inside a tool are the tool's errors
+            remaining = remaining_time()
+            if not timeout.expired() and (remaining is None or remaining > 0):
+                raise
+        logger.warning(f"Agent request ran out of time after {len(steps)} steps")
+        return {
+            "output": format_partial_output(steps),
+            "intermediate_steps": steps,
+            "partial": True,
+        }
@@ -0,0 +1,178 @@
+"""Priority lanes sharing the LLM and Jira clients between kinds of work.
+
+Interactive chat requests and batch work such as webhook triage run on the
+same event loop and call the same LLM and Jira clients. Each client gets a
+pool of slots shared by both lanes. When callers wait for a slot, freed
+slots go to the lanes in proportion to their weights, and some slots are
+reserved for interactive requests, so a long triage run cannot starve chat
+while batch work still uses every idle slot.
+"""
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Literal
+
+from ..config.settings import settings
+
+Lane = Literal["interactive", "batch"]
+LANES: tuple[Lane, ...] = ("interactive", "batch")
+
+# Work outside an explicit lane, such as health probes, is treated as interactive
+current_lane: ContextVar[Lane] = ContextVar("current_lane", default="interactive")
+
+
+@contextmanager
+def lane(name: Lane) -> Iterator[None]:
+    """Schedule the LLM and Jira calls made inside the block in a lane.
+
+    Args:
+        name: The lane of the calls
+    """
+    token = current_lane.set(name)
+    try:
+        yield
+    finally:
+        current_lane.reset(token)
+
+
+class LaneScheduler:
+    """Weighted fair sharing of a pool of slots between the lanes.
+
+    Without contention a call takes a free slot right away. Otherwise callers
+    wait in a FIFO queue per lane, and each freed slot goes to the waiting
+    lane picked by smooth weighted round robin. A lane never holds more slots
+    than its limit, which keeps slots free for the other lane.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int,
+        weights: dict[Lane, int],
+        limits: dict[Lane, int],
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            name: Name of the shared client, used in the statistics
+            slots: Number of calls allowed at the same time across the lanes
+            weights: Share of freed slots each lane gets under contention
+            limits: Maximum number of slots each lane may hold
+        """
+        self.name = name
+        self.slots = max(slots, 1)
+        self.weights = {name: max(weights[name], 1) for name in LANES}
+        self.limits = {name: min(max(limits[name], 1), self.slots) for name in LANES}
+        self._waiters: dict[Lane, deque[asyncio.Future[None]]] = {
+            name: deque() for name in LANES
+        }
+        self._credits = {name: 0 for name in LANES}
+        self._running = {name: 0 for name in LANES}
+        self._granted = {name: 0 for name in LANES}
+        self._wait_seconds = {name: 0.0 for name in LANES}
+
+    def _may_start(self, name: Lane) -> bool:
+        return (
+            sum(self._running.values()) < self.slots
+            and self._running[name] < self.limits[name]
+        )
+
+    def _next_lane(self) -> Lane | None:
+        """Pick the lane receiving the next free slot by smooth weighted round robin."""
+        eligible = [
+            name for name in LANES if self._waiters[name] and self._may_start(name)
+        ]
+        if not eligible:
+            return None
+        for name in eligible:
+            self._credits[name] += self.weights[name]
+        chosen = max(eligible, key=lambda name: self._credits[name])
+        self._credits[chosen] -= sum(self.weights[name] for name in eligible)
+        return chosen
+
+    def _dispatch(self) -> None:
+        while (name := self._next_lane()) is not None:
+            waiter = self._waiters[name].popleft()
+            if waiter.done():
+                # Cancelled while waiting
+                continue
+            self._running[name] += 1
+            waiter.set_result(None)
+
+    def _release(self, name: Lane) -> None:
+        self._running[name] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot in the current lane for the duration of the block."""
+        name = current_lane.get()
+        queued_at = time.monotonic()
+        if self._may_start(name) and not self._waiters[name]:
+            self._running[name] += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[name].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was granted just before the cancellation
+                    self._release(name)
+                raise
+        self._granted[name] += 1
+        self._wait_seconds[name] += time.monotonic() - queued_at
+        try:
+            yield
+        finally:
+            self._release(name)
+
+    def stats(self) -> list[dict[str, object]]:
+        """Get the occupancy and the waits of each lane."""
+        return [
+            {
+                "pool": self.name,
+                "lane": name,
+                "slots": self.slots,
+                "limit": self.limits[name],
+                "weight": self.weights[name],
+                "running": self._running[name],
+                "waiting": sum(not w.done() for w in self._waiters[name]),
+                "granted": self._granted[name],
+                "avg_wait_seconds": (
+                    self._wait_seconds[name] / self._granted[name]
+                    if self._granted[name]
+                    else 0.0
+                ),
+            }
+            for name in LANES
+        ]
+
+
+def create_scheduler(name: str, slots: int) -> LaneScheduler:
+    """Create the scheduler of a shared client from the agent settings.
+
+    Args:
+        name: Name of the shared client
+        slots: Number of calls allowed at the same time
+
+    Returns:
+        A scheduler reserving slots for interactive requests
+    """
+    reserved = min(settings.agent.interactive_reserved_slots, slots - 1)
+    return LaneScheduler(
+        name,
+        slots,
+        weights={
+            "interactive": settings.agent.interactive_lane_weight,
+            "batch": settings.agent.batch_lane_weight,
+        },
+        limits={"interactive": slots, "batch": slots - reserved},
+    )
+
+
+llm_scheduler = create_scheduler("llm", settings.agent.llm_max_concurrent_calls)
+jira_scheduler = create_scheduler("jira", settings.agent.jira_max_concurrent_calls)
@@ -0,0 +1,169 @@
+"""Token-bounded conversation memory for agent sessions."""
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from logger import logger
+
+from ..config.prompts import create_conversation_summary_prompt
+from ..config.settings import settings
+
+TICKET_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9]+-\d+$")
+TICKET_REF_MAX_CHARS = 80
+
+
+def _ticket_ref(text: Any) -> str:
+    """Reduce ticket data to its first line, which holds the summary."""
+    first_line = str(text).strip().split("\n", 1)[0]
+    return first_line[:TICKET_REF_MAX_CHARS]
+
+
+def extract_ticket_refs(intermediate_steps: List[Tuple[Any, Any]]) -> Dict[str, str]:
+    """Collect compact references to tickets returned by tool calls.
+
+    Args:
+        intermediate_steps: The (action, observation) pairs of an agent run
+
+    Returns:
+        Ticket keys mapped to a one-line summary, in the order they were fetched
+    """
+    refs: Dict[str, str] = {}
+    for _, observation in intermediate_steps:
+        if isinstance(observation, dict) and isinstance(observation.get("rows"), list):
+            # Compact search page: rows of key, summary and status
+            refs.update(
+                {
+                    row["key"]: _ticket_ref(
+                        f"{row.get('summary', '')} [{row.get('status', '')}]"
+                    )
+                    for row in observation["rows"]
+                    if isinstance(row, dict) and "key" in row
+                }
+            )
+        elif isinstance(observation, dict):
+            refs.update(
+                {
+                    key: _ticket_ref(value)
+                    for key, value in observation.items()
+                    if isinstance(key, str) and TICKET_KEY_PATTERN.match(key)
+                }
+            )
+        elif (
+            isinstance(observation, tuple)
+            and len(observation) == 2
+            and isinstance(observation[0], str)
+            and TICKET_KEY_PATTERN.match(observation[0])
+        ):
+            refs[observation[0]] = _ticket_ref(observation[1])
+    return refs
+
+
+@dataclass
+class ConversationMemory:
+    """Rolling summary, recent turns and ticket references of one chat session.
+
+    Older turns are folded into the summary whenever the rendered history
+    exceeds the configured token ceiling, so the prompt size stays constant
+    however long the conversation grows.
+    """
+
+    summary: str = ""
+    turns: List[Dict[str, str]] = field(default_factory=list)
+    ticket_refs: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "ConversationMemory":
+        """Restore a memory from its persisted form."""
+        return cls(**data) if data else cls()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the persistable form of the memory."""
+        return asdict(self)
+
+    def to_messages(self) -> List[BaseMessage]:
+        """Render the memory as chat history for the agent prompt."""
+        messages: List[BaseMessage] = []
+        if context := self._context():
+            messages.append(SystemMessage(content=context))
+        for turn in self.turns:
+            messages.append(HumanMessage(content=turn["input"]))
+            messages.append(AIMessage(content=turn["output"]))
+        return messages
+
+    def add_turn(
+        self,
+        user_input: str,
+        output: str,
+        intermediate_steps: List[Tuple[Any, Any]],
+    ) -> None:
+        """Record a finished turn and the tickets it fetched.
+
+        Args:
+            user_input: The user's request
+            output: The agent's final answer
+            intermediate_steps: The (action, observation) pairs of the run
+        """
+        self.turns.append({"input": user_input, "output": output})
+        for key, ref in extract_ticket_refs(intermediate_steps).items():
+            self.ticket_refs.pop(key, None)  # Re-insert to mark as most recent
+            self.ticket_refs[key] = ref
+        overflow = len(self.ticket_refs) - settings.agent.memory_max_ticket_refs
+        for key in list(self.ticket_refs)[: max(overflow, 0)]:
+            del self.ticket_refs[key]
+
+    async def compact(self, llm: BaseChatModel) -> None:
+        """Shrink the memory until it fits the configured token ceiling.
+
+        Args:
+            llm: Model used to summarize folded turns and to count tokens
+        """
+        max_tokens = settings.agent.memory_max_tokens
+        if self.count_tokens(llm) <= max_tokens:
+            return
+
+        keep = settings.agent.memory_min_recent_turns
+        await self._fold(llm, len(self.turns) - keep if keep else len(self.turns))
+        if self.count_tokens(llm) > max_tokens:
+            # The recent turns alone exceed the budget, so fold them too
+            await self._fold(llm, len(self.turns))
+
+        while self.ticket_refs and self.count_tokens(llm) > max_tokens:
+            del self.ticket_refs[next(iter(self.ticket_refs))]
+        if (tokens := self.count_tokens(llm)) > max_tokens:
+            self.summary = self.summary[: len(self.summary) * max_tokens // tokens]
+
+    def count_tokens(self, llm: BaseChatModel) -> int:
+        """Count the tokens the rendered history adds to the prompt."""
+        return llm.get_num_tokens_from_messages(self.to_messages())
+
+    def _context(self) -> str:
+        sections = []
+        if self.summary:
+            sections.append(f"Summary of the earlier conversation:\n{self.summary}")
+        if self.ticket_refs:
+            refs = "\n".join(f"{key}: {ref}" for key, ref in self.ticket_refs.items())
+            sections.append(f"Tickets referenced in this conversation:\n{refs}")
+        return "\n\n".join(sections)
+
+    async def _fold(self, llm: BaseChatModel, count: int) -> None:
+        """Merge the oldest turns into the rolling summary."""
+        if count <= 0:
+            return
+        folded, self.turns = self.turns[:count], self.turns[count:]
+        conversation = "\n".join(
+            f"User: {turn['input']}\nAssistant: {turn['output']}" for turn in folded
+        )
+        try:
+            logger.debug(f"Summarizing {len(folded)} conversation turns")
+            result = await llm.ainvoke(
+                create_conversation_summary_prompt().format_prompt(
+                    input=f"<summary>{self.summary}</summary>"
+                    f"<conversation>{conversation}</conversation>"
+                )
+            )
+            self.summary = str(result.content).strip()
+        except Exception as e:
+            # Dropping the folded turns keeps the ceiling even without a summary
+            logger.error(f"Error summarizing conversation: {e}", exc_info=True)
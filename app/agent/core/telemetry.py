@@ -0,0 +1,139 @@
+"""Per-request performance telemetry collected while the agent runs."""
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+
+@dataclass
+class RequestTelemetry:
+    """Timings and usage of one agent request.
+
+    LLM and Jira times are summed over all calls, so they can exceed the
+    total latency when calls overlap.
+    """
+
+    model_name: Optional[str] = None
+    latency_seconds: float = 0.0
+    llm_seconds: float = 0.0
+    jira_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    iterations: int = 0
+    tool_calls: int = 0
+    tool_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def record_tool(self, name: str, seconds: float) -> None:
+        stats = self.tool_stats.setdefault(name, {"calls": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        self.tool_calls += 1
+
+    def as_columns(self) -> Dict[str, Any]:
+        """Get the telemetry as JiraRequest column values."""
+        return {
+            "model_name": self.model_name,
+            "latency_seconds": round(self.latency_seconds, 4),
+            "llm_seconds": round(self.llm_seconds, 4),
+            "jira_seconds": round(self.jira_seconds, 4),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "iterations": self.iterations,
+            "tool_calls": self.tool_calls,
+            "tool_stats": self.tool_stats,
+        }
+
+
+current_telemetry: ContextVar[Optional[RequestTelemetry]] = ContextVar(
+    "current_telemetry", default=None
+)
+
+
+@contextmanager
+def collect_telemetry(model_name: Optional[str] = None) -> Iterator[RequestTelemetry]:
+    """Collect the telemetry of the calls made inside the block.
+
+    Args:
+        model_name: Name of the model answering the request
+
+    Yields:
+        The telemetry, with the latency set once the block exits
+    """
+    telemetry = RequestTelemetry(model_name=model_name)
+    token = current_telemetry.set(telemetry)
+    started_at = time.perf_counter()
+    try:
+        yield telemetry
+    finally:
+        telemetry.latency_seconds = time.perf_counter() - started_at
+        current_telemetry.reset(token)
+
+
+def record_jira_time(seconds: float) -> None:
+    """Add the duration of a Jira call to the current request, if any."""
+    if telemetry := current_telemetry.get():
+        telemetry.jira_seconds += seconds
+
+
+def record_tool_time(name: str, seconds: float) -> None:
+    """Add a tool call and its duration to the current request, if any."""
+    if telemetry := current_telemetry.get():
+        telemetry.record_tool(name, seconds)
+
+
+class TelemetryCallbackHandler(BaseCallbackHandler):
+    """Callback handler timing LLM runs into the current request.
+
+    A single shared instance is attached both to the LLMs and to the agent
+    executor; LangChain deduplicates it, and runs are keyed by run ID so an
+    event reaching it twice is only counted once.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._llm_starts: Dict[UUID, float] = {}
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Handle LLM start event."""
+        if current_telemetry.get():
+            self._llm_starts[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Handle LLM end event."""
+        started_at = self._llm_starts.pop(run_id, None)
+        telemetry = current_telemetry.get()
+        if started_at is None or telemetry is None:
+            return
+        telemetry.llm_seconds += time.perf_counter() - started_at
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        telemetry.prompt_tokens += usage.get("prompt_tokens", 0)
+        telemetry.completion_tokens += usage.get("completion_tokens", 0)
+
+    def on_llm_error(
+        self,
+        error: Union[Exception, KeyboardInterrupt],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Handle LLM error event."""
+        started_at = self._llm_starts.pop(run_id, None)
+        if started_at is not None and (telemetry := current_telemetry.get()):
+            telemetry.llm_seconds += time.perf_counter() - started_at
+
+
+telemetry_handler = TelemetryCallbackHandler()
@@ -0,0 +1,114 @@
+"""Content-addressed storage of ticket embeddings."""
+import hashlib
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Dict, Iterable
+
+import numpy as np
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Engine,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    insert,
+    select,
+)
+
+from ..config.settings import settings
+
+metadata = MetaData()
+
+embedding_table = Table(
+    "ticket_embeddings",
+    metadata,
+    Column("content_hash", String(64), primary_key=True),
+    Column("provider", String(128), primary_key=True),
+    Column("dimensions", Integer, nullable=False),
+    Column("vector", LargeBinary, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def content_hash(text: str) -> str:
+    """Get the key under which the embedding of a text is cached."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+@lru_cache()
+def get_embedding_engine() -> Engine:
+    """Get the engine storing embeddings, creating their table if needed.
+
+    Without EMBEDDINGS__DATABASE_URL the application database is used.
+
+    Returns:
+        SQLAlchemy engine
+    """
+    if settings.embeddings.database_url:
+        engine = create_engine(settings.embeddings.database_url)
+    else:
+        from database import engine
+    metadata.create_all(engine)
+    return engine
+
+
+class EmbeddingCache:
+    """Vectors of one provider, keyed by the hash of the embedded text."""
+
+    def __init__(self, provider: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            provider: Name of the provider whose vectors are stored
+        """
+        self.provider = provider
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Get the cached vectors of the given content hashes.
+
+        Args:
+            hashes: Content hashes to look up
+
+        Returns:
+            The hashes found, mapped to their vectors
+        """
+        hashes = list(hashes)
+        if not hashes:
+            return {}
+        query = select(embedding_table.c.content_hash, embedding_table.c.vector).where(
+            embedding_table.c.provider == self.provider,
+            embedding_table.c.content_hash.in_(hashes),
+        )
+        with get_embedding_engine().connect() as connection:
+            return {
+                key: np.frombuffer(vector, dtype=np.float32)
+                for key, vector in connection.execute(query)
+            }
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Store vectors by content hash.
+
+        Args:
+            vectors: Content hashes mapped to their vectors
+        """
+        if not vectors:
+            return
+        now = datetime.now(UTC)
+        with get_embedding_engine().begin() as connection:
+            connection.execute(
+                insert(embedding_table),
+                [
+                    {
+                        "content_hash": key,
+                        "provider": self.provider,
+                        "dimensions": len(vector),
+                        "vector": np.asarray(vector, dtype=np.float32).tobytes(),
+                        "created_at": now,
+                    }
+                    for key, vector in vectors.items()
+                ],
+            )
@@ -0,0 +1,127 @@
+"""Embedding backends for ticket text."""
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Protocol
+
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+
+from ..linking.minhash import normalize_ticket_text
+
+
+class EmbeddingProvider(Protocol):
+    """Backend turning batches of texts into vectors."""
+
+    @property
+    def name(self) -> str:
+        """Identifier of the backend and model, used to key cached vectors."""
+        ...
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of texts.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            Matrix of shape (len(texts), dimensions)
+        """
+        ...
+
+
+class OpenAIEmbeddingProvider:
+    """Embeddings from the OpenAI API, requested in batches."""
+
+    def __init__(self, model_name: str, batch_size: int) -> None:
+        """Initialize the provider.
+
+        Args:
+            model_name: Name of the OpenAI embedding model
+            batch_size: Number of texts sent per API request
+        """
+        self.model_name = model_name
+        self.client = OpenAIEmbeddings(model=model_name, chunk_size=batch_size)
+
+    @property
+    def name(self) -> str:
+        return f"openai:{self.model_name}"
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        return np.array(await self.client.aembed_documents(texts), dtype=np.float32)
+
+
+def hash_embed(texts: List[str], dimensions: int) -> np.ndarray:
+    """Embed texts by hashing their words and word pairs into a fixed-size vector.
+
+    Runs in worker processes, so it must stay a module-level function.
+
+    Args:
+        texts: The texts to embed
+        dimensions: Vector size
+
+    Returns:
+        L2-normalized matrix of shape (len(texts), dimensions)
+    """
+    vectors = np.zeros((len(texts), dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        words = normalize_ticket_text(text).split()
+        for term in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+            digest = hashlib.blake2b(term.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            # The lowest bit picks the sign, which keeps collisions unbiased
+            vectors[row, (value >> 1) % dimensions] += 1.0 if value & 1 else -1.0
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class HashingEmbeddingProvider:
+    """Local embeddings from feature hashing, for tests and air-gapped deployments.
+
+    Batches are split into chunks that are hashed in a process pool, so large
+    backfills use every core without blocking the event loop.
+    """
+
+    def __init__(
+        self, dimensions: int, batch_size: int, workers: Optional[int] = None
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            dimensions: Vector size
+            batch_size: Number of texts hashed per worker task
+            workers: Number of worker processes, defaults to the CPU count
+        """
+        self.dimensions = dimensions
+        self.batch_size = batch_size
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def name(self) -> str:
+        return f"hashing:{self.dimensions}"
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor,
+                    hash_embed,
+                    texts[i : i + self.batch_size],
+                    self.dimensions,
+                )
+                for i in range(0, len(texts), self.batch_size)
+            )
+        )
+        return np.vstack(chunks)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
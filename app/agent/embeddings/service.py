@@ -0,0 +1,85 @@
+"""Embedding of ticket text with a content-hash cache in front of the provider."""
+import asyncio
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+from logger import logger
+
+from ..config.settings import settings
+from .cache import EmbeddingCache, content_hash
+from .providers import (
+    EmbeddingProvider,
+    HashingEmbeddingProvider,
+    OpenAIEmbeddingProvider,
+)
+
+
+def create_embedding_provider() -> EmbeddingProvider:
+    """Create the embedding provider configured by the embedding settings.
+
+    Raises:
+        ValueError: If the configured provider is unknown
+    """
+    config = settings.embeddings
+    if config.provider == "openai":
+        return OpenAIEmbeddingProvider(config.openai_model_name, config.batch_size)
+    if config.provider == "hashing":
+        return HashingEmbeddingProvider(
+            config.hashing_dimensions, config.batch_size, config.hashing_workers
+        )
+    raise ValueError(f"Unknown embedding provider: {config.provider}")
+
+
+class EmbeddingService:
+    """Embed tickets, calling the provider only for text it has not seen."""
+
+    def __init__(self, provider: EmbeddingProvider, batch_size: int) -> None:
+        """Initialize the service.
+
+        Args:
+            provider: Backend computing new vectors
+            batch_size: Number of texts sent to the provider per call
+        """
+        self.provider = provider
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(provider.name)
+
+    async def embed_tickets(self, tickets: Dict[str, str]) -> Dict[str, np.ndarray]:
+        """Get the vectors of tickets, embedding only new or changed text.
+
+        Args:
+            tickets: Ticket keys mapped to their text
+
+        Returns:
+            Ticket keys mapped to their vectors
+        """
+        hashes = {key: content_hash(text) for key, text in tickets.items()}
+        texts = {hashes[key]: text for key, text in tickets.items()}
+        vectors = await asyncio.to_thread(self.cache.get_many, texts)
+
+        missing = [h for h in texts if h not in vectors]
+        new_vectors: Dict[str, np.ndarray] = {}
+        for i in range(0, len(missing), self.batch_size):
+            batch = missing[i : i + self.batch_size]
+            embedded = await self.provider.embed([texts[h] for h in batch])
+            new_vectors.update(zip(batch, embedded))
+
+        if new_vectors:
+            try:
+                await asyncio.to_thread(self.cache.put_many, new_vectors)
+            except Exception as e:
+                # Another writer may have stored the same text concurrently
+                logger.warning(f"Error caching embeddings: {e}")
+        logger.debug(
+            f"Embedded {len(tickets)} tickets with {len(texts)} distinct texts: "
+            f"{len(texts) - len(missing)} cached, {len(missing)} new"
+        )
+        vectors.update(new_vectors)
+        return {key: vectors[h] for key, h in hashes.items()}
+
+
+@lru_cache()
+def get_embedding_service() -> EmbeddingService:
+    """Get the shared embedding service."""
+    return EmbeddingService(create_embedding_provider(), settings.embeddings.batch_size)
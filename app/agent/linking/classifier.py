@@ -0,0 +1,150 @@
+"""Logistic regression deciding ticket links from similarity features.
+
+The model is trained offline on the decisions the LLM made for past ticket
+pairs. At triage time it answers the pairs it is confident about, so only
+the uncertain ones cost an LLM call.
+"""
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from .features import FEATURE_NAMES
+
+
+@dataclass
+class LinkClassifier:
+    """Standardized logistic regression over pair features."""
+
+    weights: List[float]
+    bias: float
+    mean: List[float]
+    scale: List[float]
+    feature_names: List[str] = field(default_factory=lambda: list(FEATURE_NAMES))
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def fit(
+        cls,
+        features: np.ndarray,
+        labels: np.ndarray,
+        epochs: int = 2000,
+        learning_rate: float = 0.1,
+        l2: float = 1e-3,
+    ) -> "LinkClassifier":
+        """Train the classifier with full-batch gradient descent.
+
+        Classes are weighted by their inverse frequency, since most recorded
+        pairs are unrelated.
+
+        Args:
+            features: Matrix of shape (samples, len(FEATURE_NAMES))
+            labels: Vector of 0/1 labels
+            epochs: Number of gradient steps
+            learning_rate: Step size
+            l2: L2 regularization strength
+
+        Returns:
+            The trained classifier
+        """
+        mean = features.mean(axis=0)
+        scale = features.std(axis=0)
+        scale[scale == 0] = 1.0
+        x = (features - mean) / scale
+        y = labels.astype(float)
+
+        positives = max(y.sum(), 1.0)
+        negatives = max(len(y) - y.sum(), 1.0)
+        sample_weights = np.where(
+            y == 1, len(y) / (2 * positives), len(y) / (2 * negatives)
+        )
+
+        weights = np.zeros(x.shape[1])
+        bias = 0.0
+        for _ in range(epochs):
+            error = (_sigmoid(x @ weights + bias) - y) * sample_weights
+            weights -= learning_rate * (x.T @ error / len(y) + l2 * weights)
+            bias -= learning_rate * error.mean()
+
+        return cls(
+            weights=weights.tolist(),
+            bias=float(bias),
+            mean=mean.tolist(),
+            scale=scale.tolist(),
+        )
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Get the probability that pairs should be linked.
+
+        Args:
+            features: A feature vector or a matrix of feature vectors
+
+        Returns:
+            The link probability per pair
+        """
+        x = (features - np.asarray(self.mean)) / np.asarray(self.scale)
+        return _sigmoid(x @ np.asarray(self.weights) + self.bias)
+
+    def evaluate(
+        self, features: np.ndarray, labels: np.ndarray, confidence: float
+    ) -> Dict[str, float]:
+        """Measure the classifier against LLM labels.
+
+        Args:
+            features: Matrix of feature vectors
+            labels: Vector of 0/1 labels given by the LLM
+            confidence: Confidence used to decide pairs at triage time
+
+        Returns:
+            Overall accuracy, precision and recall, and the share of pairs
+            decided confidently together with the accuracy on those pairs
+        """
+        probabilities = self.predict_proba(features)
+        predicted = probabilities >= 0.5
+        actual = labels.astype(bool)
+        confident = np.maximum(probabilities, 1 - probabilities) >= confidence
+
+        true_positives = float(np.sum(predicted & actual))
+        return {
+            "samples": float(len(labels)),
+            "accuracy": float(np.mean(predicted == actual)) if len(labels) else 0.0,
+            "precision": true_positives / max(float(predicted.sum()), 1.0),
+            "recall": true_positives / max(float(actual.sum()), 1.0),
+            "coverage": float(np.mean(confident)) if len(labels) else 0.0,
+            "confident_accuracy": (
+                float(np.mean(predicted[confident] == actual[confident]))
+                if confident.any()
+                else 0.0
+            ),
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the classifier to a JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self), indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> "LinkClassifier":
+        """Read a classifier written by save.
+
+        Args:
+            path: Path of the JSON file
+
+        Returns:
+            The loaded classifier
+
+        Raises:
+            ValueError: If the file was trained on a different feature set
+        """
+        classifier = cls(**json.loads(path.read_text()))
+        if classifier.feature_names != FEATURE_NAMES:
+            raise ValueError(
+                f"Classifier features {classifier.feature_names} do not match {FEATURE_NAMES}"
+            )
+        return classifier
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(-np.clip(z, -30, 30)))
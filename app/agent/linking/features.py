@@ -0,0 +1,61 @@
+"""Similarity features of ticket pairs for the link classifier."""
+import math
+from collections import Counter
+from typing import List, Set
+
+import numpy as np
+
+from .minhash import normalize_ticket_text, shingle
+
+FEATURE_NAMES: List[str] = [
+    "token_jaccard",
+    "token_containment",
+    "token_cosine",
+    "shingle_jaccard",
+    "summary_jaccard",
+    "length_ratio",
+    "log_shared_tokens",
+]
+
+
+def _jaccard(first: Set[str], second: Set[str]) -> float:
+    union = first | second
+    return len(first & second) / len(union) if union else 0.0
+
+
+def pair_features(ticket1: str, ticket2: str, shingle_size: int = 3) -> np.ndarray:
+    """Compute the similarity features of a ticket pair.
+
+    The features are symmetric, so the order of the tickets does not matter.
+
+    Args:
+        ticket1: Summary and description of the first ticket
+        ticket2: Summary and description of the second ticket
+        shingle_size: Number of words per shingle
+
+    Returns:
+        Feature vector ordered as FEATURE_NAMES
+    """
+    text1, text2 = normalize_ticket_text(ticket1), normalize_ticket_text(ticket2)
+    counts1, counts2 = Counter(text1.split()), Counter(text2.split())
+    tokens1, tokens2 = set(counts1), set(counts2)
+    shared = tokens1 & tokens2
+
+    norm = math.sqrt(sum(v * v for v in counts1.values())) * math.sqrt(
+        sum(v * v for v in counts2.values())
+    )
+    summary1 = set(normalize_ticket_text(ticket1.split("\n", 1)[0]).split())
+    summary2 = set(normalize_ticket_text(ticket2.split("\n", 1)[0]).split())
+    lengths = sorted((sum(counts1.values()), sum(counts2.values())))
+
+    return np.array(
+        [
+            _jaccard(tokens1, tokens2),
+            len(shared) / min(len(tokens1), len(tokens2)) if shared else 0.0,
+            sum(counts1[t] * counts2[t] for t in shared) / norm if norm else 0.0,
+            _jaccard(shingle(text1, shingle_size), shingle(text2, shingle_size)),
+            _jaccard(summary1, summary2),
+            lengths[0] / lengths[1] if lengths[1] else 0.0,
+            math.log1p(len(shared)),
+        ]
+    )
@@ -0,0 +1,252 @@
+"""MinHash/LSH index for near-duplicate ticket detection.
+
+Auto-generated error tickets tend to differ only by volatile tokens such as
+timestamps, request ids or hex addresses. Normalizing those tokens away and
+comparing MinHash signatures lets us spot such near-duplicates without an LLM
+round-trip. Short numbers such as status codes or versions carry meaning and
+are kept.
+"""
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+# Largest 61-bit Mersenne prime, used for universal hashing of shingles
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATION_SEED = 1
+
+# Volatile tokens replaced before shingling, applied in order
+_NORMALIZATION_PATTERNS: List[Tuple[re.Pattern[str], str]] = [
+    (
+        re.compile(
+            r"\b\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(z|[+-]\d{2}:?\d{2})?\b"
+        ),
+        " <ts> ",
+    ),
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}\b"), " <date> "),
+    (re.compile(r"\b\d{2}:\d{2}(:\d{2}(\.\d+)?)?\b"), " <time> "),
+    (
+        re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"),
+        " <uuid> ",
+    ),
+    (re.compile(r"\b0x[0-9a-f]+\b"), " <hex> "),
+    (re.compile(r"\b[0-9a-f]{12,}\b"), " <hex> "),
+    # Long digit runs are ids; short numbers like 500 or 3.12 are kept
+    (re.compile(r"\b\d{5,}\b"), " <num> "),
+    (re.compile(r"[^\w<>]+"), " "),
+]
+
+
+def normalize_ticket_text(text: str) -> str:
+    """Normalize ticket text so that volatile identifiers do not affect similarity.
+
+    Args:
+        text: Raw ticket summary and description
+
+    Returns:
+        Lower-cased text with timestamps, ids and long numbers replaced by
+        placeholders
+    """
+    normalized = text.lower()
+    for pattern, replacement in _NORMALIZATION_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+    return " ".join(normalized.split())
+
+
+def shingle(text: str, size: int) -> Set[str]:
+    """Split normalized text into overlapping word shingles.
+
+    Args:
+        text: Normalized text
+        size: Number of words per shingle
+
+    Returns:
+        The set of shingles, or the single shingle for texts shorter than size
+    """
+    words = text.split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHashLSH:
+    """In-memory MinHash signatures with banded locality-sensitive hashing.
+
+    Signatures are cached by content hash, so re-indexing unchanged tickets on
+    every triage run costs a dictionary lookup instead of a rehash. Texts with
+    fewer than min_shingles shingles are too short for a reliable estimate, as
+    e.g. all empty texts share one signature, and never match.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        min_shingles: int = 1,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            num_perm: Number of hash permutations per signature
+            bands: Number of LSH bands; must evenly divide num_perm
+            shingle_size: Number of words per shingle
+            min_shingles: Number of shingles a text needs to match others
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.min_shingles = max(min_shingles, 1)
+        rng = random.Random(_PERMUTATION_SEED)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._signatures: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+        # Indexed keys whose text is too short to match, kept out of the buckets
+        self._too_short: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _shingle_hashes(self, text: str) -> List[int]:
+        return [
+            int.from_bytes(
+                hashlib.blake2b(s.encode(), digest_size=8).digest(), "little"
+            )
+            for s in shingle(normalize_ticket_text(text), self.shingle_size)
+        ]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a ticket text.
+
+        Args:
+            text: Raw ticket text
+
+        Returns:
+            Tuple of num_perm minimum hash values
+        """
+        return self._signature(self._shingle_hashes(text))
+
+    def _signature(self, hashes: List[int]) -> Tuple[int, ...]:
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._permutations
+        )
+
+    def upsert(self, key: str, text: str) -> None:
+        """Add or refresh a ticket in the index.
+
+        Args:
+            key: The ticket key
+            text: Raw ticket text
+        """
+        digest = hashlib.sha1(text.encode()).hexdigest()
+        if (cached := self._signatures.get(key)) and cached[0] == digest:
+            return
+        if cached:
+            self.remove(key)
+        hashes = self._shingle_hashes(text)
+        signature = self._signature(hashes)
+        self._signatures[key] = (digest, signature)
+        if len(hashes) < self.min_shingles:
+            self._too_short.add(key)
+            return
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            bucket[band].add(key)
+
+    def remove(self, key: str) -> None:
+        """Remove a ticket from the index if present.
+
+        Args:
+            key: The ticket key
+        """
+        if not (cached := self._signatures.pop(key, None)):
+            return
+        if key in self._too_short:
+            self._too_short.discard(key)
+            return
+        for band, bucket in zip(self._band_keys(cached[1]), self._buckets):
+            bucket[band].discard(key)
+            if not bucket[band]:
+                del bucket[band]
+
+    def query(
+        self, text: str, exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """Find indexed tickets that share at least one LSH band with the text.
+
+        Args:
+            text: Raw ticket text to look up
+            exclude: Optional ticket key to leave out, typically the query ticket
+
+        Returns:
+            Candidate keys with their estimated Jaccard similarity, best first;
+            empty if the text is too short to match
+        """
+        hashes = self._shingle_hashes(text)
+        if len(hashes) < self.min_shingles:
+            return []
+        return self._match(self._signature(hashes), exclude)
+
+    def neighbours(self, key: str) -> List[Tuple[str, float]]:
+        """Find near-duplicates of an already indexed ticket.
+
+        Reuses the cached signature, so the lookup only touches the LSH buckets.
+
+        Args:
+            key: Key of an indexed ticket
+
+        Returns:
+            Candidate keys with their estimated Jaccard similarity, best first;
+            empty if the ticket is not indexed or too short to match
+        """
+        if key not in self._signatures or key in self._too_short:
+            return []
+        return self._match(self._signatures[key][1], key)
+
+    def prune(self, keys: Set[str]) -> None:
+        """Drop indexed tickets that are not in the given key set.
+
+        Args:
+            keys: Keys of tickets that still exist
+        """
+        for key in set(self._signatures) - keys:
+            self.remove(key)
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimate Jaccard similarity from two MinHash signatures."""
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+    def _match(
+        self, signature: Tuple[int, ...], exclude: Optional[str]
+    ) -> List[Tuple[str, float]]:
+        candidates: Set[str] = set()
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+        candidates.discard(exclude or "")
+        matches = [
+            (key, self.similarity(signature, self._signatures[key][1]))
+            for key in candidates
+        ]
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows]
+            for band in range(self.bands)
+        ]
@@ -0,0 +1,239 @@
+"""Persistent exact-match cache for LLM responses.
+
+With temperature 0, a prompt that is fully determined by ticket text gets the
+same answer every time, so re-triaging a ticket or restarting the service
+should not pay for it again. Entries are keyed by a hash of the serialized
+model with its parameters and the serialized prompt.
+"""
+import hashlib
+import threading
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from logger import logger
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Engine,
+    MetaData,
+    String,
+    Table,
+    Text,
+    create_engine,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+
+from ..config.settings import settings
+
+metadata = MetaData()
+
+llm_cache_table = Table(
+    "llm_cache",
+    metadata,
+    Column("key", String(64), primary_key=True),
+    Column("call_site", String(64), nullable=False),
+    Column("response", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False, index=True),
+    Column("last_used_at", DateTime(timezone=True), nullable=False, index=True),
+)
+
+
+class CacheStats:
+    """Thread-safe hit and miss counters per call site."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, call_site: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(call_site, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Get hits, misses and hit ratio per call site."""
+        with self._lock:
+            return {
+                call_site: {
+                    **counts,
+                    "hit_ratio": round(
+                        counts["hits"] / max(counts["hits"] + counts["misses"], 1), 3
+                    ),
+                }
+                for call_site, counts in self._counts.items()
+            }
+
+
+cache_stats = CacheStats()
+
+
+@lru_cache()
+def get_cache_engine() -> Engine:
+    """Get the engine storing the cache.
+
+    Without LLM__CACHE_DATABASE_URL the application database is used, whose
+    llm_cache table is created by the migrations. A dedicated cache database
+    is outside the migrations, so its table is created here if needed.
+
+    Returns:
+        SQLAlchemy engine
+    """
+    if not settings.llm.cache_database_url:
+        from database import engine
+
+        return engine
+    engine = create_engine(settings.llm.cache_database_url)
+    metadata.create_all(engine)
+    return engine
+
+
+class SQLAlchemyLLMCache(BaseCache):
+    """LangChain cache backed by a database table, tagged with a call site.
+
+    Entries older than the maximum age are evicted, and beyond the maximum
+    number of entries the least recently used ones are. Eviction runs every
+    eviction_interval writes rather than on every write.
+    """
+
+    def __init__(
+        self,
+        call_site: str,
+        max_entries: int,
+        max_age: timedelta,
+        eviction_interval: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            call_site: Name of the code path using the cache, for metrics
+            max_entries: Maximum number of cached responses
+            max_age: Maximum age of a cached response
+            eviction_interval: Number of writes between eviction runs
+        """
+        self.call_site = call_site
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.eviction_interval = eviction_interval
+        self._writes = 0
+
+    @property
+    def engine(self) -> Engine:
+        # Resolved on first use, so building an LLM never opens a connection
+        return get_cache_engine()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Get the cached generations of a prompt, if present and not expired."""
+        key = self._key(prompt, llm_string)
+        now = datetime.now(UTC)
+        try:
+            with self.engine.begin() as connection:
+                response = connection.scalar(
+                    select(llm_cache_table.c.response).where(
+                        llm_cache_table.c.key == key,
+                        llm_cache_table.c.created_at >= now - self.max_age,
+                    )
+                )
+                if response is not None:
+                    connection.execute(
+                        update(llm_cache_table)
+                        .where(llm_cache_table.c.key == key)
+                        .values(last_used_at=now)
+                    )
+        except Exception as e:
+            logger.error(f"Error reading LLM cache: {e}", exc_info=True)
+            response = None
+
+        cache_stats.record(self.call_site, hit=response is not None)
+        logger.debug(
+            f"LLM cache {'hit' if response is not None else 'miss'} "
+            f"for {self.call_site}"
+        )
+        return loads(response) if response is not None else None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store the generations of a prompt."""
+        key = self._key(prompt, llm_string)
+        now = datetime.now(UTC)
+        values = {"response": dumps(return_val), "created_at": now, "last_used_at": now}
+        try:
+            with self.engine.begin() as connection:
+                updated = connection.execute(
+                    update(llm_cache_table)
+                    .where(llm_cache_table.c.key == key)
+                    .values(**values)
+                )
+                if not updated.rowcount:
+                    connection.execute(
+                        insert(llm_cache_table).values(
+                            key=key, call_site=self.call_site, **values
+                        )
+                    )
+        except Exception as e:
+            # A concurrent writer may have inserted the same key first
+            logger.warning(f"Error writing LLM cache: {e}")
+            return
+
+        self._writes += 1
+        if self._writes % self.eviction_interval == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove expired entries and the least recently used beyond the size limit."""
+        try:
+            with self.engine.begin() as connection:
+                expired = connection.execute(
+                    delete(llm_cache_table).where(
+                        llm_cache_table.c.created_at < datetime.now(UTC) - self.max_age
+                    )
+                ).rowcount
+                excess = (
+                    connection.scalar(select(func.count()).select_from(llm_cache_table))
+                    - self.max_entries
+                )
+                if excess > 0:
+                    oldest = (
+                        select(llm_cache_table.c.key)
+                        .order_by(llm_cache_table.c.last_used_at)
+                        .limit(excess)
+                    )
+                    connection.execute(
+                        delete(llm_cache_table).where(
+                            llm_cache_table.c.key.in_(oldest.scalar_subquery())
+                        )
+                    )
+            logger.info(
+                f"Evicted {expired} expired and {max(excess, 0)} "
+                f"least recently used LLM cache entries"
+            )
+        except Exception as e:
+            logger.error(f"Error evicting LLM cache: {e}", exc_info=True)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove all entries of this call site."""
+        with self.engine.begin() as connection:
+            connection.execute(
+                delete(llm_cache_table).where(
+                    llm_cache_table.c.call_site == self.call_site
+                )
+            )
+
+
+def create_llm_cache(call_site: str) -> SQLAlchemyLLMCache:
+    """Create a cache for a call site as configured by the LLM settings."""
+    return SQLAlchemyLLMCache(
+        call_site=call_site,
+        max_entries=settings.llm.cache_max_entries,
+        max_age=timedelta(days=settings.llm.cache_max_age_days),
+        eviction_interval=settings.llm.cache_eviction_interval,
+    )
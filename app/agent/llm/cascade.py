@@ -0,0 +1,110 @@
+"""Confidence-based model cascade for yes/no judgements."""
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
+from logger import logger
+
+RESULT_PATTERN = re.compile(r"<result>\s*(True|False)\s*</result>", re.IGNORECASE)
+
+
+@dataclass
+class Verdict:
+    """Answer of one cascade tier."""
+
+    result: bool
+    confidence: float
+    tier: str
+
+
+def answer_confidence(message: BaseMessage, answer: str) -> float:
+    """Get the probability the model assigned to its answer token.
+
+    Args:
+        message: Model response requested with logprobs enabled
+        answer: The parsed answer, "True" or "False"
+
+    Returns:
+        Probability between 0 and 1, or 0 if the response has no logprobs
+    """
+    logprobs = (message.response_metadata.get("logprobs") or {}).get("content") or []
+    for token in logprobs:
+        text = token.get("token", "").strip()
+        # The answer may be split into several tokens, its first one decides it
+        if text and answer.lower().startswith(text.lower()):
+            return math.exp(token["logprob"])
+    return 0.0
+
+
+class ModelCascade:
+    """Ask models from small to large until one is confident enough.
+
+    Every tier but the last only answers if the probability of its answer
+    token reaches the threshold; otherwise the question escalates to the next
+    tier. The last tier always answers, and an escalated question it fails to
+    answer is left undecided rather than falling back to a low-confidence
+    answer of a smaller tier.
+    """
+
+    def __init__(
+        self,
+        prompt: ChatPromptTemplate,
+        tiers: List[Tuple[str, BaseChatModel]],
+        confidence_threshold: float,
+    ) -> None:
+        """Initialize the cascade.
+
+        Args:
+            prompt: Prompt asking for a <result>True</result> or
+                <result>False</result> answer
+            tiers: Tier names and models, ordered from small to large
+            confidence_threshold: Minimum answer probability to stop at a tier
+        """
+        self.prompt = prompt
+        self.tiers = [(name, model.bind(logprobs=True)) for name, model in tiers]
+        self.confidence_threshold = confidence_threshold
+        self.counts: Dict[str, int] = {name: 0 for name, _ in tiers}
+        self.counts["escalated"] = 0
+
+    async def judge(self, **prompt_values: Any) -> Optional[Verdict]:
+        """Answer the prompt with the smallest sufficiently confident tier.
+
+        Args:
+            **prompt_values: Values for the prompt variables
+
+        Returns:
+            The accepted verdict, or None if the last tier gave no parsable answer
+        """
+        messages = self.prompt.format_prompt(**prompt_values)
+        verdict = None
+        for index, (name, model) in enumerate(self.tiers):
+            if index:
+                self.counts["escalated"] += 1
+            # An unparsable answer of this tier must not leave the verdict of
+            # the previous one in place
+            verdict = None
+            response = await model.ainvoke(messages)
+            if match := RESULT_PATTERN.search(str(response.content)):
+                answer = match.group(1).capitalize()
+                verdict = Verdict(
+                    result=answer == "True",
+                    confidence=answer_confidence(response, answer),
+                    tier=name,
+                )
+                logger.debug(
+                    f"Tier {name} answered {answer} "
+                    f"with confidence {verdict.confidence:.3f}"
+                )
+                if verdict.confidence >= self.confidence_threshold:
+                    break
+        if verdict:
+            self.counts[verdict.tier] += 1
+        return verdict
+
+    def log_counts(self) -> None:
+        """Log how many judgements each tier has answered so far."""
+        logger.info(f"Model cascade tier counts: {self.counts}")
@@ -1,10 +1,45 @@
 """LLM model configurations and factory functions."""
 from functools import lru_cache
-from typing import Optional
+from typing import Any, AsyncIterator, List, Optional
 
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
 from langchain_openai import ChatOpenAI
 
 from ..config.settings import settings
+from ..core.callbacks import tracing_handler
+from ..core.lanes import llm_scheduler
+from ..core.telemetry import telemetry_handler
+from .cache import create_llm_cache
+
+
+class LaneScheduledChatOpenAI(ChatOpenAI):
+    """ChatOpenAI holding a slot of the current lane during each API call.
+
+    Responses served from the cache do not take a slot.
+    """
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        async with llm_scheduler.slot():
+            return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        async with llm_scheduler.slot():
+            async for chunk in super()._astream(messages, stop, run_manager, **kwargs):
+                yield chunk
 
 
 @lru_cache()
@@ -12,23 +47,34 @@ def get_llm(
     model_name: Optional[str] = None,
     temperature: Optional[float] = None,
     max_tokens: Optional[int] = None,
+    call_site: Optional[str] = None,
 ) -> ChatOpenAI:
     """Get a configured LLM instance.
 
+    Call sites whose prompts are fully determined by their input can pass a
+    call_site name to reuse persisted responses. The cache only applies at
+    temperature 0, where responses are deterministic.
+
     Args:
         model_name: Optional model name override
         temperature: Optional temperature override
         max_tokens: Optional max tokens override
+        call_site: Optional name of the calling code path, enabling the cache
 
     Returns:
         Configured ChatOpenAI instance
     """
-    return ChatOpenAI(
+    temperature = temperature if temperature is not None else settings.llm.temperature
+    cache = None
+    if call_site and settings.llm.cache_enabled and temperature == 0:
+        cache = create_llm_cache(call_site)
+    return LaneScheduledChatOpenAI(
         model_name=model_name or settings.llm.llm_model_name,
-        temperature=temperature
-        if temperature is not None
-        else settings.llm.temperature,
+        temperature=temperature,
+        cache=cache,
+        callbacks=[telemetry_handler, tracing_handler],
         max_tokens=max_tokens or settings.llm.max_tokens,
+        request_timeout=settings.agent.llm_timeout_seconds,
         top_p=settings.llm.top_p,
         frequency_penalty=settings.llm.frequency_penalty,
         presence_penalty=settings.llm.presence_penalty,
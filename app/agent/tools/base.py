@@ -1,9 +1,14 @@
 """Base classes for agent tools."""
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Optional
 
 from langchain.tools import BaseTool
 from logger import logger
+from tracing import span
+
+from ..core.callbacks import tracing_handler
+from ..core.telemetry import record_tool_time
 
 
 class AgentTool(BaseTool, ABC):
@@ -85,11 +90,23 @@ class AgentTool(BaseTool, ABC):
         Raises:
             Exception: If tool execution fails
         """
+        # The executor passes its callback manager, whose parent run is the
+        # agent iteration calling the tool
+        callbacks = kwargs.get("callbacks")
+        parent = tracing_handler.span_for_run(getattr(callbacks, "parent_run_id", None))
+        started_at = time.perf_counter()
         try:
-            self._before_run(*args, **kwargs)
-            result = await self._arun(*args, **kwargs)
-            self._after_run(result)
-            return result
+            with span(
+                f"tool.{self.name}",
+                parent=parent,
+                attributes={"tool.name": self.name},
+            ):
+                self._before_run(*args, **kwargs)
+                result = await self._arun(*args, **kwargs)
+                self._after_run(result)
+                return result
         except Exception as e:
             self._on_error(e)
             raise
+        finally:
+            record_tool_time(self.name, time.perf_counter() - started_at)
@@ -0,0 +1,78 @@
+"""Compact, paginated representations of tool results for the LLM."""
+import base64
+import json
+from typing import Any, Dict, List, Tuple
+
+SUMMARY_MAX_CHARS = 120
+CHARS_PER_TOKEN = 4  # Rough average for English text with the OpenAI tokenizers
+
+
+def estimate_tokens(value: Any) -> int:
+    """Estimate how many tokens a tool result adds to the agent scratchpad."""
+    return len(json.dumps(value, default=str)) // CHARS_PER_TOKEN + 1
+
+
+def encode_cursor(jql: str, start: int) -> str:
+    """Encode the position of the next page as an opaque cursor."""
+    payload = json.dumps({"jql": jql, "start": start}).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: The opaque cursor string
+
+    Returns:
+        The JQL query and the index of the first issue of the page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(payload["jql"]), int(payload["start"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def compact_issue(issue: Dict[str, Any]) -> Dict[str, str]:
+    """Reduce a Jira issue to its key, summary and status."""
+    fields = issue.get("fields", {})
+    summary = str(fields.get("summary") or "")
+    if len(summary) > SUMMARY_MAX_CHARS:
+        summary = f"{summary[:SUMMARY_MAX_CHARS]}..."
+    return {
+        "key": issue["key"],
+        "summary": summary,
+        "status": (fields.get("status") or {}).get("name", ""),
+    }
+
+
+def compact_issue_page(
+    issues: List[Dict[str, Any]], total: int, start: int, jql: str, token_cap: int
+) -> Dict[str, Any]:
+    """Build an LLM-facing page of search results within a token budget.
+
+    Args:
+        issues: Issues returned by the Jira search
+        total: Total number of issues matching the query
+        start: Index of the first issue of the page
+        jql: The executed JQL query, used for the next-page cursor
+        token_cap: Maximum estimated tokens of the returned result
+
+    Returns:
+        Totals, compact rows and, if more issues match, a cursor for the next page
+    """
+    page: Dict[str, Any] = {"total": total, "start": start, "rows": []}
+    for issue in issues:
+        page["rows"].append(compact_issue(issue))
+        if estimate_tokens(page) > token_cap and len(page["rows"]) > 1:
+            page["rows"].pop()
+            break
+
+    next_start = start + len(page["rows"])
+    if next_start < total:
+        page["next_cursor"] = encode_cursor(jql, next_start)
+    return page
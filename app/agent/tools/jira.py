@@ -1,24 +1,138 @@
 """Jira-specific tools for the agent."""
-from typing import Any, Dict, Optional, Tuple
+import asyncio
+import re
+import time
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from atlassian import Jira
+from langchain_core.pydantic_v1 import BaseModel, Field, PrivateAttr
 from logger import logger
+from tracing import span
 
 from ..config.settings import settings
+from ..core.deadline import call_timeout
+from ..core.lanes import jira_scheduler
+from ..core.telemetry import record_jira_time
 from .base import AgentTool
+from .compactor import compact_issue_page, decode_cursor
+from .links import link_ledger
+from .ratelimit import AsyncRateLimiter
+
+ORDER_BY_PATTERN = re.compile(r"\s*\bORDER\s+BY\b.*$", re.IGNORECASE | re.DOTALL)
+UNASSIGNED = "Unassigned"
+BULK_PAGE_SIZE = 100
+LINK_TYPE = "Relates"
+TOOL_DESCRIPTION = """Tool for managing Jira tickets. Pick one operation:
+- search_tickets: one page of the tickets matching `jql`
+- next_page: the page after a previous result, given its `next_cursor` as `cursor`
+- count_tickets: the number of tickets matching `jql`, without fetching them
+- group_counts: ticket counts matching `jql` per `group_by` status, assignee or priority
+- transition_tickets: move all tickets matching `jql` to `target_status`
+- get_all_tickets: the first page of all project tickets
+- get_ticket_data: the details of `ticket_number`
+- get_projects: the available projects
+- link_tickets: link `from_issue` to `to_issue`
+- add_comment: add `comment` to `issue_key`"""
+
+
+def ticket_text(issue: Dict[str, Any]) -> str:
+    """Build the text of a ticket seen by triage, linking and embeddings.
+
+    Every path reading tickets goes through this function, so the same ticket
+    always hashes to the same content.
+
+    Args:
+        issue: A Jira issue with at least its summary and description fields
+
+    Returns:
+        The summary and the description, one per line
+    """
+    fields = issue["fields"]
+    return f"{fields['summary']}\n{fields.get('description') or ''}"
+
+
+class JiraToolInput(BaseModel):
+    """Arguments of the jira_ticket tool."""
+
+    operation: Literal[
+        "search_tickets",
+        "next_page",
+        "count_tickets",
+        "group_counts",
+        "transition_tickets",
+        "get_all_tickets",
+        "get_ticket_data",
+        "get_projects",
+        "link_tickets",
+        "add_comment",
+    ] = Field(description="The Jira operation to run")
+    jql: Optional[str] = Field(default=None, description="JQL query")
+    group_by: Optional[Literal["status", "assignee", "priority"]] = Field(
+        default=None, description="Field the tickets are counted by, for group_counts"
+    )
+    target_status: Optional[str] = Field(
+        default=None, description="Status name, for transition_tickets"
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="next_cursor of a previous page, for next_page"
+    )
+    ticket_number: Optional[str] = Field(
+        default=None, description="Ticket key, for get_ticket_data"
+    )
+    from_issue: Optional[str] = Field(
+        default=None, description="Ticket key linked from, for link_tickets"
+    )
+    to_issue: Optional[str] = Field(
+        default=None, description="Ticket key linked to, for link_tickets"
+    )
+    issue_key: Optional[str] = Field(
+        default=None, description="Ticket key commented on, for add_comment"
+    )
+    comment: Optional[str] = Field(
+        default=None, description="Comment text, for add_comment"
+    )
+
+
+@lru_cache()
+def get_jira_rate_limiter() -> AsyncRateLimiter:
+    """Get the rate limiter shared by all Jira tool instances.
+
+    Returns:
+        Configured AsyncRateLimiter instance
+    """
+    return AsyncRateLimiter(
+        settings.agent.jira_requests_per_second, settings.agent.jira_rate_limit_burst
+    )
 
 
 class JiraTicketTool(AgentTool):
     """Tool for interacting with Jira tickets."""
 
     jira: Jira = None
-    _project_info: Dict[str, Any] | None = None  # Cache for project information
+    args_schema: Type[BaseModel] = JiraToolInput
+    _project_info: Dict[str, Any] | None = PrivateAttr(default=None)  # Project cache
+    group_values: Dict[str, Dict[str, str]] = Field(default_factory=dict, exclude=True)
+    transition_ids: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict, exclude=True
+    )  # Cache of target status to transition id per workflow state
 
     def __init__(self) -> None:
         """Initialize the Jira ticket tool."""
         super().__init__(
             name="jira_ticket",
-            description="Tool for managing Jira tickets",
+            description=TOOL_DESCRIPTION,
             verbose=settings.agent.verbose,
         )
         self.jira = Jira(
@@ -26,6 +140,7 @@ class JiraTicketTool(AgentTool):
             username=settings.jira_username,
             password=settings.jira_api_token,
             cloud=True,
+            timeout=settings.agent.jira_timeout_seconds,
         )
 
     async def get_project_info(self, refresh: bool = False) -> Dict[str, Any]:
@@ -40,7 +155,7 @@ class JiraTicketTool(AgentTool):
         if self._project_info is None or refresh:
             try:
                 logger.debug(f"Fetching project info for key: {settings.project_key}")
-                projects = self.jira.projects()
+                projects = await self._call(self.jira.projects)
                 for project in projects:
                     if project["key"] == settings.project_key:
                         self._project_info = {
@@ -62,6 +177,41 @@ class JiraTicketTool(AgentTool):
 
         return self._project_info
 
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking Jira client call in a worker thread.
+
+        Calls take a slot of the current lane and are spaced out by the shared
+        Jira rate limiter. The time spent, including any wait for the slot and
+        the limiter, counts towards the Jira time of the current request. No
+        call starts once the request deadline has passed, so a timed out
+        request stops changing tickets.
+
+        Args:
+            method: The Jira client method to call
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's result
+
+        Raises:
+            DeadlineExceededError: If the request deadline has passed
+            TimeoutError: If the call did not finish within its timeout
+        """
+        timeout = call_timeout(settings.agent.jira_timeout_seconds)
+        started_at = time.perf_counter()
+        try:
+            with span(
+                f"jira.{method.__name__}",
+                kind="client",
+                attributes={"jira.url": settings.jira_instance_url},
+            ):
+                async with asyncio.timeout(timeout), jira_scheduler.slot():
+                    await get_jira_rate_limiter().acquire()
+                    return await asyncio.to_thread(method, *args, **kwargs)
+        finally:
+            record_jira_time(time.perf_counter() - started_at)
+
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         """Run the tool synchronously.
 
@@ -78,7 +228,7 @@ class JiraTicketTool(AgentTool):
         """
         try:
             logger.debug("Fetching all projects from Jira")
-            projects = self.jira.projects()
+            projects = await self._call(self.jira.projects)
             result = {project["key"]: project["name"] for project in projects}
             logger.debug(f"Found {len(result)} projects: {result}")
             return result
@@ -99,13 +249,8 @@ class JiraTicketTool(AgentTool):
 
             logger.debug(f"Fetching all tickets for project: {project_info['key']}")
             jql = f"project = {project_info['key']}"
-            issues = self.jira.jql(jql)["issues"]
-            result = {
-                issue[
-                    "key"
-                ]: f"{issue['fields']['summary']}\n{issue['fields'].get('description', '')}"
-                for issue in issues
-            }
+            issues = (await self._call(self.jira.jql, jql))["issues"]
+            result = {issue["key"]: ticket_text(issue) for issue in issues}
             logger.debug(f"Found {len(result)} tickets")
             return result
         except Exception as e:
@@ -125,10 +270,10 @@ class JiraTicketTool(AgentTool):
         """
         try:
             logger.debug(f"Fetching data for ticket: {ticket_number}")
-            issue = self.jira.issue(ticket_number)
+            issue = await self._call(self.jira.issue, ticket_number)
             result = (
                 issue["key"],
-                f"{issue['fields']['summary']}\n{issue['fields'].get('description', '')}",
+                ticket_text(issue),
             )
             logger.debug(f"Retrieved ticket data: {result[0]}")
             return result
@@ -136,22 +281,70 @@ class JiraTicketTool(AgentTool):
             logger.error(f"Error getting ticket data: {e}", exc_info=True)
             return None, None
 
+    async def get_linked_tickets(self, issue_key: str) -> Set[str]:
+        """Get the keys of all tickets linked to a ticket.
+
+        The links are also recorded in the shared link ledger.
+
+        Args:
+            issue_key: The ticket key
+
+        Returns:
+            Keys of linked tickets, in either direction
+        """
+        try:
+            logger.debug(f"Fetching links of issue: {issue_key}")
+            issue = await self._call(self.jira.issue, issue_key, fields="issuelinks")
+            linked = {
+                link[direction]["key"]
+                for link in issue["fields"].get("issuelinks") or []
+                for direction in ("inwardIssue", "outwardIssue")
+                if direction in link
+            }
+            link_ledger.record(issue_key, linked)
+            logger.debug(f"Issue {issue_key} has {len(linked)} linked issues")
+            return linked
+        except Exception as e:
+            logger.error(f"Error getting issue links: {e}", exc_info=True)
+            return set()
+
     async def link_tickets(self, from_issue: str, to_issue: str) -> bool:
         """Link two Jira tickets.
 
+        Pairs that are already linked, in either direction, or that another
+        job is linking at the same time are not written again. As other
+        worker processes may have linked the pair, the links of from_issue are
+        read from Jira right before writing.
+
         Args:
             from_issue: The source ticket key
             to_issue: The target ticket key
 
         Returns:
-            True if successful, False otherwise
+            True if the tickets are linked, False otherwise
         """
+        if not link_ledger.claim(from_issue, to_issue):
+            logger.debug(f"Issues already linked: {from_issue} -> {to_issue}")
+            return True
         try:
+            if to_issue in await self.get_linked_tickets(from_issue):
+                logger.debug(f"Issues linked in Jira: {from_issue} -> {to_issue}")
+                link_ledger.confirm(from_issue, to_issue)
+                return True
             logger.debug(f"Linking issues: {from_issue} -> {to_issue}")
-            self.jira.create_issue_link("Relates", from_issue, to_issue)
+            await self._call(
+                self.jira.create_issue_link,
+                {
+                    "type": {"name": LINK_TYPE},
+                    "inwardIssue": {"key": from_issue},
+                    "outwardIssue": {"key": to_issue},
+                },
+            )
+            link_ledger.confirm(from_issue, to_issue)
             logger.info(f"Successfully linked issues: {from_issue} -> {to_issue}")
             return True
         except Exception as e:
+            link_ledger.release(from_issue, to_issue)
             logger.error(f"Error linking issues: {e}", exc_info=True)
             return False
 
@@ -167,13 +360,67 @@ class JiraTicketTool(AgentTool):
         """
         try:
             logger.debug(f"Adding comment to issue {issue_key}: {comment}")
-            self.jira.add_comment(issue_key, comment)
+            await self._call(self.jira.add_comment, issue_key, comment)
             logger.info(f"Successfully added comment to issue {issue_key}")
             return True
         except Exception as e:
             logger.error(f"Error adding comment: {e}", exc_info=True)
             return False
 
+    async def _scope_jql(self, jql: str) -> Optional[str]:
+        """Restrict a JQL query to the configured project.
+
+        Args:
+            jql: The JQL query string
+
+        Returns:
+            The scoped JQL query, or None if the project is unknown
+        """
+        project_info = await self.get_project_info()
+        if not project_info:
+            return None
+
+        # Replace project name with key in JQL if needed
+        if f"project = {project_info['name']}" in jql:
+            return jql.replace(
+                f"project = {project_info['name']}",
+                f"project = {project_info['key']}",
+            )
+        if not jql.strip():
+            return f"project = {project_info['key']}"
+        if "project =" not in jql:
+            # Add project filter if not specified
+            if jql.lstrip().upper().startswith("ORDER BY"):
+                return f"project = {project_info['key']} {jql}"
+            return f"project = {project_info['key']} AND {jql}"
+        return jql
+
+    async def iter_issue_pages(
+        self, jql: str, fields: str
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream every issue matching a JQL query, one page at a time.
+
+        Args:
+            jql: The JQL query string, scoped to the configured project
+            fields: Comma-separated issue fields to fetch
+
+        Yields:
+            Pages of raw issues
+        """
+        if not (jql := await self._scope_jql(jql)):
+            return
+        start = 0
+        while True:
+            response = await self._call(
+                self.jira.jql, jql, fields=fields, start=start, limit=BULK_PAGE_SIZE
+            )
+            if not response["issues"]:
+                return
+            yield response["issues"]
+            start += len(response["issues"])
+            if start >= response["total"]:
+                return
+
     async def search_tickets(self, jql: str) -> Dict[str, str]:
         """Search for tickets using JQL.
 
@@ -184,28 +431,12 @@ class JiraTicketTool(AgentTool):
             A dictionary mapping ticket keys to their descriptions
         """
         try:
-            project_info = await self.get_project_info()
-            if not project_info:
+            if not (jql := await self._scope_jql(jql)):
                 return {}
 
-            # Replace project name with key in JQL if needed
-            if f"project = {project_info['name']}" in jql:
-                jql = jql.replace(
-                    f"project = {project_info['name']}",
-                    f"project = {project_info['key']}",
-                )
-            elif "project =" not in jql:
-                # Add project filter if not specified
-                jql = f"project = {project_info['key']} AND {jql}"
-
             logger.debug(f"Searching tickets with JQL: {jql}")
-            issues = self.jira.jql(jql)["issues"]
-            result = {
-                issue[
-                    "key"
-                ]: f"{issue['fields']['summary']}\n{issue['fields'].get('description', '')}"
-                for issue in issues
-            }
+            issues = (await self._call(self.jira.jql, jql))["issues"]
+            result = {issue["key"]: ticket_text(issue) for issue in issues}
             logger.debug(f"Found {len(result)} tickets")
             return result
         except Exception as e:
@@ -216,51 +447,315 @@ class JiraTicketTool(AgentTool):
             logger.error(f"Error searching tickets: {e}", exc_info=True)
             return {}
 
+    async def search_page(self, jql: str, start: int = 0) -> Dict[str, Any]:
+        """Search for tickets and return one compact page for the agent.
+
+        Unlike search_tickets, this never hands full descriptions to the LLM:
+        the result holds the total, key/summary/status rows within the
+        configured token cap, and a cursor for the next page.
+
+        Args:
+            jql: The JQL query string
+            start: Index of the first issue of the page
+
+        Returns:
+            The compact page, or an empty dictionary if the search fails
+        """
+        try:
+            if not (jql := await self._scope_jql(jql)):
+                return {}
+
+            logger.debug(f"Searching ticket page at {start} with JQL: {jql}")
+            response = await self._call(
+                self.jira.jql,
+                jql,
+                fields="summary,status",
+                start=start,
+                limit=settings.agent.tool_page_size,
+            )
+            page = compact_issue_page(
+                response["issues"],
+                response["total"],
+                start,
+                jql,
+                settings.agent.tool_result_token_cap,
+            )
+            logger.debug(f"Returning {len(page['rows'])} of {page['total']} tickets")
+            return page
+        except Exception as e:
+            logger.error(f"Error searching ticket page: {e}", exc_info=True)
+            return {}
+
+    async def count_tickets(self, jql: str = "") -> Dict[str, Any]:
+        """Count the tickets matching a JQL query without fetching them.
+
+        Args:
+            jql: Optional JQL query; all project tickets are counted if empty
+
+        Returns:
+            The executed JQL and the number of matching tickets, or an empty
+            dictionary if the count fails
+        """
+        try:
+            if not (jql := await self._scope_jql(jql)):
+                return {}
+            return {"jql": jql, "total": await self._count(jql)}
+        except Exception as e:
+            logger.error(f"Error counting tickets: {e}", exc_info=True)
+            return {}
+
+    async def group_counts(self, group_by: str, jql: str = "") -> Dict[str, Any]:
+        """Count the tickets matching a JQL query per status, assignee or priority.
+
+        One count query per group value is issued concurrently, bounded by
+        the configured Jira concurrency.
+
+        Args:
+            group_by: One of status, assignee or priority
+            jql: Optional JQL query; all project tickets are counted if empty
+
+        Returns:
+            The executed JQL, the non-empty group counts and their total, or an
+            empty dictionary if counting fails
+        """
+        try:
+            if not (jql := await self._scope_jql(jql)):
+                return {}
+            base_jql = ORDER_BY_PATTERN.sub("", jql)
+            clauses = await self._group_clauses(group_by)
+            semaphore = asyncio.Semaphore(settings.agent.jira_max_concurrency)
+
+            async def count_group(clause: str) -> int:
+                async with semaphore:
+                    return await self._count(f"({base_jql}) AND {clause}")
+
+            logger.debug(f"Counting {len(clauses)} {group_by} groups for: {base_jql}")
+            totals = await asyncio.gather(*(count_group(c) for c in clauses.values()))
+            counts = {name: total for name, total in zip(clauses, totals) if total > 0}
+            return {
+                "jql": base_jql,
+                "group_by": group_by,
+                "counts": counts,
+                "total": sum(counts.values()),
+            }
+        except Exception as e:
+            logger.error(f"Error counting ticket groups: {e}", exc_info=True)
+            return {}
+
+    async def _count(self, jql: str) -> int:
+        """Read the match count of a search that returns no issues."""
+        response = await self._call(self.jira.jql, jql, fields="key", limit=0)
+        return int(response["total"])
+
+    async def _group_clauses(self, group_by: str) -> Dict[str, str]:
+        """Get the JQL clause selecting each value of a grouping field.
+
+        The possible values are fetched once per field and cached.
+
+        Args:
+            group_by: One of status, assignee or priority
+
+        Returns:
+            Group names mapped to the JQL clause selecting them
+
+        Raises:
+            ValueError: If the grouping field is not supported
+        """
+        if group_by in self.group_values:
+            return self.group_values[group_by]
+
+        if group_by == "status":
+            statuses = await self._call(self.jira.get_all_statuses)
+            clauses = {s["name"]: f'status = "{s["name"]}"' for s in statuses}
+        elif group_by == "priority":
+            priorities = await self._call(self.jira.get_all_priorities)
+            clauses = {p["name"]: f'priority = "{p["name"]}"' for p in priorities}
+        elif group_by == "assignee":
+            project_info = await self.get_project_info()
+            users: List[Dict[str, Any]] = await self._call(
+                self.jira.get_all_assignable_users_for_project,
+                project_info["key"],
+                limit=1000,
+            )
+            clauses = {
+                u["displayName"]: f'assignee = "{u["accountId"]}"' for u in users
+            }
+            clauses[UNASSIGNED] = "assignee is EMPTY"
+        else:
+            raise ValueError(f"Unsupported group_by: {group_by}")
+
+        self.group_values[group_by] = clauses
+        return clauses
+
+    async def transition_tickets(self, jql: str, target_status: str) -> Dict[str, Any]:
+        """Move all tickets matching a JQL query to a target status.
+
+        Transition ids are resolved once per workflow state (project, issue
+        type and current status) and cached. Transitions are then applied
+        concurrently, bounded by the Jira concurrency and rate limit.
+
+        Args:
+            jql: The JQL query selecting the tickets
+            target_status: Name of the status to move the tickets to
+
+        Returns:
+            Per-outcome counts and the result for every ticket, or an empty
+            dictionary if the tickets cannot be fetched
+        """
+        try:
+            if not (jql := await self._scope_jql(jql)):
+                return {}
+            issues = [
+                issue
+                async for page in self.iter_issue_pages(jql, "status,issuetype,project")
+                for issue in page
+            ]
+        except Exception as e:
+            logger.error(f"Error fetching tickets to transition: {e}", exc_info=True)
+            return {}
+
+        target = target_status.lower()
+        pending = [i for i in issues if i["fields"]["status"]["name"].lower() != target]
+        pending_keys = {i["key"] for i in pending}
+        results = {
+            i["key"]: "already in status"
+            for i in issues
+            if i["key"] not in pending_keys
+        }
+
+        workflow_states = {self._workflow_state(i): i["key"] for i in pending}
+        await asyncio.gather(
+            *(
+                self._resolve_transitions(state, key)
+                for state, key in workflow_states.items()
+            )
+        )
+
+        semaphore = asyncio.Semaphore(settings.agent.jira_max_concurrency)
+
+        async def transition(issue: Dict[str, Any]) -> None:
+            transitions = self.transition_ids.get(self._workflow_state(issue), {})
+            if (transition_id := transitions.get(target)) is None:
+                results[issue["key"]] = f"no transition to {target_status}"
+                return
+            try:
+                async with semaphore:
+                    await self._call(
+                        self.jira.set_issue_status_by_transition_id,
+                        issue["key"],
+                        transition_id,
+                    )
+                results[issue["key"]] = "transitioned"
+            except Exception as e:
+                logger.error(f"Error transitioning {issue['key']}: {e}")
+                results[issue["key"]] = f"error: {e}"
+
+        logger.debug(f"Transitioning {len(pending)} tickets to {target_status}")
+        await asyncio.gather(*(transition(issue) for issue in pending))
+
+        counts: Dict[str, int] = {}
+        for outcome in results.values():
+            outcome = outcome.split(":", 1)[0]
+            counts[outcome] = counts.get(outcome, 0) + 1
+        logger.info(f"Bulk transition to {target_status} finished: {counts}")
+        return {
+            "jql": jql,
+            "target_status": target_status,
+            "total": len(issues),
+            "counts": counts,
+            "results": results,
+        }
+
+    @staticmethod
+    def _workflow_state(issue: Dict[str, Any]) -> str:
+        """Identify the workflow and current status an issue's transitions depend on."""
+        fields = issue["fields"]
+        return (
+            f"{fields['project']['id']}:{fields['issuetype']['id']}"
+            f":{fields['status']['id']}"
+        )
+
+    async def _resolve_transitions(self, workflow_state: str, issue_key: str) -> None:
+        """Cache the transitions available in a workflow state.
+
+        Args:
+            workflow_state: Key returned by _workflow_state
+            issue_key: Any issue currently in that workflow state
+        """
+        if workflow_state in self.transition_ids:
+            return
+        try:
+            transitions = await self._call(self.jira.get_issue_transitions, issue_key)
+        except Exception as e:
+            logger.error(f"Error getting transitions of {issue_key}: {e}")
+            return
+        self.transition_ids[workflow_state] = {
+            t["to"].lower(): t["id"] for t in transitions
+        } | {t["name"].lower(): t["id"] for t in transitions}
+
     async def _arun(self, *args: Any, **kwargs: Any) -> Any:
         """Run the appropriate Jira operation based on the input.
 
+        The agent passes its tool input positionally, either as a JQL string
+        or as a dictionary matching JiraToolInput. Code can also pass the
+        arguments as keywords.
+
         Args:
-            *args: Positional arguments for the operation
+            *args: The tool input
             **kwargs: Keyword arguments for the operation
 
         Returns:
             The result of the operation
 
         Raises:
-            ValueError: If the operation is not recognized
+            ValueError: If the input is invalid for the operation
         """
         # If a string is passed directly, treat it as a JQL query
         if len(args) == 1 and isinstance(args[0], str):
-            return await self.search_tickets(args[0])
+            return await self.search_page(args[0])
 
-        operation = kwargs.get("operation")
-        if not operation:
-            raise ValueError("No operation specified")
+        if args and isinstance(args[0], dict):
+            tool_input = args[0]
+        else:
+            tool_input = {
+                k: v for k, v in kwargs.items() if k in JiraToolInput.__fields__
+            }
+        request = JiraToolInput.parse_obj(tool_input)
+        operation = request.operation
 
         if operation == "get_all_tickets":
-            return await self.get_all_tickets()
+            return await self.search_page("ORDER BY key")
         elif operation == "get_ticket_data":
-            ticket_number = kwargs.get("ticket_number")
-            if not ticket_number:
+            if not request.ticket_number:
                 raise ValueError("No ticket number provided")
-            return await self.get_ticket_data(ticket_number)
+            return await self.get_ticket_data(request.ticket_number)
         elif operation == "link_tickets":
-            from_issue = kwargs.get("from_issue")
-            to_issue = kwargs.get("to_issue")
-            if not from_issue or not to_issue:
+            if not request.from_issue or not request.to_issue:
                 raise ValueError("Missing issue keys for linking")
-            return await self.link_tickets(from_issue, to_issue)
+            return await self.link_tickets(request.from_issue, request.to_issue)
         elif operation == "add_comment":
-            issue_key = kwargs.get("issue_key")
-            comment = kwargs.get("comment")
-            if not issue_key or not comment:
+            if not request.issue_key or not request.comment:
                 raise ValueError("Missing issue key or comment")
-            return await self.add_comment(issue_key, comment)
+            return await self.add_comment(request.issue_key, request.comment)
         elif operation == "search_tickets":
-            jql = kwargs.get("jql")
-            if not jql:
+            if not request.jql:
                 raise ValueError("No JQL query provided")
-            return await self.search_tickets(jql)
+            return await self.search_page(request.jql)
+        elif operation == "next_page":
+            if not request.cursor:
+                raise ValueError("No cursor provided")
+            jql, start = decode_cursor(request.cursor)
+            return await self.search_page(jql, start)
+        elif operation == "count_tickets":
+            return await self.count_tickets(request.jql or "")
+        elif operation == "group_counts":
+            if not request.group_by:
+                raise ValueError("group_by must be status, assignee or priority")
+            return await self.group_counts(request.group_by, request.jql or "")
+        elif operation == "transition_tickets":
+            if not request.jql or not request.target_status:
+                raise ValueError("Missing JQL query or target status")
+            return await self.transition_tickets(request.jql, request.target_status)
         elif operation == "get_projects":
             return await self.get_projects()
         else:
@@ -0,0 +1,104 @@
+"""Process-wide record of Jira issue links."""
+import math
+import time
+from typing import Dict, FrozenSet, Iterable
+
+from ..config.settings import settings
+
+
+class LinkLedger:
+    """Track which ticket pairs are linked or being linked.
+
+    Pairs are unordered, so A -> B and B -> A count as the same link. Claims
+    are made without awaiting in between the check and the update, which makes
+    them atomic on the event loop: of several concurrent triage jobs in this
+    process, exactly one gets to write a given link.
+
+    The ledger only spares Jira requests; Jira stays the source of truth.
+    Other worker processes keep their own ledger, and links may be deleted in
+    Jira, so known links expire after a TTL and writers re-check Jira before
+    creating a link.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """Initialize an empty ledger.
+
+        Args:
+            ttl_seconds: How long a known link is trusted without asking Jira
+        """
+        self.ttl_seconds = ttl_seconds
+        # Expiry time of each pair; claims in flight never expire
+        self._pairs: Dict[FrozenSet[str], float] = {}
+        self._pruned_at = time.monotonic()
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._pairs)
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        self._pairs = {
+            pair: expires_at
+            for pair, expires_at in self._pairs.items()
+            if expires_at > now
+        }
+        self._pruned_at = now
+
+    def _is_known(self, pair: FrozenSet[str]) -> bool:
+        expires_at = self._pairs.get(pair)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._pairs[pair]
+            return False
+        return True
+
+    def is_linked(self, issue_a: str, issue_b: str) -> bool:
+        """Check whether two tickets are linked or a link is being created."""
+        return self._is_known(frozenset((issue_a, issue_b)))
+
+    def record(self, issue_key: str, linked_keys: Iterable[str]) -> None:
+        """Record links that already exist in Jira.
+
+        Args:
+            issue_key: The ticket the links were read from
+            linked_keys: Keys of the tickets linked to it
+        """
+        # Expired pairs of tickets that are never looked at again are dropped
+        # here, at most once per TTL
+        if time.monotonic() - self._pruned_at > self.ttl_seconds:
+            self._prune()
+        expires_at = time.monotonic() + self.ttl_seconds
+        for key in linked_keys:
+            pair = frozenset((issue_key, key))
+            # Keep claims in flight
+            if self._pairs.get(pair) != math.inf:
+                self._pairs[pair] = expires_at
+
+    def claim(self, issue_a: str, issue_b: str) -> bool:
+        """Reserve a link before writing it to Jira.
+
+        Args:
+            issue_a: First ticket key
+            issue_b: Second ticket key
+
+        Returns:
+            True if the caller should create the link, False if it is known
+            to exist or another job is creating it
+        """
+        pair = frozenset((issue_a, issue_b))
+        if self._is_known(pair):
+            return False
+        self._pairs[pair] = math.inf
+        return True
+
+    def confirm(self, issue_a: str, issue_b: str) -> None:
+        """Turn a claim into a known link once it exists in Jira."""
+        self._pairs[frozenset((issue_a, issue_b))] = time.monotonic() + self.ttl_seconds
+
+    def release(self, issue_a: str, issue_b: str) -> None:
+        """Drop a claim whose link could not be created."""
+        self._pairs.pop(frozenset((issue_a, issue_b)), None)
+
+
+link_ledger = LinkLedger(settings.agent.link_ledger_ttl_seconds)
@@ -0,0 +1,41 @@
+"""Rate limiting for outbound tool requests."""
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket that spaces out requests to an external API.
+
+    Waiters are served in arrival order because the bucket is refilled while
+    holding the lock.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate_per_second: Sustained request rate; zero or less disables limiting
+            burst: Number of requests allowed back to back after an idle period
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self.rate_per_second <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated_at) * self.rate_per_second,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
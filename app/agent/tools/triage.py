@@ -1,30 +1,86 @@
 """Tool for triaging Jira tickets."""
+import asyncio
 import re
-from typing import Any, Dict, Optional
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
 
 from langchain_core.callbacks import CallbackManagerForToolRun
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.pydantic_v1 import Field
 from langchain_openai import ChatOpenAI
 from logger import logger
-from pydantic import Field
 
 from ..config.prompts import create_ticket_analysis_prompt, create_ticket_linking_prompt
+from ..config.settings import settings
+from ..linking.classifier import LinkClassifier
+from ..linking.features import pair_features
+from ..linking.minhash import MinHashLSH
+from ..llm.cascade import ModelCascade, Verdict
 from ..llm.models import get_llm
 from .base import AgentTool
 from .jira import JiraTicketTool
+from .links import link_ledger
+
+
+def create_dedup_index() -> MinHashLSH:
+    """Create the near-duplicate index configured by the triage settings."""
+    return MinHashLSH(
+        num_perm=settings.triage.minhash_num_perm,
+        bands=settings.triage.minhash_bands,
+        shingle_size=settings.triage.minhash_shingle_size,
+        min_shingles=settings.triage.minhash_min_shingles,
+    )
+
+
+def create_linking_cascade() -> ModelCascade:
+    """Create the model cascade configured by the LLM settings."""
+    large_model = settings.llm.cascade_large_model_name or settings.llm.llm_model_name
+    tiers = [("large", get_llm(model_name=large_model, call_site="ticket_linking"))]
+    if settings.llm.cascade_enabled:
+        small_model = settings.llm.cascade_small_model_name
+        tiers.insert(
+            0, ("small", get_llm(model_name=small_model, call_site="ticket_linking"))
+        )
+    return ModelCascade(
+        prompt=create_ticket_linking_prompt(),
+        tiers=tiers,
+        confidence_threshold=settings.llm.cascade_confidence_threshold,
+    )
+
+
+def load_link_classifier() -> Optional[LinkClassifier]:
+    """Load the trained link classifier, if there is one."""
+    path = Path(settings.triage.link_classifier_path)
+    if not path.exists():
+        logger.info(f"No link classifier at {path}, all pairs go to the LLM")
+        return None
+    try:
+        classifier = LinkClassifier.load(path)
+        logger.info(f"Loaded link classifier from {path}: {classifier.metrics}")
+        return classifier
+    except Exception as e:
+        logger.error(f"Error loading link classifier: {e}", exc_info=True)
+        return None
 
 
 class TicketTriageTool(AgentTool):
     """Tool for triaging Jira tickets."""
 
     jira_tool: JiraTicketTool = Field(default_factory=JiraTicketTool, exclude=True)
-    llm: ChatOpenAI = Field(default_factory=get_llm, exclude=True)
-    linking_prompt: ChatPromptTemplate = Field(
-        default_factory=create_ticket_linking_prompt, exclude=True
+    llm: ChatOpenAI = Field(
+        default_factory=partial(get_llm, call_site="ticket_analysis"), exclude=True
+    )
+    linking_cascade: ModelCascade = Field(
+        default_factory=create_linking_cascade, exclude=True
     )
     analysis_prompt: ChatPromptTemplate = Field(
         default_factory=create_ticket_analysis_prompt, exclude=True
     )
+    dedup_index: MinHashLSH = Field(default_factory=create_dedup_index, exclude=True)
+    link_classifier: Optional[LinkClassifier] = Field(
+        default_factory=load_link_classifier, exclude=True
+    )
 
     def __init__(self) -> None:
         """Initialize the ticket triage tool."""
@@ -51,18 +107,44 @@ class TicketTriageTool(AgentTool):
         Returns:
             True if tickets are related, False otherwise
         """
+        verdict = await self.judge_pair(ticket1, ticket2)
+        return verdict.result if verdict else False
+
+    async def judge_pair(self, ticket1: str, ticket2: str) -> Optional[Verdict]:
+        """Decide whether two tickets are related, as cheaply as possible.
+
+        The local link classifier answers pairs it is confident about. The
+        others are judged by the linking cascade, so only pairs the small
+        model is unsure about reach the large model.
+
+        Args:
+            ticket1: First ticket description
+            ticket2: Second ticket description
+
+        Returns:
+            The verdict, or None if the pair could not be judged
+        """
         try:
-            logger.debug("Checking ticket match")
-            llm_result = await self.llm.ainvoke(
-                self.linking_prompt.format_prompt(
-                    input=f"<ticket1>{ticket1}</ticket1><ticket2>{ticket2}</ticket2>"
+            if self.link_classifier:
+                features = pair_features(
+                    ticket1, ticket2, settings.triage.minhash_shingle_size
                 )
+                probability = float(self.link_classifier.predict_proba(features))
+                confidence = max(probability, 1 - probability)
+                if confidence >= settings.triage.link_classifier_confidence:
+                    return Verdict(
+                        result=probability >= 0.5,
+                        confidence=confidence,
+                        tier="classifier",
+                    )
+
+            logger.debug("Checking ticket match")
+            return await self.linking_cascade.judge(
+                input=f"<ticket1>{ticket1}</ticket1><ticket2>{ticket2}</ticket2>"
             )
-            result = self._extract_tag(str(llm_result), "result")
-            return result == "True" if result else False
         except Exception as e:
             logger.error(f"Error checking ticket match: {e}", exc_info=True)
-            return False
+            return None
 
     async def analyze_ticket(self, ticket_data: str) -> Optional[Dict[str, str]]:
         """Analyze a ticket to extract metadata.
@@ -97,6 +179,44 @@ class TicketTriageTool(AgentTool):
             logger.error(f"Error analyzing ticket: {e}", exc_info=True)
             return None
 
+    def find_duplicates(
+        self, primary_key: str, primary_data: str, tickets: Dict[str, str]
+    ) -> Set[str]:
+        """Find near-duplicates of a ticket without calling the LLM.
+
+        Args:
+            primary_key: Key of the ticket being triaged
+            primary_data: Description of the ticket being triaged
+            tickets: All project tickets mapped to their descriptions
+
+        Returns:
+            Keys of tickets above the configured duplicate threshold
+        """
+        self.dedup_index.prune(set(tickets) | {primary_key})
+        for key, data in tickets.items():
+            self.dedup_index.upsert(key, data)
+        self.dedup_index.upsert(primary_key, primary_data)
+
+        duplicates = {
+            key
+            for key, similarity in self.dedup_index.neighbours(primary_key)
+            if similarity >= settings.triage.duplicate_threshold
+        }
+        logger.debug(f"Found {len(duplicates)} near-duplicates of {primary_key}")
+        return duplicates
+
+    async def _record_decisions(self, decisions: List[Dict[str, Any]]) -> None:
+        """Store LLM linking decisions as training data for the link classifier."""
+        if not decisions or not settings.triage.record_link_decisions:
+            return
+        try:
+            # The service layer owns the database session
+            from triage.services import record_link_decisions
+
+            await asyncio.to_thread(record_link_decisions, decisions)
+        except Exception as e:
+            logger.error(f"Error recording link decisions: {e}", exc_info=True)
+
     def _extract_tag(self, text: str, tag: str) -> Optional[str]:
         """Extract content from XML-like tags.
 
@@ -140,12 +260,49 @@ class TicketTriageTool(AgentTool):
             if not primary_key or not primary_data:
                 return f"Could not find ticket {ticket_number}"
 
-            # Find and link related tickets
-            for key, data in all_tickets.items():
-                if key != primary_key and await self.check_ticket_match(
-                    primary_data, data
-                ):
+            # Only pairs that are not linked yet need checking
+            linked = await self.jira_tool.get_linked_tickets(primary_key)
+            candidates = {
+                key: data
+                for key, data in all_tickets.items()
+                if key != primary_key
+                and key not in linked
+                and not link_ledger.is_linked(primary_key, key)
+            }
+            logger.debug(
+                f"Checking {len(candidates)} candidates for {primary_key}, "
+                f"{len(linked)} already linked"
+            )
+
+            # Link near-duplicates directly, only ambiguous pairs need the LLM
+            duplicates = self.find_duplicates(primary_key, primary_data, all_tickets)
+            decisions: List[Dict[str, Any]] = []
+            classified = 0
+            for key, data in candidates.items():
+                verdict = None
+                if key not in duplicates:
+                    verdict = await self.judge_pair(primary_data, data)
+                if verdict and verdict.tier == "classifier":
+                    classified += 1
+                elif verdict:
+                    decisions.append(
+                        {
+                            "ticket_key": primary_key,
+                            "candidate_key": key,
+                            "ticket_text": primary_data,
+                            "candidate_text": data,
+                            "related": verdict.result,
+                            "tier": verdict.tier,
+                            "confidence": verdict.confidence,
+                        }
+                    )
+                if key in duplicates or (verdict and verdict.result):
                     await self.jira_tool.link_tickets(primary_key, key)
+            logger.info(
+                f"Link classifier decided {classified} of {len(candidates)} pairs"
+            )
+            self.linking_cascade.log_counts()
+            await self._record_decisions(decisions)
 
             # Analyze ticket and add metadata
             if analysis := await self.analyze_ticket(primary_data):
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -32,11 +33,77 @@ class Settings(BaseSettings):
 
     # OpenAI
     OPENAI_API_KEY: str
+    OPENAI_API_BASE: str = "https://api.openai.com/v1"
 
     # Environment
     ENV: str = "development"
     DEBUG: bool = True
 
+    # Production server, see gunicorn_conf.py
+    SERVER_BIND: str = "0.0.0.0:8000"
+    SERVER_WORKERS: int | None = None  # Defaults to the available CPUs
+    SERVER_PRELOAD: bool = True
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_LIMIT_CONCURRENCY: int | None = None
+    SERVER_MAX_REQUESTS: int = 0  # Restart workers after this many requests
+    SERVER_WORKER_TIMEOUT_SECONDS: int = 60
+    # Longest wait for in-flight requests on shutdown, above the agent deadline
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 130
+    # Longest wait for in-flight background triage runs after that
+    SERVER_DRAIN_TIMEOUT_SECONDS: int = 30
+
+    # Startup
+    WARMUP_ENABLED: bool = True
+    WARMUP_RETRY_AFTER_SECONDS: int = 5
+    # Interval between attempts after a failed warm-up
+    WARMUP_RETRY_INTERVAL_SECONDS: float = 30.0
+
+    # Health
+    HEALTH_CACHE_TTL_SECONDS: float = 5.0
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 3.0
+    HEALTH_DB_LATENCY_THRESHOLD_MS: float = 250.0
+    HEALTH_JIRA_LATENCY_THRESHOLD_MS: float = 1500.0
+    HEALTH_LLM_LATENCY_THRESHOLD_MS: float = 1500.0
+
+    # Agent admission control, per worker process
+    AGENT_MAX_CONCURRENT_REQUESTS: int = 16
+    AGENT_MAX_QUEUED_REQUESTS: int = 64
+    AGENT_MAX_QUEUE_WAIT_SECONDS: float = 30.0
+
+    # Webhook triage
+    TRIAGE_WEBHOOK_SECRET: str | None = None
+    TRIAGE_QUEUE_MAXSIZE: int = 500
+    TRIAGE_DEBOUNCE_SECONDS: float = 10.0
+    TRIAGE_WORKERS: int = 2
+    TRIAGE_RETRY_AFTER_SECONDS: int = 30
+
+    # Request history partitions
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_RETENTION_MONTHS: int = 12
+    PARTITION_ARCHIVE_DIR: str = "archive"
+    RECORDS_PAGE_WINDOW_DAYS: int = 30  # Default creation window of paged records
+
+    # Tracing
+    TRACING_EXPORTER: Literal["json", "otlp", "none"] = "json"
+    TRACING_FILE: str = "traces.jsonl"
+    # The file is rotated at this size, keeping TRACING_FILE_BACKUPS old files
+    TRACING_FILE_MAX_BYTES: int = 50 * 1024 * 1024
+    TRACING_FILE_BACKUPS: int = 3
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SERVICE_NAME: str = "jira-agent"
+    TRACING_BATCH_SIZE: int = 256
+    TRACING_FLUSH_INTERVAL_SECONDS: float = 2.0
+    TRACING_QUEUE_MAXSIZE: int = 4096
+
+    # Profiling
+    PROFILING_ENABLED: bool = False
+    PROFILING_ADMIN_TOKEN: str | None = None
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_SECONDS: float = 0.005
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_PROFILES: int = 200
+
     class Config:
         case_sensitive = True
         env_file = ".env"
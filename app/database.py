@@ -1,7 +1,11 @@
+import itertools
 import os
+import threading
+import time
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
+from logger import logger
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -13,12 +17,95 @@ DATABASE_URL = (
     f"postgresql+psycopg2://{POSTGRES_USER}:{POSTGRES_PASSWORD}@db:5432/{POSTGRES_DB}"
 )
 
+# Optional read replicas, as comma-separated SQLAlchemy URLs
+READ_REPLICA_URLS = [
+    url.strip() for url in os.getenv("READ_REPLICA_URLS", "").split(",") if url.strip()
+]
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_INTERVAL_SECONDS = float(
+    os.getenv("REPLICA_LAG_CHECK_INTERVAL_SECONDS", "10")
+)
+
+# Zero while the replica has replayed everything it received, so an idle
+# replica does not look lagged just because nothing was written recently
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
 # Create SQLAlchemy engine
 engine = create_engine(DATABASE_URL)
+replica_engines = [create_engine(url, pool_pre_ping=True) for url in READ_REPLICA_URLS]
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+class ReplicaRouter:
+    """Pick a read replica that is reachable and not lagging behind.
+
+    Replica lag is measured at most once per check interval per replica. Reads
+    are spread round-robin over healthy replicas and fall back to the primary
+    when none is healthy.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._lock = threading.Lock()
+        self._health: dict[int, tuple[bool, float]] = {}
+        self._next = itertools.count()
+
+    def read_engine(self) -> Engine:
+        """Get the engine to run a read-only query on."""
+        if not self.replicas:
+            return self.primary
+        start = next(self._next)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if self._is_healthy(replica):
+                return replica
+        logger.warning("No healthy read replica, reading from the primary")
+        return self.primary
+
+    def _is_healthy(self, replica: Engine) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            healthy, checked_at = self._health.get(id(replica), (False, -1e9))
+            if now - checked_at < self.check_interval_seconds:
+                return healthy
+            # Other threads keep the previous state while this one checks
+            self._health[id(replica)] = (healthy, now)
+
+        try:
+            with replica.connect() as connection:
+                lag = connection.execute(REPLICA_LAG_QUERY).scalar()
+            healthy = lag is not None and lag <= self.max_lag_seconds
+            if not healthy:
+                logger.warning(f"Replica {replica.url.host} lags by {lag}s")
+        except Exception as e:
+            healthy = False
+            logger.warning(f"Replica {replica.url.host} is unreachable: {e}")
+        with self._lock:
+            self._health[id(replica)] = (healthy, now)
+        return healthy
+
+
+replica_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    REPLICA_MAX_LAG_SECONDS,
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+)
+
+
 # Dependency to get database session
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -28,6 +115,20 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_session() -> Session:
+    """Open a session for read-only queries, on a replica when one is healthy."""
+    return SessionLocal(bind=replica_router.read_engine())
+
+
+# Dependency to get a read-only database session
+def get_read_db() -> Generator[Session, None, None]:
+    db = get_read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def create_tables() -> None:
     """Create all database tables."""
     Base.metadata.create_all(bind=engine)
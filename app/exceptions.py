@@ -40,3 +40,96 @@ class NoOutputError(JiraAgentException):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Agent produced no output",
         )
+
+
+class WebhookAuthError(JiraAgentException):
+    """Raised when a webhook request carries no valid signature"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook signature",
+        )
+
+
+class InvalidWebhookPayloadError(JiraAgentException):
+    """Raised when a webhook body is not a valid Jira issue event"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid webhook payload",
+        )
+
+
+class TriageQueueFullError(JiraAgentException):
+    """Raised when the triage queue cannot accept more tickets"""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Triage queue is full",
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
+
+
+class ExportFormatUnavailableError(JiraAgentException):
+    """Raised when an export format needs an optional dependency that is missing"""
+
+    def __init__(self, export_format: str, package: str) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Export format {export_format} requires the {package} package",
+        )
+
+
+class AdminAuthError(JiraAgentException):
+    """Raised when an admin endpoint is called without a valid admin token"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+        )
+
+
+class ProfileNotFoundError(JiraAgentException):
+    """Raised when a stored request profile does not exist"""
+
+    def __init__(self, profile_id: str) -> None:
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {profile_id} not found",
+        )
+
+
+class ClientDisconnectedError(JiraAgentException):
+    """Raised when the client disconnects before its request was processed"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=499,  # Client Closed Request, as logged by nginx
+            detail="Client closed request",
+        )
+
+
+class ServiceOverloadedError(JiraAgentException):
+    """Raised when a request is shed because the agent is saturated"""
+
+    def __init__(
+        self,
+        status_code: int,
+        retry_after_seconds: int,
+        estimated_wait_seconds: float,
+    ) -> None:
+        super().__init__(
+            status_code=status_code,
+            detail=(
+                "Agent is overloaded, estimated wait "
+                f"{estimated_wait_seconds:.1f} seconds"
+            ),
+            headers={
+                "Retry-After": str(retry_after_seconds),
+                "X-Estimated-Wait-Seconds": f"{estimated_wait_seconds:.1f}",
+            },
+        )
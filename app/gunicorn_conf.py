@@ -0,0 +1,74 @@
+"""Gunicorn configuration of the production server.
+
+Run from the app directory:
+
+    gunicorn main:app -c gunicorn_conf.py
+
+Gunicorn supervises one uvicorn worker process per available CPU. Each
+worker runs its own event loop on uvloop with the httptools parser when
+they are installed.
+"""
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+from config import settings
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+def available_cpus() -> int:
+    """Get the number of CPUs this process may use.
+
+    Respects both the CPU affinity mask and a cgroup v2 CPU quota, so a
+    container limited to two CPUs on a larger host gets two workers.
+    """
+    cpus = len(os.sched_getaffinity(0))
+    cpu_max = Path("/sys/fs/cgroup/cpu.max")
+    if cpu_max.is_file():
+        quota, period = cpu_max.read_text().split()[:2]
+        if quota != "max":
+            cpus = min(cpus, max(math.ceil(int(quota) / int(period)), 1))
+    return cpus
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Uvicorn worker with the event loop, parser and limits from the settings."""
+
+    CONFIG_KWARGS = {
+        "loop": "auto",  # uvloop when installed
+        "http": "auto",  # httptools when installed
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY,
+        # In-flight requests, agent runs included, may finish before exiting
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+    }
+
+
+bind = settings.SERVER_BIND
+workers = settings.SERVER_WORKERS or available_cpus()
+worker_class = "gunicorn_conf.UvicornWorker"
+preload_app = settings.SERVER_PRELOAD
+keepalive = settings.SERVER_KEEPALIVE_SECONDS
+backlog = settings.SERVER_BACKLOG
+timeout = settings.SERVER_WORKER_TIMEOUT_SECONDS
+# Workers are killed once in-flight requests and background runs had their time
+graceful_timeout = (
+    settings.SERVER_GRACEFUL_TIMEOUT_SECONDS + settings.SERVER_DRAIN_TIMEOUT_SECONDS
+)
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = settings.SERVER_MAX_REQUESTS // 10
+accesslog = "-"
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Give each worker its own database connections.
+
+    With a preloaded app the engines are created before forking, and
+    connections inherited from the master must not be shared between workers.
+    """
+    if not preload_app:
+        return
+    from database import engine, replica_engines
+
+    for forked_engine in (engine, *replica_engines):
+        forked_engine.dispose(close=False)
@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 from health import HealthResponse
+from health.schemas import ReadinessResponse
+from health.services import readiness_checker
 from logger import logger
 
 router = APIRouter(prefix="/api/health", tags=["Health"])
@@ -10,3 +12,19 @@ async def health_check() -> HealthResponse:
     """Check if the service is healthy"""
     logger.info("Health check requested")
     return HealthResponse(message="Service is healthy")
+
+
+@router.get("/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """Check whether the service and its dependencies can serve traffic.
+
+    Probe results are cached for a short interval, so frequent polling by load
+    balancers does not add load on the dependencies. Slow dependencies are
+    reported as degraded; any dependency that is down turns the response into
+    a 503.
+    """
+    readiness = await readiness_checker.check()
+    if readiness.status == "down":
+        logger.warning(f"Readiness check failed: {readiness.dependencies}")
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return readiness
@@ -1,5 +1,23 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel
 
+DependencyState = Literal["ok", "degraded", "down"]
+
 
 class HealthResponse(BaseModel):
     message: str
+
+
+class DependencyStatus(BaseModel):
+    name: str
+    status: DependencyState
+    latency_ms: float | None = None
+    detail: str | None = None
+
+
+class ReadinessResponse(BaseModel):
+    status: DependencyState
+    checked_at: datetime
+    dependencies: list[DependencyStatus]
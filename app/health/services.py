@@ -0,0 +1,172 @@
+"""Dependency probes backing the readiness endpoint."""
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from functools import lru_cache
+
+import httpx
+from atlassian import Jira
+from config import settings
+from database import engine
+from health.schemas import DependencyState, DependencyStatus, ReadinessResponse
+from sqlalchemy import text
+from warmup import warmup_state
+
+
+def _ping_database() -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def probe_database() -> None:
+    """Run a trivial query through the connection pool."""
+    await asyncio.to_thread(_ping_database)
+
+
+@lru_cache()
+def get_probe_jira_client() -> Jira:
+    """Get the Jira client of the readiness probe.
+
+    The probe has its own client with the probe timeout, so it never waits
+    for a slot of the agent's lanes or for the Jira rate limiter.
+    """
+    return Jira(
+        url=settings.JIRA_INSTANCE_URL,
+        username=settings.JIRA_USERNAME,
+        password=settings.JIRA_API_TOKEN,
+        cloud=settings.JIRA_CLOUD,
+        timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    )
+
+
+async def probe_jira() -> None:
+    """Request the Jira server info, which every authenticated user may read."""
+    client = get_probe_jira_client()
+    await asyncio.to_thread(client.get_server_info)
+
+
+async def probe_llm() -> None:
+    """List models on the LLM endpoint, which costs no tokens."""
+    async with httpx.AsyncClient(
+        base_url=settings.OPENAI_API_BASE,
+        timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    ) as client:
+        response = await client.get(
+            "/models",
+            headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
+        )
+        response.raise_for_status()
+
+
+class ReadinessChecker:
+    """Probe dependencies in parallel and cache the outcome for a short interval.
+
+    Concurrent polls within the cache interval share one probe round, so health
+    checks never add more than one request per dependency per interval.
+    """
+
+    def __init__(
+        self,
+        probes: dict[str, tuple[Callable[[], Awaitable[None]], float]],
+        ttl_seconds: float,
+        timeout_seconds: float,
+    ) -> None:
+        """Initialize the checker.
+
+        Args:
+            probes: Dependency names mapped to a probe and its latency threshold in ms
+            ttl_seconds: How long a probe round is served from cache
+            timeout_seconds: Maximum time a single probe may take
+        """
+        self.probes = probes
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self._lock = asyncio.Lock()
+        self._result: ReadinessResponse | None = None
+        self._checked_at = 0.0
+
+    async def check(self) -> ReadinessResponse:
+        """Get the readiness of all dependencies, probing only when the cache is stale."""
+        if self._is_fresh():
+            return self._result
+        async with self._lock:
+            if not self._is_fresh():
+                self._result = await self._probe_all()
+                self._checked_at = time.monotonic()
+        return self._result
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._result is not None
+            and time.monotonic() - self._checked_at < self.ttl_seconds
+        )
+
+    async def _probe_all(self) -> ReadinessResponse:
+        dependencies = [self._warmup_status()]
+        dependencies += await asyncio.gather(
+            *(
+                self._run_probe(name, probe, threshold_ms)
+                for name, (probe, threshold_ms) in self.probes.items()
+            )
+        )
+        return ReadinessResponse(
+            status=self._overall_status(dependencies),
+            checked_at=datetime.now(UTC),
+            dependencies=dependencies,
+        )
+
+    async def _run_probe(
+        self, name: str, probe: Callable[[], Awaitable[None]], threshold_ms: float
+    ) -> DependencyStatus:
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe(), timeout=self.timeout_seconds)
+        except TimeoutError:
+            return DependencyStatus(
+                name=name,
+                status="down",
+                latency_ms=self.timeout_seconds * 1000,
+                detail="Probe timed out",
+            )
+        except Exception as e:
+            return DependencyStatus(name=name, status="down", detail=str(e))
+
+        latency_ms = round((time.perf_counter() - started_at) * 1000, 1)
+        if latency_ms > threshold_ms:
+            return DependencyStatus(
+                name=name,
+                status="degraded",
+                latency_ms=latency_ms,
+                detail=f"Latency above {threshold_ms}ms",
+            )
+        return DependencyStatus(name=name, status="ok", latency_ms=latency_ms)
+
+    @staticmethod
+    def _warmup_status() -> DependencyStatus:
+        if not warmup_state.is_ready:
+            return DependencyStatus(name="warmup", status="down", detail="Warming up")
+        return DependencyStatus(
+            name="warmup",
+            status="degraded" if warmup_state.error else "ok",
+            latency_ms=warmup_state.timings.get("total", 0.0) * 1000,
+            detail=warmup_state.error,
+        )
+
+    @staticmethod
+    def _overall_status(dependencies: list[DependencyStatus]) -> DependencyState:
+        states = {dependency.status for dependency in dependencies}
+        if "down" in states:
+            return "down"
+        return "degraded" if "degraded" in states else "ok"
+
+
+readiness_checker = ReadinessChecker(
+    probes={
+        "database": (probe_database, settings.HEALTH_DB_LATENCY_THRESHOLD_MS),
+        "jira": (probe_jira, settings.HEALTH_JIRA_LATENCY_THRESHOLD_MS),
+        "llm": (probe_llm, settings.HEALTH_LLM_LATENCY_THRESHOLD_MS),
+    },
+    ttl_seconds=settings.HEALTH_CACHE_TTL_SECONDS,
+    timeout_seconds=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,142 @@
+"""Admission control in front of the agent, shedding load once it is saturated."""
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from config import settings
+from exceptions import ServiceOverloadedError
+from fastapi import status
+from jira.schemas import AdmissionStats
+from logger import logger
+
+# Number of recent queue waits kept for the wait-time percentiles
+WAIT_SAMPLES = 1000
+# Weight of the newest run in the moving average of the run duration
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+class AdmissionController:
+    """Limit concurrent agent runs, with a bounded queue of waiting requests.
+
+    Requests beyond the concurrency limit wait in FIFO order. They are
+    rejected immediately with 429 when the queue is full, or with 503 when
+    the estimated wait exceeds the longest allowed wait, so clients can back
+    off instead of piling onto a saturated service.
+    """
+
+    def __init__(
+        self, max_concurrent: int, max_queued: int, max_wait_seconds: float
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            max_concurrent: Number of agent runs allowed at the same time
+            max_queued: Number of requests allowed to wait for a free slot
+            max_wait_seconds: Longest a request may wait for a free slot
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.max_wait_seconds = max_wait_seconds
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self.running = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_wait = 0
+        self._service_seconds: float | None = None
+        self._waits: deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    def estimated_wait(self) -> float:
+        """Estimate how long a newly arriving request would wait for a slot.
+
+        Queued requests are served by all slots in parallel, each taking the
+        moving average of the run duration.
+        """
+        if self.running < self.max_concurrent and not self.waiting:
+            return 0.0
+        service_seconds = self._service_seconds or self.max_wait_seconds
+        return service_seconds * (self.waiting + 1) / self.max_concurrent
+
+    def _reject(self, status_code: int, reason: str) -> ServiceOverloadedError:
+        estimated_wait = self.estimated_wait()
+        logger.warning(
+            f"Shedding agent request ({reason}): {self.running} running, "
+            f"{self.waiting} waiting, estimated wait {estimated_wait:.1f}s"
+        )
+        return ServiceOverloadedError(
+            status_code,
+            retry_after_seconds=max(math.ceil(estimated_wait), 1),
+            estimated_wait_seconds=estimated_wait,
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, waiting for one if needed.
+
+        Raises:
+            ServiceOverloadedError: If the queue is full, or no slot frees up
+                within the longest allowed wait
+        """
+        if self.running >= self.max_concurrent or self.waiting:
+            if self.waiting >= self.max_queued:
+                self.rejected_queue_full += 1
+                raise self._reject(status.HTTP_429_TOO_MANY_REQUESTS, "queue full")
+            if self.estimated_wait() > self.max_wait_seconds:
+                self.rejected_wait += 1
+                raise self._reject(status.HTTP_503_SERVICE_UNAVAILABLE, "wait")
+
+        queued_at = time.monotonic()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            self.rejected_wait += 1
+            raise self._reject(
+                status.HTTP_503_SERVICE_UNAVAILABLE, "wait timeout"
+            ) from None
+        finally:
+            self.waiting -= 1
+
+        started_at = time.monotonic()
+        self._waits.append(started_at - queued_at)
+        self.running += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self._slots.release()
+            duration = time.monotonic() - started_at
+            self._service_seconds = (
+                duration
+                if self._service_seconds is None
+                else SERVICE_TIME_SMOOTHING * duration
+                + (1 - SERVICE_TIME_SMOOTHING) * self._service_seconds
+            )
+
+    def stats(self) -> AdmissionStats:
+        waits = sorted(self._waits)
+        return AdmissionStats(
+            running=self.running,
+            waiting=self.waiting,
+            max_concurrent=self.max_concurrent,
+            max_queued=self.max_queued,
+            admitted=self.admitted,
+            rejected_queue_full=self.rejected_queue_full,
+            rejected_wait=self.rejected_wait,
+            estimated_wait_seconds=self.estimated_wait(),
+            avg_run_seconds=self._service_seconds,
+            p50_wait_seconds=waits[len(waits) // 2] if waits else 0.0,
+            p95_wait_seconds=waits[int(len(waits) * 0.95)] if waits else 0.0,
+            max_wait_seconds=waits[-1] if waits else 0.0,
+        )
+
+
+agent_admission = AdmissionController(
+    max_concurrent=settings.AGENT_MAX_CONCURRENT_REQUESTS,
+    max_queued=settings.AGENT_MAX_QUEUED_REQUESTS,
+    max_wait_seconds=settings.AGENT_MAX_QUEUE_WAIT_SECONDS,
+)
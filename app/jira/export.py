@@ -0,0 +1,176 @@
+"""Streaming export of the agent request history."""
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, Literal
+
+from database import replica_router
+from jira.models import JiraRequest
+from sqlalchemy import Row, select
+
+ExportFormat = Literal["ndjson", "csv", "parquet"]
+
+EXPORT_COLUMNS = ["id", "request", "response", "created_at", "updated_at"]
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/gzip",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+FILE_EXTENSIONS: dict[str, str] = {
+    "ndjson": "ndjson.gz",
+    "csv": "csv",
+    "parquet": "parquet",
+}
+
+
+def iter_record_chunks(
+    since: datetime | None, until: datetime | None, chunk_size: int
+) -> Iterator[list[Row]]:
+    """Stream request records in chunks through a server-side cursor.
+
+    Only one chunk is held in memory at a time. Records are read from a read
+    replica when one is healthy.
+
+    Args:
+        since: Only export records created at or after this time
+        until: Only export records created before this time
+        chunk_size: Number of rows fetched per round trip
+
+    Yields:
+        Lists of at most chunk_size rows, ordered by creation time
+    """
+    table = JiraRequest.__table__
+    query = select(*(table.c[name] for name in EXPORT_COLUMNS)).order_by(
+        table.c.created_at, table.c.id
+    )
+    if since is not None:
+        query = query.where(table.c.created_at >= since)
+    if until is not None:
+        query = query.where(table.c.created_at < until)
+
+    with replica_router.read_engine().connect() as connection:
+        result = connection.execution_options(
+            stream_results=True, yield_per=chunk_size
+        ).execute(query)
+        yield from result.partitions()
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_ndjson_gzip(chunks: Iterator[list[Row]]) -> Iterator[bytes]:
+    """Encode rows as gzip-compressed newline-delimited JSON."""
+    compressor = zlib.compressobj(wbits=31)  # 31 selects the gzip container
+    for rows in chunks:
+        lines = "".join(
+            json.dumps(row._asdict(), default=_json_default) + "\n" for row in rows
+        )
+        if data := compressor.compress(lines.encode()):
+            yield data
+    yield compressor.flush()
+
+
+def encode_csv(chunks: Iterator[list[Row]]) -> Iterator[bytes]:
+    """Encode rows as CSV with a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file collecting the bytes a writer produced since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def parquet_available() -> bool:
+    """Check whether the optional pyarrow dependency is installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def encode_parquet(chunks: Iterator[list[Row]]) -> Iterator[bytes]:
+    """Encode rows as Parquet, one row group per chunk.
+
+    Requires the optional pyarrow dependency.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("request", pa.string()),
+            ("response", pa.string()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("updated_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in chunks:
+            columns = list(zip(*rows)) if rows else [[] for _ in EXPORT_COLUMNS]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            if data := sink.drain():
+                yield data
+    yield sink.drain()
+
+
+ENCODERS = {
+    "ndjson": encode_ndjson_gzip,
+    "csv": encode_csv,
+    "parquet": encode_parquet,
+}
+
+
+def export_records(
+    export_format: ExportFormat,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    chunk_size: int = 1000,
+) -> Iterator[bytes]:
+    """Stream request records in an export format.
+
+    Args:
+        export_format: One of ndjson (gzip-compressed), csv or parquet
+        since: Only export records created at or after this time
+        until: Only export records created before this time
+        chunk_size: Number of rows fetched and encoded at a time
+
+    Returns:
+        Iterator over the encoded bytes
+    """
+    return ENCODERS[export_format](iter_record_chunks(since, until, chunk_size))
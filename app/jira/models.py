@@ -1,13 +1,48 @@
 from database import Base
-from sqlalchemy import Column, DateTime, Integer, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text
 from sqlalchemy.sql import func
 
 
 class JiraRequest(Base):
+    """Agent request and response, partitioned by month of created_at."""
+
     __tablename__ = "jira_requests"
 
+    # In PostgreSQL the table's primary key is (id, created_at), as the
+    # partition key has to be part of it (migration 006). The ORM only maps
+    # id, which the shared sequence keeps unique, so the model also creates
+    # a portable table, e.g. on SQLite.
     id = Column(Integer, primary_key=True, index=True)
+    # Chat session the request was made in, if any
+    session_id = Column(String(64), index=True)
     request = Column(Text)
     response = Column(Text)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, index=True, server_default=func.now()
+    )
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Whether the response was cut short by the request deadline
+    partial = Column(Boolean)
+
+    # Performance telemetry, empty for requests stored before it was recorded
+    latency_seconds = Column(Float)
+    llm_seconds = Column(Float)
+    jira_seconds = Column(Float)
+    prompt_tokens = Column(Integer)
+    completion_tokens = Column(Integer)
+    iterations = Column(Integer)
+    tool_calls = Column(Integer)
+    model_name = Column(String(64))
+    tool_stats = Column(JSON)
+
+
+class ConversationSession(Base):
+    __tablename__ = "conversation_sessions"
+
+    session_id = Column(String(64), primary_key=True)
+    memory = Column(JSON, nullable=False)
+    # Incremented by every save, so concurrent turns of a session never
+    # overwrite each other's memory
+    version = Column(Integer, nullable=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
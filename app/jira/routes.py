@@ -1,14 +1,79 @@
 """Routes for Jira-related endpoints."""
-from database import get_db
-from exceptions import JiraAgentError, NoOutputError
-from fastapi import APIRouter, Depends
-from jira.schemas import JiraRequest, JiraRequestCreate, JiraResponse
-from jira.services import get_jira_service
+import asyncio
+from collections.abc import Awaitable
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
+
+from config import settings
+from database import get_db, get_read_db
+from exceptions import (
+    ClientDisconnectedError,
+    ExportFormatUnavailableError,
+    JiraAgentError,
+    NoOutputError,
+    ServiceOverloadedError,
+)
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from jira.admission import agent_admission
+from jira.export import (
+    FILE_EXTENSIONS,
+    MEDIA_TYPES,
+    ExportFormat,
+    export_records,
+    parquet_available,
+)
+from jira.schemas import (
+    AdmissionStats,
+    JiraRequest,
+    JiraRequestCreate,
+    JiraResponse,
+    LaneStats,
+    LLMCacheStats,
+    TelemetrySummary,
+)
+from jira.services import get_jira_service, get_lane_stats, get_llm_cache_stats
 from logger import log_error, logger
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/api/jira", tags=["Jira"])
 
+# Seconds between two checks whether the client is still connected
+DISCONNECT_POLL_SECONDS = 0.5
+
+T = TypeVar("T")
+
+
+async def cancel_on_disconnect(request: Request, work: Awaitable[T]) -> T:
+    """Await work, cancelling it if the client disconnects first.
+
+    Args:
+        request: The HTTP request whose client is watched
+        work: The work serving the request
+
+    Returns:
+        The work's result
+
+    Raises:
+        ClientDisconnectedError: If the client disconnected and the work was
+            cancelled
+    """
+    task = asyncio.ensure_future(work)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.warning(f"Client disconnected, cancelling {request.url.path}")
+                raise ClientDisconnectedError()
+    finally:
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
 
 @router.get("/projects")
 async def get_projects(
@@ -39,12 +104,20 @@ async def get_projects(
 @router.post("/agent", response_model=JiraResponse)
 async def jira_agent(
     request: JiraRequestCreate,
+    http_request: Request,
     db: Session = Depends(get_db),
 ) -> JiraResponse:
     """Query the Jira agent.
 
+    Requests beyond the concurrency limit wait in a bounded queue and are
+    shed with 429 or 503 and a Retry-After header once it is saturated. The
+    agent run is cancelled when the client disconnects. When the request
+    deadline passes, the response carries the results gathered so far and is
+    flagged as partial.
+
     Args:
         request: The Jira request to process
+        http_request: The HTTP request, watched for client disconnects
         db: Database session
 
     Returns:
@@ -53,14 +126,27 @@ async def jira_agent(
     Raises:
         JiraAgentError: If processing fails
         NoOutputError: If no output is produced
+        ClientDisconnectedError: If the client disconnected
+        ServiceOverloadedError: If the request was shed
     """
+
+    async def process_when_admitted() -> Any:
+        async with agent_admission.admit():
+            return await service.process_request(request)
+
     try:
         logger.info(f"Processing Jira request: {request.request}")
         service = get_jira_service(db)
-        if output := await service.process_request(request):
+        if record := await cancel_on_disconnect(http_request, process_when_admitted()):
             logger.info("Successfully processed Jira request")
-            return JiraResponse(output=output)
+            return JiraResponse(
+                output=str(record.response),
+                record_id=record.id,
+                partial=bool(record.partial),
+            )
         raise NoOutputError()
+    except (ClientDisconnectedError, ServiceOverloadedError):
+        raise
     except Exception as e:
         log_error(logger, e, {"request": request.dict()})
         raise JiraAgentError(str(e)) from e
@@ -68,25 +154,131 @@ async def jira_agent(
 
 @router.get("/records", response_model=list[JiraRequest])
 async def get_records(
-    db: Session = Depends(get_db),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    before_id: int | None = Query(default=None, ge=1),
+    since: datetime | None = Query(default=None),
+    session_id: str | None = Query(default=None, max_length=64),
+    db: Session = Depends(get_read_db),
 ) -> list[JiraRequest]:
-    """Get all Jira request records.
+    """Get Jira request records.
+
+    Without a limit all records are returned. With a limit, records are paged
+    newest first, and before_id continues from the oldest record already seen.
+    Records are read from a replica when one is configured and up to date.
+    Passing since restricts the query to the monthly partitions it covers;
+    pages default to the last RECORDS_PAGE_WINDOW_DAYS, so paging never scans
+    every partition. Passing session_id restricts the records to one chat
+    session.
 
     Args:
+        limit: Optional page size
+        before_id: Optional ID to page backwards from
+        since: Optional lower bound of the creation time
+        session_id: Optional chat session the records belong to
         db: Database session
 
     Returns:
-        List of all Jira request records
+        List of Jira request records
 
     Raises:
         JiraAgentError: If fetching records fails
     """
     try:
-        logger.info("Fetching all Jira records")
+        logger.info("Fetching Jira records")
         service = get_jira_service(db)
-        records = service.get_all_records()
+        if limit is None:
+            records = service.get_all_records(since, session_id)
+        else:
+            if since is None:
+                since = datetime.now(timezone.utc) - timedelta(
+                    days=settings.RECORDS_PAGE_WINDOW_DAYS
+                )
+            records = service.get_records_page(limit, before_id, since, session_id)
         logger.info(f"Found {len(records)} records")
         return records
     except Exception as e:
         log_error(logger, e)
         raise JiraAgentError(str(e)) from e
+
+
+@router.get("/records/export")
+async def export_records_stream(
+    format: ExportFormat = Query(default="ndjson"),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    chunk_size: int = Query(default=1000, ge=100, le=50_000),
+) -> StreamingResponse:
+    """Stream Jira request records as a file download.
+
+    Rows are fetched through a server-side cursor and encoded chunk by chunk,
+    so memory use does not grow with the size of the table.
+
+    Args:
+        format: ndjson (gzip-compressed), csv or parquet
+        since: Optional lower bound of the creation time
+        until: Optional exclusive upper bound of the creation time
+        chunk_size: Number of rows fetched and encoded at a time
+
+    Returns:
+        The streamed export
+
+    Raises:
+        ExportFormatUnavailableError: If parquet is requested without pyarrow
+    """
+    if format == "parquet" and not parquet_available():
+        raise ExportFormatUnavailableError(format, "pyarrow")
+    logger.info(f"Exporting Jira records as {format} from {since} until {until}")
+    return StreamingResponse(
+        export_records(format, since, until, chunk_size),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="jira_requests.{FILE_EXTENSIONS[format]}"'
+        },
+    )
+
+
+@router.get("/telemetry", response_model=TelemetrySummary)
+def get_telemetry(
+    days: int = Query(default=7, ge=1, le=90),
+    db: Session = Depends(get_read_db),
+) -> TelemetrySummary:
+    """Get p50/p95/p99 latency, LLM time, Jira time and tokens of agent requests.
+
+    A plain function, so FastAPI runs the database query in its threadpool
+    rather than on the event loop serving agent requests.
+
+    Args:
+        days: Number of past days to summarize
+        db: Read-only database session
+
+    Returns:
+        Percentile summaries grouped by day and by tool
+
+    Raises:
+        JiraAgentError: If summarizing fails
+    """
+    try:
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        logger.info(f"Summarizing Jira request telemetry since {since}")
+        return get_jira_service(db).get_telemetry_summary(since)
+    except Exception as e:
+        log_error(logger, e)
+        raise JiraAgentError(str(e)) from e
+
+
+@router.get("/admission", response_model=AdmissionStats)
+async def get_admission_stats() -> AdmissionStats:
+    """Get the running and queued agent requests, wait times and shed counts."""
+    return agent_admission.stats()
+
+
+@router.get("/lanes", response_model=list[LaneStats])
+async def get_lanes() -> list[LaneStats]:
+    """Get the slots, waiting calls and wait times of the LLM and Jira lanes."""
+    return get_lane_stats()
+
+
+@router.get("/llm-cache", response_model=list[LLMCacheStats])
+async def get_llm_cache() -> list[LLMCacheStats]:
+    """Get the LLM cache hits, misses and hit ratio of each call site."""
+    return get_llm_cache_stats()
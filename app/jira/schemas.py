@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class JiraRequestBase(BaseModel):
@@ -8,14 +8,24 @@ class JiraRequestBase(BaseModel):
 
 
 class JiraRequestCreate(JiraRequestBase):
-    pass
+    session_id: str | None = Field(default=None, max_length=64)
 
 
 class JiraRequest(JiraRequestBase):
     id: int
+    session_id: str | None = None
     response: str
     created_at: datetime
     updated_at: datetime | None = None
+    partial: bool | None = None
+    latency_seconds: float | None = None
+    llm_seconds: float | None = None
+    jira_seconds: float | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    iterations: int | None = None
+    tool_calls: int | None = None
+    model_name: str | None = None
 
     class Config:
         from_attributes = True
@@ -23,3 +33,63 @@ class JiraRequest(JiraRequestBase):
 
 class JiraResponse(BaseModel):
     output: str
+    record_id: int | None = None
+    # Set when the request deadline passed and the output covers finished steps
+    partial: bool = False
+
+
+class PercentileSummary(BaseModel):
+    p50: float
+    p95: float
+    p99: float
+
+
+class TelemetryGroup(BaseModel):
+    key: str
+    requests: int
+    latency_seconds: PercentileSummary
+    llm_seconds: PercentileSummary
+    jira_seconds: PercentileSummary
+    total_tokens: PercentileSummary
+    # Time spent in the tool per request, only set for tool groups
+    tool_seconds: PercentileSummary | None = None
+
+
+class TelemetrySummary(BaseModel):
+    since: datetime
+    by_day: list[TelemetryGroup]
+    by_tool: list[TelemetryGroup]
+
+
+class AdmissionStats(BaseModel):
+    running: int
+    waiting: int
+    max_concurrent: int
+    max_queued: int
+    admitted: int
+    rejected_queue_full: int
+    rejected_wait: int
+    estimated_wait_seconds: float
+    avg_run_seconds: float | None = None
+    p50_wait_seconds: float
+    p95_wait_seconds: float
+    max_wait_seconds: float
+
+
+class LaneStats(BaseModel):
+    pool: str
+    lane: str
+    slots: int
+    limit: int
+    weight: int
+    running: int
+    waiting: int
+    granted: int
+    avg_wait_seconds: float
+
+
+class LLMCacheStats(BaseModel):
+    call_site: str
+    hits: int
+    misses: int
+    hit_ratio: float
@@ -1,26 +1,100 @@
 """Service layer for Jira request processing."""
+import math
+from collections import defaultdict
+from datetime import datetime
 from functools import lru_cache
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Tuple
 
-from agent import create_jira_agent
-from agent.core.callbacks import AgentCallbackHandler
-from jira.models import JiraRequest
+from jira.models import ConversationSession, JiraRequest
 from jira.schemas import JiraRequest as JiraRequestSchema
-from jira.schemas import JiraRequestCreate
+from jira.schemas import (
+    JiraRequestCreate,
+    LaneStats,
+    LLMCacheStats,
+    PercentileSummary,
+    TelemetryGroup,
+    TelemetrySummary,
+)
 from logger import logger
+from sqlalchemy import Float, cast, func, select, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
+from tracing import span
+
+# Quantiles of the telemetry summary, in the order of PercentileSummary
+TELEMETRY_QUANTILES = (0.5, 0.95, 0.99)
+# Attempts to store a turn in a session memory that other turns keep changing
+MEMORY_SAVE_ATTEMPTS = 3
 
 
 @lru_cache()
 def get_jira_agent() -> Any:
     """Get or create a Jira agent instance.
 
+    The agent package pulls in LangChain, OpenAI and atlassian, so it is
+    imported here rather than at module load to keep application import cheap.
+
     Returns:
         Configured JiraAgent instance
     """
+    from agent import create_jira_agent
+    from agent.core.callbacks import AgentCallbackHandler
+
     return create_jira_agent(callbacks=[AgentCallbackHandler()])
 
 
+def get_jira_tool() -> Any:
+    """Get the JiraTicketTool of the shared agent.
+
+    Returns:
+        The agent's JiraTicketTool instance
+
+    Raises:
+        ValueError: If the agent's first tool is not a JiraTicketTool
+    """
+    jira_tool = get_jira_agent().tools[0]  # JiraTicketTool is the first tool
+    if not hasattr(jira_tool, "get_projects"):
+        raise ValueError("First tool is not a JiraTicketTool")
+    return jira_tool
+
+
+def get_triage_tool() -> Any:
+    """Get the TicketTriageTool of the shared agent.
+
+    Returns:
+        The agent's TicketTriageTool instance
+
+    Raises:
+        ValueError: If the agent has no triage tool
+    """
+    for tool in get_jira_agent().tools:
+        if tool.name == "triage_ticket":
+            return tool
+    raise ValueError("Agent has no triage_ticket tool")
+
+
+def get_lane_stats() -> list[LaneStats]:
+    """Get the occupancy and waits of the lanes sharing the LLM and Jira clients."""
+    from agent.core.lanes import jira_scheduler, llm_scheduler
+
+    return [
+        LaneStats(**lane_stats)
+        for scheduler in (llm_scheduler, jira_scheduler)
+        for lane_stats in scheduler.stats()
+    ]
+
+
+def get_llm_cache_stats() -> list[LLMCacheStats]:
+    """Get the LLM cache hits, misses and hit ratio of each call site."""
+    from agent.llm.cache import cache_stats
+
+    return [
+        LLMCacheStats(call_site=call_site, **counts)
+        for call_site, counts in sorted(cache_stats.snapshot().items())
+    ]
+
+
 class JiraService:
     """Service for handling Jira-related operations."""
 
@@ -44,10 +118,7 @@ class JiraService:
         """
         try:
             logger.debug("Fetching all Jira projects")
-            jira_tool = self.agent.tools[0]  # JiraTicketTool is the first tool
-            if not hasattr(jira_tool, "get_projects"):
-                raise ValueError("First tool is not a JiraTicketTool")
-            projects = await jira_tool.get_projects()
+            projects = await get_jira_tool().get_projects()
             if not isinstance(projects, dict):
                 raise ValueError("Projects must be a dictionary")
             logger.debug(f"Found {len(projects)} projects: {projects}")
@@ -56,46 +127,175 @@ class JiraService:
             logger.error(f"Error getting projects: {e}", exc_info=True)
             raise
 
-    async def process_request(self, request: JiraRequestCreate) -> Optional[str]:
+    async def process_request(
+        self, request: JiraRequestCreate
+    ) -> Optional[JiraRequest]:
         """Process a Jira request through the agent and store the result.
 
+        The request is stored together with its telemetry: latency, time spent
+        in LLM and Jira calls, token usage, iterations and tool calls.
+
         Args:
             request: The Jira request to process
 
         Returns:
-            The agent's response or None if no output
+            The stored request record or None if the agent produced no output
 
         Raises:
             Exception: If processing fails
         """
         try:
             logger.debug(f"Processing Jira request: {request.request}")
+            from agent.core.telemetry import collect_telemetry
 
-            # Call the agent
-            response = await self.agent.execute({"input": request.request})
-            logger.debug(f"Agent response: {response}")
+            with span(
+                "jira_service.process_request",
+                attributes={"session.id": request.session_id or ""},
+            ) as request_span:
+                # Call the agent with the session's conversation memory
+                with span("db.load_memory"):
+                    memory, version = self._load_memory(request.session_id)
+                model_name = getattr(self.agent.llm, "model_name", None)
+                with collect_telemetry(model_name) as telemetry:
+                    response = await self.agent.execute(
+                        {"input": request.request}, memory=memory
+                    )
+                # The final answer takes one more iteration than the tool steps
+                telemetry.iterations = len(response.get("intermediate_steps", [])) + 1
+                request_span.set_attribute("agent.iterations", telemetry.iterations)
+                logger.debug(f"Agent response: {response}")
 
-            if output := response.get("output"):
-                logger.debug(f"Agent output: {output}")
+                if output := response.get("output"):
+                    logger.debug(f"Agent output: {output}")
 
-                # Save request and response
-                db_request = JiraRequest(request=request.request, response=output)
-                self.db.add(db_request)
-                self.db.commit()
-                self.db.refresh(db_request)
-                logger.info(f"Successfully saved Jira request with ID: {db_request.id}")
-                return str(output)
+                    # Save request, response and updated memory together
+                    with span("db.commit"):
+                        db_request = JiraRequest(
+                            session_id=request.session_id,
+                            request=request.request,
+                            response=output,
+                            partial=bool(response.get("partial")),
+                            **telemetry.as_columns(),
+                        )
+                        self.db.add(db_request)
+                        if memory is not None:
+                            self._save_memory(
+                                request.session_id,
+                                memory,
+                                version,
+                                lambda fresh: fresh.add_turn(
+                                    request.request,
+                                    output,
+                                    response.get("intermediate_steps", []),
+                                ),
+                            )
+                        self.db.commit()
+                        self.db.refresh(db_request)
+                    request_span.set_attribute("jira_request.id", db_request.id)
+                    logger.info(
+                        f"Successfully saved Jira request with ID: {db_request.id}"
+                    )
+                    return db_request
 
-            logger.warning("No output from agent")
-            return None
+                logger.warning("No output from agent")
+                return None
 
         except Exception as e:
             logger.error(f"Error processing Jira request: {e}", exc_info=True)
             raise
 
-    def get_all_records(self) -> list[JiraRequestSchema]:
+    def _load_memory(self, session_id: Optional[str]) -> Tuple[Any, Optional[int]]:
+        """Load the conversation memory of a chat session.
+
+        Memory lives in the database, so any API replica can serve the session.
+
+        Args:
+            session_id: Optional chat session ID
+
+        Returns:
+            The session's ConversationMemory and the version it was stored
+            with, None for a new session; (None, None) for sessionless requests
+        """
+        if not session_id:
+            return None, None
+        from agent.core.memory import ConversationMemory
+
+        # Bypass the identity map, which holds the version read before a conflict
+        session = self.db.get(ConversationSession, session_id, populate_existing=True)
+        if session is None:
+            return ConversationMemory(), None
+        return ConversationMemory.from_dict(session.memory), session.version
+
+    def _save_memory(
+        self,
+        session_id: str,
+        memory: Any,
+        version: Optional[int],
+        apply_turn: Callable[[Any], None],
+    ) -> None:
+        """Store a session memory unless another turn stored it first.
+
+        The agent runs for seconds between loading and saving the memory, so
+        the row is not locked meanwhile. The save only succeeds if the version
+        is unchanged; otherwise the finished turn is applied again to the
+        memory stored by the other turn. That memory is compacted after the
+        next turn of the session.
+
+        Args:
+            session_id: Chat session ID
+            memory: The memory updated by the agent
+            version: Version the memory was loaded with, None for a new session
+            apply_turn: Records the finished turn in another memory
+        """
+        for _ in range(MEMORY_SAVE_ATTEMPTS):
+            if self._write_memory(session_id, memory, version):
+                return
+            logger.info(f"Memory of session {session_id} changed, merging the turn")
+            memory, version = self._load_memory(session_id)
+            apply_turn(memory)
+        logger.warning(
+            f"Memory of session {session_id} kept changing, the turn is not saved"
+        )
+
+    def _write_memory(
+        self, session_id: str, memory: Any, version: Optional[int]
+    ) -> bool:
+        """Write a session memory if its stored version is still version.
+
+        Returns:
+            Whether the memory was written
+        """
+        if version is None:
+            try:
+                # A savepoint, so a concurrent insert leaves the request intact
+                with self.db.begin_nested():
+                    self.db.add(
+                        ConversationSession(
+                            session_id=session_id, memory=memory.to_dict(), version=1
+                        )
+                    )
+                return True
+            except IntegrityError:
+                return False
+        result = self.db.execute(
+            update(ConversationSession)
+            .where(
+                ConversationSession.session_id == session_id,
+                ConversationSession.version == version,
+            )
+            .values(memory=memory.to_dict(), version=version + 1)
+        )
+        return result.rowcount == 1
+
+    def get_all_records(
+        self, since: Optional[datetime] = None, session_id: Optional[str] = None
+    ) -> list[JiraRequestSchema]:
         """Get all Jira request records.
 
+        Args:
+            since: Only return records created at or after this time
+            session_id: Only return records of this chat session
+
         Returns:
             List of all Jira request records
 
@@ -104,9 +304,53 @@ class JiraService:
         """
         try:
             logger.debug("Fetching all Jira request records")
+            query = self.db.query(JiraRequest)
+            if since is not None:
+                query = query.filter(JiraRequest.created_at >= since)
+            if session_id is not None:
+                query = query.filter(JiraRequest.session_id == session_id)
+            records = [
+                JiraRequestSchema.model_validate(record) for record in query.all()
+            ]
+            logger.debug(f"Found {len(records)} records")
+            return records
+        except Exception as e:
+            logger.error(f"Error fetching Jira records: {e}", exc_info=True)
+            raise
+
+    def get_records_page(
+        self,
+        limit: int,
+        before_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        session_id: Optional[str] = None,
+    ) -> list[JiraRequestSchema]:
+        """Get a page of Jira request records, newest first.
+
+        Args:
+            limit: Maximum number of records to return
+            before_id: Only return records with a lower ID, for paging backwards
+            since: Only return records created at or after this time
+            session_id: Only return records of this chat session
+
+        Returns:
+            List of Jira request records ordered by descending ID
+
+        Raises:
+            Exception: If fetching records fails
+        """
+        try:
+            logger.debug(f"Fetching {limit} Jira request records before {before_id}")
+            query = self.db.query(JiraRequest)
+            if before_id is not None:
+                query = query.filter(JiraRequest.id < before_id)
+            if since is not None:
+                query = query.filter(JiraRequest.created_at >= since)
+            if session_id is not None:
+                query = query.filter(JiraRequest.session_id == session_id)
             records = [
                 JiraRequestSchema.model_validate(record)
-                for record in self.db.query(JiraRequest).all()
+                for record in query.order_by(JiraRequest.id.desc()).limit(limit)
             ]
             logger.debug(f"Found {len(records)} records")
             return records
@@ -114,6 +358,209 @@ class JiraService:
             logger.error(f"Error fetching Jira records: {e}", exc_info=True)
             raise
 
+    def get_telemetry_summary(self, since: datetime) -> TelemetrySummary:
+        """Summarize request telemetry as percentiles by day and by tool.
+
+        Requests stored before telemetry was recorded are skipped. On
+        PostgreSQL the percentiles are computed by the database; other
+        databases load the rows of the window instead.
+
+        Args:
+            since: Only include requests created at or after this time
+
+        Returns:
+            Percentile summaries grouped by day of creation and by tool used
+
+        Raises:
+            Exception: If fetching the telemetry fails
+        """
+        try:
+            logger.debug(f"Summarizing Jira request telemetry since {since}")
+            if self.db.get_bind().dialect.name == "postgresql":
+                summary = self._summarize_telemetry_in_sql(since)
+            else:
+                summary = self._summarize_telemetry_rows(since)
+            logger.debug(
+                f"Summarized telemetry of {sum(g.requests for g in summary.by_day)} "
+                "requests"
+            )
+            return summary
+        except Exception as e:
+            logger.error(f"Error summarizing Jira telemetry: {e}", exc_info=True)
+            raise
+
+    def _summarize_telemetry_in_sql(self, since: datetime) -> TelemetrySummary:
+        """Compute the percentiles with percentile_cont, one row per group.
+
+        Only the group summaries leave the database, however many requests
+        the window holds.
+        """
+        window = (
+            JiraRequest.created_at >= since,
+            JiraRequest.latency_seconds.is_not(None),
+        )
+        day = func.date_trunc("day", func.timezone("UTC", JiraRequest.created_at))
+        day_rows = self.db.execute(
+            select(day.label("key"), *_telemetry_percentile_columns())
+            .where(*window)
+            .group_by(day)
+            .order_by(day)
+        )
+        tools = func.json_each(JiraRequest.tool_stats).table_valued("key", "value")
+        tool_seconds = cast(tools.c.value.op("->>")("seconds"), Float)
+        tool_rows = self.db.execute(
+            select(
+                tools.c.key.label("key"),
+                *_telemetry_percentile_columns(),
+                _percentile_column(tool_seconds).label("tool_seconds"),
+            )
+            .select_from(JiraRequest)
+            .join(tools, true())
+            .where(*window)
+            .group_by(tools.c.key)
+            .order_by(tools.c.key)
+        )
+        return TelemetrySummary(
+            since=since,
+            by_day=[
+                _telemetry_group_from_sql(row.key.date().isoformat(), row)
+                for row in day_rows
+            ],
+            by_tool=[
+                _telemetry_group_from_sql(
+                    row.key, row, tool_seconds=_summary(row.tool_seconds)
+                )
+                for row in tool_rows
+            ],
+        )
+
+    def _summarize_telemetry_rows(self, since: datetime) -> TelemetrySummary:
+        """Compute the percentiles in Python, for databases without percentile_cont."""
+        rows = (
+            self.db.query(
+                JiraRequest.created_at,
+                JiraRequest.latency_seconds,
+                JiraRequest.llm_seconds,
+                JiraRequest.jira_seconds,
+                JiraRequest.prompt_tokens,
+                JiraRequest.completion_tokens,
+                JiraRequest.tool_stats,
+            )
+            .filter(
+                JiraRequest.created_at >= since,
+                JiraRequest.latency_seconds.is_not(None),
+            )
+            .all()
+        )
+        by_day: dict[str, list[Any]] = defaultdict(list)
+        by_tool: dict[str, list[Any]] = defaultdict(list)
+        for row in rows:
+            by_day[row.created_at.date().isoformat()].append(row)
+            for tool in row.tool_stats or {}:
+                by_tool[tool].append(row)
+
+        return TelemetrySummary(
+            since=since,
+            by_day=[_telemetry_group(day, by_day[day]) for day in sorted(by_day)],
+            by_tool=[
+                _telemetry_group(tool, by_tool[tool], tool=tool)
+                for tool in sorted(by_tool)
+            ],
+        )
+
+
+def _percentile_column(expression: Any) -> Any:
+    """Build a percentile_cont aggregate returning the telemetry quantiles."""
+    return func.percentile_cont(postgresql.array(TELEMETRY_QUANTILES)).within_group(
+        expression
+    )
+
+
+def _telemetry_percentile_columns() -> list[Any]:
+    """Build the request count and percentile columns shared by all groups."""
+    return [
+        func.count().label("requests"),
+        _percentile_column(JiraRequest.latency_seconds).label("latency_seconds"),
+        _percentile_column(func.coalesce(JiraRequest.llm_seconds, 0.0)).label(
+            "llm_seconds"
+        ),
+        _percentile_column(func.coalesce(JiraRequest.jira_seconds, 0.0)).label(
+            "jira_seconds"
+        ),
+        _percentile_column(
+            func.coalesce(JiraRequest.prompt_tokens, 0)
+            + func.coalesce(JiraRequest.completion_tokens, 0)
+        ).label("total_tokens"),
+    ]
+
+
+def _summary(values: list[float]) -> PercentileSummary:
+    """Map the quantiles returned by percentile_cont to a summary."""
+    p50, p95, p99 = values
+    return PercentileSummary(p50=p50, p95=p95, p99=p99)
+
+
+def _telemetry_group_from_sql(
+    key: str, row: Any, tool_seconds: Optional[PercentileSummary] = None
+) -> TelemetryGroup:
+    """Build the summary of one group from a row of percentile_cont arrays."""
+    return TelemetryGroup(
+        key=key,
+        requests=row.requests,
+        latency_seconds=_summary(row.latency_seconds),
+        llm_seconds=_summary(row.llm_seconds),
+        jira_seconds=_summary(row.jira_seconds),
+        total_tokens=_summary(row.total_tokens),
+        tool_seconds=tool_seconds,
+    )
+
+
+def _percentiles(values: list[float]) -> PercentileSummary:
+    """Get the p50, p95 and p99 of values with linear interpolation."""
+    ordered = sorted(values)
+
+    def percentile(q: float) -> float:
+        position = (len(ordered) - 1) * q
+        lower, upper = math.floor(position), math.ceil(position)
+        fraction = position - lower
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+    if not ordered:
+        return PercentileSummary(p50=0.0, p95=0.0, p99=0.0)
+    return PercentileSummary(
+        p50=percentile(0.5), p95=percentile(0.95), p99=percentile(0.99)
+    )
+
+
+def _telemetry_group(
+    key: str, rows: list[Any], tool: Optional[str] = None
+) -> TelemetryGroup:
+    """Summarize the telemetry rows of one group.
+
+    Args:
+        key: Name of the group
+        rows: Telemetry rows of the requests in the group
+        tool: Tool whose own time per request to summarize, for tool groups
+
+    Returns:
+        Percentile summary of the group
+    """
+    return TelemetryGroup(
+        key=key,
+        requests=len(rows),
+        latency_seconds=_percentiles([row.latency_seconds for row in rows]),
+        llm_seconds=_percentiles([row.llm_seconds or 0.0 for row in rows]),
+        jira_seconds=_percentiles([row.jira_seconds or 0.0 for row in rows]),
+        total_tokens=_percentiles(
+            [(row.prompt_tokens or 0) + (row.completion_tokens or 0) for row in rows]
+        ),
+        tool_seconds=(
+            _percentiles([row.tool_stats[tool]["seconds"] for row in rows])
+            if tool
+            else None
+        ),
+    )
+
 
 # Factory function for service creation
 def get_jira_service(db: Session) -> JiraService:
@@ -1,13 +1,22 @@
 """Main FastAPI application module."""
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Awaitable, Callable
 
+from config import settings
 from database import create_tables
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from health.routes import router as health_router
 from jira.routes import router as jira_router
 from logger import logger
+from profiling.routes import router as profiling_router
+from profiling.services import profile_requests
+from triage.routes import router as triage_router
+from tracing import span, tracer
+from triage.services import triage_queue
+from warmup import is_gated, warm_up
 
 
 @asynccontextmanager
@@ -25,8 +34,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Application starting up")
     logger.info("API docs available at: /api/docs")
     create_tables()  # Create database tables on startup
+    warmup_task = asyncio.create_task(warm_up())
+    triage_queue.start()
     yield
     logger.info("Application shutting down")
+    await triage_queue.stop(drain_timeout=settings.SERVER_DRAIN_TIMEOUT_SECONDS)
+    warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    tracer.shutdown()
 
 
 app = FastAPI(
@@ -48,9 +64,50 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+
+if settings.PROFILING_ENABLED:
+    app.middleware("http")(profile_requests)
+
+
+@app.middleware("http")
+async def gate_until_warm(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Reject traffic with 503 until the startup warm-up has completed."""
+    if is_gated(request.url.path):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Service is warming up"},
+            headers={"Retry-After": str(settings.WARMUP_RETRY_AFTER_SECONDS)},
+        )
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def trace_requests(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Serve each request inside a span, continuing the caller's trace if any."""
+    with span(
+        f"{request.method} {request.url.path}",
+        kind="server",
+        traceparent=request.headers.get("traceparent"),
+        attributes={"http.method": request.method, "http.target": request.url.path},
+    ) as server_span:
+        response = await call_next(request)
+        if route := request.scope.get("route"):
+            server_span.name = f"{request.method} {route.path}"
+            server_span.set_attribute("http.route", route.path)
+        server_span.set_attribute("http.status_code", response.status_code)
+        response.headers["traceparent"] = server_span.traceparent
+        return response
+
+
 # Include routers
 app.include_router(health_router)
 app.include_router(jira_router)
+app.include_router(triage_router)
+app.include_router(profiling_router)
 
 # Log registered routes
 for route in app.routes:
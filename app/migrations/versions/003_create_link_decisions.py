@@ -0,0 +1,47 @@
+"""Create link_decisions table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql import func
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "link_decisions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ticket_key", sa.String(length=64), nullable=False),
+        sa.Column("candidate_key", sa.String(length=64), nullable=False),
+        sa.Column("ticket_text", sa.Text(), nullable=False),
+        sa.Column("candidate_text", sa.Text(), nullable=False),
+        sa.Column("related", sa.Boolean(), nullable=False),
+        sa.Column("tier", sa.String(length=32), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_link_decisions_id"), "link_decisions", ["id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_link_decisions_id"), table_name="link_decisions")
+    op.drop_table("link_decisions")
@@ -0,0 +1,41 @@
+"""Create llm_cache table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_cache",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("call_site", sa.String(length=64), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_llm_cache_created_at"), "llm_cache", ["created_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_llm_cache_last_used_at"), "llm_cache", ["last_used_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_llm_cache_last_used_at"), table_name="llm_cache")
+    op.drop_index(op.f("ix_llm_cache_created_at"), table_name="llm_cache")
+    op.drop_table("llm_cache")
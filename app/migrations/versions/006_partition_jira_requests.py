@@ -0,0 +1,120 @@
+"""Partition jira_requests by month of created_at
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition(month: date) -> None:
+    op.execute(
+        f"CREATE TABLE jira_requests_y{month.year}m{month.month:02d} "
+        f"PARTITION OF jira_requests FOR VALUES FROM ('{month}') "
+        f"TO ('{_add_months(month, 1)}')"
+    )
+
+
+def upgrade() -> None:
+    # Declarative partitioning is PostgreSQL specific
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE jira_requests RENAME TO jira_requests_legacy")
+    op.execute(
+        "ALTER TABLE jira_requests_legacy "
+        "RENAME CONSTRAINT jira_requests_pkey TO jira_requests_legacy_pkey"
+    )
+    op.execute("ALTER INDEX ix_jira_requests_id RENAME TO ix_jira_requests_legacy_id")
+    op.execute(
+        "UPDATE jira_requests_legacy SET created_at = now() WHERE created_at IS NULL"
+    )
+
+    # The partition key has to be part of the primary key
+    op.execute(
+        """
+        CREATE TABLE jira_requests (
+            id INTEGER NOT NULL DEFAULT nextval('jira_requests_id_seq'),
+            request TEXT,
+            response TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE jira_requests_id_seq OWNED BY jira_requests.id")
+    op.execute("CREATE INDEX ix_jira_requests_id ON jira_requests (id)")
+    op.execute("CREATE INDEX ix_jira_requests_created_at ON jira_requests (created_at)")
+
+    oldest = (
+        op.get_bind()
+        .exec_driver_sql(
+            "SELECT date_trunc('month', min(created_at))::date FROM jira_requests_legacy"
+        )
+        .scalar()
+    )
+    # Partition bounds are UTC, like the timestamps stored in created_at
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = oldest or current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        _create_partition(month)
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE jira_requests_default PARTITION OF jira_requests DEFAULT")
+
+    op.execute(
+        "INSERT INTO jira_requests (id, request, response, created_at, updated_at) "
+        "SELECT id, request, response, created_at, updated_at FROM jira_requests_legacy"
+    )
+    op.execute("DROP TABLE jira_requests_legacy")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE jira_requests RENAME TO jira_requests_partitioned")
+    op.execute(
+        "ALTER TABLE jira_requests_partitioned "
+        "RENAME CONSTRAINT jira_requests_pkey TO jira_requests_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_jira_requests_id RENAME TO ix_jira_requests_partitioned_id"
+    )
+    op.execute(
+        """
+        CREATE TABLE jira_requests (
+            id INTEGER NOT NULL DEFAULT nextval('jira_requests_id_seq'),
+            request TEXT,
+            response TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            CONSTRAINT jira_requests_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE jira_requests_id_seq OWNED BY jira_requests.id")
+    op.execute("CREATE INDEX ix_jira_requests_id ON jira_requests (id)")
+    op.execute(
+        "INSERT INTO jira_requests (id, request, response, created_at, updated_at) "
+        "SELECT id, request, response, created_at, updated_at "
+        "FROM jira_requests_partitioned"
+    )
+    op.execute("DROP TABLE jira_requests_partitioned")
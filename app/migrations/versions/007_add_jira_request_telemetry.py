@@ -0,0 +1,40 @@
+"""Add performance telemetry columns to jira_requests
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    sa.Column("latency_seconds", sa.Float(), nullable=True),
+    sa.Column("llm_seconds", sa.Float(), nullable=True),
+    sa.Column("jira_seconds", sa.Float(), nullable=True),
+    sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+    sa.Column("completion_tokens", sa.Integer(), nullable=True),
+    sa.Column("iterations", sa.Integer(), nullable=True),
+    sa.Column("tool_calls", sa.Integer(), nullable=True),
+    sa.Column("model_name", sa.String(length=64), nullable=True),
+    sa.Column("tool_stats", sa.JSON(), nullable=True),
+]
+
+
+def upgrade() -> None:
+    # Columns added to a partitioned table propagate to all of its partitions
+    for column in COLUMNS:
+        op.add_column("jira_requests", column)
+
+
+def downgrade() -> None:
+    for column in reversed(COLUMNS):
+        op.drop_column("jira_requests", column.name)
@@ -0,0 +1,25 @@
+"""Add partial flag to jira_requests
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jira_requests", sa.Column("partial", sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("jira_requests", "partial")
@@ -0,0 +1,34 @@
+"""Add session_id to jira_requests
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "jira_requests", sa.Column("session_id", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_jira_requests_session_id"),
+        "jira_requests",
+        ["session_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_jira_requests_session_id"), table_name="jira_requests")
+    op.drop_column("jira_requests", "session_id")
@@ -0,0 +1,55 @@
+"""Routes for stored request profiles."""
+from exceptions import AdminAuthError, ProfileNotFoundError
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import PlainTextResponse
+from profiling.schemas import ProfileSummary
+from profiling.services import is_admin, profile_store
+
+router = APIRouter(prefix="/api/profiling", tags=["Profiling"])
+
+
+@router.get("/profiles", response_model=list[ProfileSummary])
+async def list_profiles(
+    limit: int = Query(default=50, ge=1, le=500),
+    x_profile_token: str | None = Header(default=None),
+) -> list[ProfileSummary]:
+    """List the stored request profiles, newest first.
+
+    Args:
+        limit: Maximum number of profiles to return
+        x_profile_token: The admin token
+
+    Returns:
+        Summaries of the stored profiles
+
+    Raises:
+        AdminAuthError: If the admin token is missing or invalid
+    """
+    if not is_admin(x_profile_token):
+        raise AdminAuthError()
+    return profile_store.list(limit)
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(
+    profile_id: str,
+    x_profile_token: str | None = Header(default=None),
+) -> str:
+    """Get a profile as collapsed stacks, for flamegraph.pl or speedscope.
+
+    Args:
+        profile_id: ID of the profile
+        x_profile_token: The admin token
+
+    Returns:
+        One line per stack, frames separated by semicolons, then the sample count
+
+    Raises:
+        AdminAuthError: If the admin token is missing or invalid
+        ProfileNotFoundError: If the profile does not exist
+    """
+    if not is_admin(x_profile_token):
+        raise AdminAuthError()
+    if (stacks := profile_store.read(profile_id)) is None:
+        raise ProfileNotFoundError(profile_id)
+    return stacks
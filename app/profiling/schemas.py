@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+ProfileTrigger = Literal["header", "sampled"]
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    method: str
+    path: str
+    status_code: int
+    trigger: ProfileTrigger
+    created_at: datetime
+    duration_ms: float
+    samples: int
+    trace_id: str | None = None
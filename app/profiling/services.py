@@ -0,0 +1,205 @@
+"""Opt-in statistical CPU profiling of single requests."""
+import asyncio
+import hmac
+import random
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Awaitable, Callable, Optional
+
+from config import settings
+from fastapi import Request, Response
+from logger import logger
+from profiling.schemas import ProfileSummary, ProfileTrigger
+from tracing import current_span
+
+PROFILE_HEADER = "X-Profile-Token"
+# Outer frames beyond this depth are cut off to bound the size of a sample
+MAX_STACK_DEPTH = 128
+
+
+def is_admin(token: Optional[str]) -> bool:
+    """Check a token against the configured admin token.
+
+    Without a configured admin token nobody is an admin.
+    """
+    if not settings.PROFILING_ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token, settings.PROFILING_ADMIN_TOKEN)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = Path(code.co_filename)
+    label = f"{code.co_name} ({path.parent.name}/{path.name}:{code.co_firstlineno})"
+    # Semicolons separate frames in the collapsed-stack format
+    return label.replace(";", ":")
+
+
+def collapse_stack(frame: Optional[FrameType]) -> Optional[str]:
+    """Render a stack as a semicolon-separated line, outermost frame first."""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels)) if labels else None
+
+
+class StackSampler:
+    """Sample the stack of one thread at a fixed interval from a helper thread.
+
+    Requests share the event loop thread, so samples of a profiled request
+    also include whatever other requests run on the loop at the same time.
+    """
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        """Initialize the sampler.
+
+        Args:
+            thread_id: Identifier of the thread to sample
+            interval: Seconds between two samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if stack := collapse_stack(frame):
+                self.stacks[stack] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """Stop sampling.
+
+        Returns:
+            Number of samples per collapsed stack
+        """
+        self._stopped.set()
+        self._thread.join()
+        return self.stacks
+
+
+class ProfileStore:
+    """Store collapsed-stack profiles as files, keeping the newest ones.
+
+    Each profile is a .collapsed file, readable by flamegraph.pl and
+    speedscope, next to a .json file with its summary.
+    """
+
+    def __init__(self, directory: str, max_profiles: int) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory receiving the profiles
+            max_profiles: Number of profiles kept before the oldest are deleted
+        """
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+
+    def save(self, summary: ProfileSummary, stacks: Counter[str]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lines = (f"{stack} {count}\n" for stack, count in stacks.most_common())
+        (self.directory / f"{summary.id}.collapsed").write_text("".join(lines))
+        (self.directory / f"{summary.id}.json").write_text(summary.model_dump_json())
+        self._prune()
+
+    def _prune(self) -> None:
+        for summary_path in self._summary_paths()[self.max_profiles :]:
+            summary_path.unlink(missing_ok=True)
+            summary_path.with_suffix(".collapsed").unlink(missing_ok=True)
+
+    def _summary_paths(self) -> list[Path]:
+        """Get the summary files, newest first."""
+        if not self.directory.is_dir():
+            return []
+        # Profile IDs start with their creation time
+        return sorted(self.directory.glob("*.json"), reverse=True)
+
+    def list(self, limit: int) -> list[ProfileSummary]:
+        return [
+            ProfileSummary.model_validate_json(path.read_text())
+            for path in self._summary_paths()[:limit]
+        ]
+
+    def read(self, profile_id: str) -> Optional[str]:
+        """Get the collapsed stacks of a profile, or None if it does not exist."""
+        path = self.directory / f"{Path(profile_id).name}.collapsed"
+        return path.read_text() if path.is_file() else None
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_PROFILES)
+# Concurrent profiles would sample the same event loop, so only one runs at a time
+_profiling = threading.Lock()
+
+
+def profile_trigger(request: Request) -> Optional[ProfileTrigger]:
+    """Decide whether to profile a request.
+
+    Returns:
+        Why the request is profiled, or None to serve it without profiling
+    """
+    if is_admin(request.headers.get(PROFILE_HEADER)):
+        return "header"
+    if settings.PROFILING_SAMPLE_RATE > 0 and (
+        random.random() < settings.PROFILING_SAMPLE_RATE
+    ):
+        return "sampled"
+    return None
+
+
+async def profile_requests(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Profile requests selected by the admin header or the sampling rate.
+
+    Only registered when profiling is enabled, so it costs nothing otherwise.
+    """
+    trigger = profile_trigger(request)
+    if trigger is None or not _profiling.acquire(blocking=False):
+        return await call_next(request)
+
+    created_at = datetime.now(timezone.utc)
+    sampler = StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL_SECONDS)
+    status_code = 500
+    try:
+        sampler.start()
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        stacks = sampler.stop()
+        _profiling.release()
+        duration = datetime.now(timezone.utc) - created_at
+        span = current_span.get()
+        summary = ProfileSummary(
+            id=f"{created_at:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}",
+            method=request.method,
+            path=request.url.path,
+            status_code=status_code,
+            trigger=trigger,
+            created_at=created_at,
+            duration_ms=duration.total_seconds() * 1000,
+            samples=sum(stacks.values()),
+            trace_id=span.trace_id if span else None,
+        )
+        try:
+            await asyncio.to_thread(profile_store.save, summary, stacks)
+            logger.info(
+                f"Profiled {request.method} {request.url.path} as {summary.id} "
+                f"with {summary.samples} samples"
+            )
+        except Exception as e:
+            logger.error(f"Error saving profile {summary.id}: {e}", exc_info=True)
+    response.headers["X-Profile-Id"] = summary.id
+    return response
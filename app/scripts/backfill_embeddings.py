@@ -0,0 +1,57 @@
+"""Embed every ticket of the configured project.
+
+Run from the app directory:
+
+    python -m scripts.backfill_embeddings [--jql "created >= -30d"]
+
+Tickets are streamed from Jira page by page and embedded through the
+content-hash cache, so re-running the backfill only embeds new or changed
+tickets and memory use stays bounded by one page.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from agent.core.lanes import lane
+from agent.embeddings.service import get_embedding_service
+from agent.tools.jira import JiraTicketTool, ticket_text
+from logger import logger
+
+
+async def backfill(jql: str) -> int:
+    """Embed all tickets matching a JQL query.
+
+    Args:
+        jql: The JQL query, scoped to the configured project
+
+    Returns:
+        Number of tickets embedded
+    """
+    jira_tool = JiraTicketTool()
+    service = get_embedding_service()
+    started_at = time.perf_counter()
+    done = 0
+    with lane("batch"):
+        async for page in jira_tool.iter_issue_pages(jql, "summary,description"):
+            await service.embed_tickets(
+                {issue["key"]: ticket_text(issue) for issue in page}
+            )
+            done += len(page)
+            rate = done / max(time.perf_counter() - started_at, 1e-9)
+            logger.info(f"Embedded {done} tickets ({rate:.1f}/s)")
+    return done
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--jql", default="ORDER BY key")
+    args = parser.parse_args()
+
+    done = asyncio.run(backfill(args.jql))
+    logger.info(f"Backfilled embeddings of {done} tickets")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
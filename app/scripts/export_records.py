@@ -0,0 +1,46 @@
+"""Export the agent request history to a file.
+
+Run from the app directory:
+
+    python -m scripts.export_records --format parquet --since 2026-01-01 -o history.parquet
+
+Rows are streamed through a server-side cursor and written chunk by chunk,
+so memory use stays constant regardless of the table size. Parquet output
+requires the optional pyarrow dependency.
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from jira.export import FILE_EXTENSIONS, export_records, parquet_available
+from logger import logger
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--format", choices=sorted(FILE_EXTENSIONS), default="ndjson")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--until", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.format == "parquet" and not parquet_available():
+        logger.error("Parquet export requires pyarrow")
+        return 1
+
+    output = args.output or Path(f"jira_requests.{FILE_EXTENSIONS[args.format]}")
+    written = 0
+    with output.open("wb") as file:
+        for data in export_records(
+            args.format, args.since, args.until, args.chunk_size
+        ):
+            file.write(data)
+            written += len(data)
+    logger.info(f"Wrote {written} bytes to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
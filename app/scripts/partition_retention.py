@@ -0,0 +1,222 @@
+"""Maintain the monthly partitions of jira_requests.
+
+Run from the app directory, e.g. daily from cron:
+
+    python -m scripts.partition_retention [--retention-months 12] [--dry-run]
+
+Partitions for the coming months are created ahead of time, so inserts never
+land in the default partition; rows that did land there are moved into the
+partition of their month once it exists. Partitions entirely older than the retention
+period are detached, written to gzip-compressed CSV files in the archive
+directory and dropped.
+"""
+import argparse
+import gzip
+import re
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from config import settings
+from database import engine
+from logger import logger
+from sqlalchemy import Connection, text
+
+PARENT_TABLE = "jira_requests"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_PATTERN = re.compile(rf"^{PARENT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+# Includes partitions a previous, interrupted run detached but did not drop
+LIST_PARTITIONS_QUERY = text(
+    """
+    SELECT relname,
+           EXISTS (SELECT 1 FROM pg_inherits WHERE inhrelid = pg_class.oid)
+    FROM pg_class
+    WHERE relkind = 'r' AND relname LIKE :prefix
+    """
+)
+
+
+def current_month() -> date:
+    """Get the first day of the current month in UTC, the zone of created_at."""
+    return datetime.now(timezone.utc).date().replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Get the first day of the month count months after month."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_y{month.year}m{month.month:02d}"
+
+
+def list_partitions(connection: Connection) -> dict[date, tuple[str, bool]]:
+    """Get the monthly partitions of jira_requests.
+
+    Returns:
+        First day of each partition's month mapped to its name and whether it
+        is attached
+    """
+    partitions = {}
+    rows = connection.execute(LIST_PARTITIONS_QUERY, {"prefix": f"{PARENT_TABLE}_y%"})
+    for name, attached in rows:
+        if match := PARTITION_PATTERN.match(name):
+            partitions[date(int(match[1]), int(match[2]), 1)] = (name, attached)
+    return partitions
+
+
+def create_future_partitions(
+    connection: Connection, months_ahead: int, dry_run: bool
+) -> list[str]:
+    """Create missing partitions from the current month up to months_ahead.
+
+    Args:
+        connection: Connection inside a transaction
+        months_ahead: Number of months after the current one to cover
+        dry_run: Only report what would be created
+
+    Returns:
+        Names of the created partitions
+    """
+    existing = list_partitions(connection)
+    current = current_month()
+    created = []
+    for month in (add_months(current, n) for n in range(months_ahead + 1)):
+        if month in existing:
+            continue
+        name = partition_name(month)
+        if not dry_run:
+            create_partition(connection, month)
+        created.append(name)
+    return created
+
+
+def create_partition(connection: Connection, month: date) -> None:
+    """Create the partition of a month, moving its rows out of the default one.
+
+    PostgreSQL refuses to create a partition while the default partition
+    holds rows in its range. The default partition is then detached for the
+    duration of the transaction, and the rows are moved into the new
+    partition through the parent table before attaching it again.
+
+    Args:
+        connection: Connection inside a transaction
+        month: First day of the month
+    """
+    bounds = {"start": month, "end": add_months(month, 1)}
+    in_month = "created_at >= :start AND created_at < :end"
+    stranded = connection.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_month})"),
+        bounds,
+    ).scalar()
+    if stranded:
+        connection.execute(
+            text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+        )
+    connection.execute(
+        text(
+            f"CREATE TABLE {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+        )
+    )
+    if stranded:
+        moved = connection.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE {in_month} RETURNING *) "
+                f"INSERT INTO {PARENT_TABLE} SELECT * FROM moved"
+            ),
+            bounds,
+        ).rowcount
+        connection.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} "
+                f"ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+            )
+        )
+        logger.info(f"Moved {moved} rows from {DEFAULT_PARTITION}")
+
+
+def archive_partition(name: str, attached: bool, archive_dir: Path) -> Path:
+    """Detach a partition, write it to a gzip-compressed CSV file and drop it.
+
+    The archive is written under a temporary name and renamed once complete,
+    and the table is only dropped after that, so an interrupted run never
+    loses rows.
+
+    Args:
+        name: Name of the partition
+        attached: Whether the partition is still attached to jira_requests
+        archive_dir: Directory receiving the archive
+
+    Returns:
+        Path of the archive file
+    """
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    partial = path.with_suffix(".gz.partial")
+
+    if attached:
+        with engine.begin() as connection:
+            connection.execute(
+                text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}")
+            )
+
+    # COPY streams the rows through the driver without loading them in memory
+    raw = engine.raw_connection()
+    try:
+        with gzip.open(partial, "wb") as archive, raw.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)", archive
+            )
+        raw.commit()
+    finally:
+        raw.close()
+    partial.rename(path)
+
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE {name}"))
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--months-ahead", type=int, default=settings.PARTITION_MONTHS_AHEAD
+    )
+    parser.add_argument(
+        "--retention-months", type=int, default=settings.PARTITION_RETENTION_MONTHS
+    )
+    parser.add_argument(
+        "--archive-dir", type=Path, default=Path(settings.PARTITION_ARCHIVE_DIR)
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    with engine.begin() as connection:
+        created = create_future_partitions(connection, args.months_ahead, args.dry_run)
+        partitions = list_partitions(connection)
+    for name in created:
+        logger.info(f"Created partition {name}")
+
+    cutoff = add_months(current_month(), -args.retention_months)
+    expired = [
+        partition for month, partition in sorted(partitions.items()) if month < cutoff
+    ]
+    for name, attached in expired:
+        if args.dry_run:
+            logger.info(f"Would archive partition {name}")
+            continue
+        try:
+            path = archive_partition(name, attached, args.archive_dir)
+            logger.info(f"Archived partition {name} to {path}")
+        except Exception as e:
+            logger.error(f"Error archiving partition {name}: {e}", exc_info=True)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,10 @@
 #!/bin/bash
 set -e
 
+if [ "${ENV}" = "production" ]; then
+    echo "Starting FastAPI application with gunicorn..."
+    exec gunicorn main:app -c gunicorn_conf.py
+fi
+
 echo "Starting FastAPI application..."
-uvicorn main:app --host 0.0.0.0 --port 8000 --reload
+exec uvicorn main:app --host 0.0.0.0 --port 8000 --reload
@@ -0,0 +1,107 @@
+"""Retrain the link classifier on recorded LLM linking decisions.
+
+Run from the app directory:
+
+    python -m scripts.train_link_classifier [--holdout 0.2] [--dry-run]
+
+The decisions are split into a training and a held-out set. The report
+compares the classifier with the held-out LLM labels, including how many
+pairs it would decide without the LLM at the configured confidence. The
+classifier is only saved if its held-out accuracy beats always answering the
+majority class.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+from agent.config.settings import settings
+from agent.linking.classifier import LinkClassifier
+from agent.linking.features import pair_features
+from database import get_read_session
+from logger import logger
+from sqlalchemy import select
+from triage.models import LinkDecision
+
+
+def load_dataset(limit: int | None) -> tuple[np.ndarray, np.ndarray]:
+    """Compute features and labels of the most recent recorded decisions."""
+    query = (
+        select(
+            LinkDecision.ticket_text,
+            LinkDecision.candidate_text,
+            LinkDecision.related,
+        )
+        .order_by(LinkDecision.id.desc())
+        .limit(limit)
+    )
+    features, labels = [], []
+    with get_read_session() as db:
+        for ticket_text, candidate_text, related in db.execute(query):
+            features.append(
+                pair_features(
+                    ticket_text, candidate_text, settings.triage.minhash_shingle_size
+                )
+            )
+            labels.append(int(related))
+    return np.array(features), np.array(labels)
+
+
+def format_report(name: str, metrics: dict[str, float]) -> str:
+    return f"{name}: " + ", ".join(
+        f"{metric}={value:.3f}" if metric != "samples" else f"{metric}={int(value)}"
+        for metric, value in metrics.items()
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--min-samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", type=Path, default=Path(settings.triage.link_classifier_path)
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    features, labels = load_dataset(args.limit)
+    if len(labels) < args.min_samples:
+        logger.error(f"Only {len(labels)} decisions recorded, need {args.min_samples}")
+        return 1
+
+    order = np.random.default_rng(args.seed).permutation(len(labels))
+    split = int(len(labels) * (1 - args.holdout))
+    train, test = order[:split], order[split:]
+
+    classifier = LinkClassifier.fit(features[train], labels[train])
+    confidence = settings.triage.link_classifier_confidence
+    classifier.metrics = classifier.evaluate(features[test], labels[test], confidence)
+
+    majority = float(max(labels[test].mean(), 1 - labels[test].mean()))
+    logger.info(
+        format_report(
+            "train", classifier.evaluate(features[train], labels[train], confidence)
+        )
+    )
+    logger.info(format_report("held-out", classifier.metrics))
+    logger.info(f"held-out majority-class accuracy: {majority:.3f}")
+
+    # A classifier no better than always answering the majority class would
+    # only add wrong confident verdicts to triage
+    if classifier.metrics["accuracy"] <= majority:
+        logger.error(
+            f"Held-out accuracy {classifier.metrics['accuracy']:.3f} does not beat "
+            f"the majority-class baseline {majority:.3f}; not saving the classifier"
+        )
+        return 1
+    if args.dry_run:
+        return 0
+    classifier.save(args.output)
+    logger.info(f"Saved classifier to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
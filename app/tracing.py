@@ -0,0 +1,417 @@
+"""Lightweight distributed tracing with W3C trace context propagation.
+
+Spans follow the OpenTelemetry data model and are exported in the background
+either as JSON lines to a local file or as OTLP/JSON to a collector, so no
+external service is needed to inspect a trace.
+"""
+import fcntl
+import json
+import queue
+import re
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Optional, Protocol
+
+import httpx
+from config import settings
+from logger import logger
+
+SpanKind = Literal["internal", "server", "client"]
+
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+OTLP_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+OTLP_STATUS_OK = 1
+OTLP_STATUS_ERROR = 2
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    parent_span_id: Optional[str] = None
+    kind: SpanKind = "internal"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        """Get the W3C traceparent header value of the span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_ms(self) -> float:
+        end_time_ns = self.end_time_ns or time.time_ns()
+        return (end_time_ns - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """End the span and hand it to the exporter.
+
+        Args:
+            error: Exception that failed the operation, if any
+        """
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        tracer.on_end(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "kind": self.kind,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> dict[str, Any]:
+        otlp_span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": OTLP_SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": OTLP_STATUS_ERROR, "message": self.error}
+                if self.error
+                else {"code": OTLP_STATUS_OK}
+            ),
+        }
+        if self.parent_span_id:
+            otlp_span["parentSpanId"] = self.parent_span_id
+        return otlp_span
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[tuple[str, str]]:
+    """Parse a W3C traceparent header.
+
+    Args:
+        header: The header value, if the request had one
+
+    Returns:
+        The trace ID and parent span ID, or None if the header is missing or
+        malformed
+    """
+    if not header or not (match := TRACEPARENT_PATTERN.match(header.strip().lower())):
+        return None
+    trace_id, parent_span_id, _ = match.groups()
+    if trace_id == "0" * 32 or parent_span_id == "0" * 16:
+        return None
+    return trace_id, parent_span_id
+
+
+def start_span(
+    name: str,
+    kind: SpanKind = "internal",
+    parent: Optional[Span] = None,
+    traceparent: Optional[str] = None,
+    attributes: Optional[dict[str, Any]] = None,
+) -> Span:
+    """Start a span without making it the current one.
+
+    The parent is, in order of precedence, the given span, the remote span
+    of the traceparent header, or the current span. Without any of them the
+    span starts a new trace.
+
+    Args:
+        name: Name of the operation
+        kind: Whether the span serves a request, calls out or is internal
+        parent: Optional explicit parent span
+        traceparent: Optional W3C traceparent header of a remote parent
+        attributes: Optional initial attributes
+
+    Returns:
+        The started span; it has to be ended by the caller
+    """
+    parent = parent or current_span.get()
+    if remote := parse_traceparent(traceparent):
+        trace_id, parent_span_id = remote
+    elif parent is not None:
+        trace_id, parent_span_id = parent.trace_id, parent.span_id
+    else:
+        trace_id, parent_span_id = secrets.token_hex(16), None
+    return Span(
+        name=name,
+        trace_id=trace_id,
+        parent_span_id=parent_span_id,
+        kind=kind,
+        attributes=dict(attributes or {}),
+    )
+
+
+@contextmanager
+def span(
+    name: str,
+    kind: SpanKind = "internal",
+    parent: Optional[Span] = None,
+    traceparent: Optional[str] = None,
+    attributes: Optional[dict[str, Any]] = None,
+) -> Iterator[Span]:
+    """Run a block inside a span that is current for the duration of the block.
+
+    Args:
+        name: Name of the operation
+        kind: Whether the span serves a request, calls out or is internal
+        parent: Optional explicit parent span
+        traceparent: Optional W3C traceparent header of a remote parent
+        attributes: Optional initial attributes
+
+    Yields:
+        The span, ended with the block's exception if it raised
+    """
+    active = start_span(name, kind, parent, traceparent, attributes)
+    token = current_span.set(active)
+    try:
+        yield active
+    except BaseException as e:
+        active.end(error=e)
+        raise
+    finally:
+        current_span.reset(token)
+        active.end()
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None:
+        ...
+
+
+class JsonFileSpanExporter:
+    """Append finished spans to a file, one JSON object per line.
+
+    Once the file reaches its size limit it is renamed to path.1, older
+    files shift up by one, and the oldest beyond the kept backups is deleted.
+    Server workers share the file, so each export holds an exclusive lock on
+    a sidecar lock file around the size check, the rotation and the append.
+    """
+
+    def __init__(self, path: str, max_bytes: int, backups: int) -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: File receiving the spans
+            max_bytes: Size at which the file is rotated; zero disables rotation
+            backups: Number of rotated files kept
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def _rotate(self) -> None:
+        if not self.backups:
+            self.path.unlink(missing_ok=True)
+            return
+        self.path.with_name(f"{self.path.name}.{self.backups}").unlink(missing_ok=True)
+        for index in range(self.backups - 1, 0, -1):
+            backup = self.path.with_name(f"{self.path.name}.{index}")
+            if backup.exists():
+                backup.rename(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.rename(self.path.with_name(f"{self.path.name}.1"))
+
+    def export(self, spans: list[Span]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(
+            json.dumps(finished.to_dict(), default=str) + "\n" for finished in spans
+        )
+        with self.lock_path.open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if (
+                    self.max_bytes
+                    and self.path.exists()
+                    and self.path.stat().st_size >= self.max_bytes
+                ):
+                    self._rotate()
+                with self.path.open("a", encoding="utf-8") as file:
+                    file.write(lines)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class OtlpHttpSpanExporter:
+    """Send finished spans to an OTLP/HTTP collector as JSON."""
+
+    def __init__(self, endpoint: str, service_name: str) -> None:
+        self.endpoint = endpoint
+        self.resource = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": service_name}}
+            ]
+        }
+        self._client = httpx.Client(timeout=5.0)
+
+    def export(self, spans: list[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self.resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "jira_agent"},
+                            "spans": [finished.to_otlp() for finished in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        self._client.post(self.endpoint, json=payload).raise_for_status()
+
+
+class Tracer:
+    """Collect finished spans and export them in batches from a worker thread.
+
+    Spans are dropped rather than slowing down requests when the exporter
+    falls behind and the queue is full.
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter],
+        batch_size: int,
+        flush_interval: float,
+        max_queue_size: int,
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            exporter: Destination of finished spans; None disables exporting
+            batch_size: Maximum number of spans exported at once
+            flush_interval: Maximum seconds a finished span waits for export
+            max_queue_size: Maximum number of spans waiting for export
+        """
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Optional[Span]] = queue.Queue(max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def on_end(self, finished: Span) -> None:
+        if self.exporter is None:
+            return
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(finished)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="span-exporter", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: list[Span] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0.0)
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            if batch:
+                self._export(batch)
+
+    def _export(self, batch: list[Span]) -> None:
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.warning(f"Error exporting {len(batch)} spans: {e}")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Export the queued spans and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the export
+        """
+        if self._worker is None or not self._worker.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._worker.join(timeout)
+        if self.dropped:
+            logger.warning(f"Dropped {self.dropped} spans while the exporter lagged")
+
+
+def create_exporter() -> Optional[SpanExporter]:
+    """Create the span exporter configured by the settings.
+
+    Raises:
+        ValueError: If the configured exporter is unknown
+    """
+    if settings.TRACING_EXPORTER == "none":
+        return None
+    if settings.TRACING_EXPORTER == "json":
+        return JsonFileSpanExporter(
+            settings.TRACING_FILE,
+            settings.TRACING_FILE_MAX_BYTES,
+            settings.TRACING_FILE_BACKUPS,
+        )
+    if settings.TRACING_EXPORTER == "otlp":
+        return OtlpHttpSpanExporter(
+            settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME
+        )
+    raise ValueError(f"Unknown span exporter: {settings.TRACING_EXPORTER}")
+
+
+tracer = Tracer(
+    create_exporter(),
+    batch_size=settings.TRACING_BATCH_SIZE,
+    flush_interval=settings.TRACING_FLUSH_INTERVAL_SECONDS,
+    max_queue_size=settings.TRACING_QUEUE_MAXSIZE,
+)
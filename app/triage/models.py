@@ -0,0 +1,17 @@
+from database import Base
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy.sql import func
+
+
+class LinkDecision(Base):
+    __tablename__ = "link_decisions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    ticket_key = Column(String(64), nullable=False)
+    candidate_key = Column(String(64), nullable=False)
+    ticket_text = Column(Text, nullable=False)
+    candidate_text = Column(Text, nullable=False)
+    related = Column(Boolean, nullable=False)
+    tier = Column(String(32), nullable=False)
+    confidence = Column(Float)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
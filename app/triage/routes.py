@@ -0,0 +1,61 @@
+"""Routes for webhook-driven ticket triage."""
+from exceptions import InvalidWebhookPayloadError, WebhookAuthError
+from fastapi import APIRouter, Header, Request
+from logger import logger
+from pydantic import ValidationError
+from triage.schemas import JiraWebhookEvent, TriageQueueStats, WebhookResponse
+from triage.services import needs_triage, triage_queue, verify_signature
+
+router = APIRouter(prefix="/api/triage", tags=["Triage"])
+
+
+@router.post("/webhook", response_model=WebhookResponse)
+async def jira_webhook(
+    request: Request,
+    x_hub_signature: str | None = Header(default=None),
+) -> WebhookResponse:
+    """Receive Jira issue events and queue the affected ticket for triage.
+
+    Bursts of events for the same ticket are coalesced into a single triage
+    run. When the queue is full the request is rejected with 429 and a
+    Retry-After header, so Jira redelivers the event later.
+
+    Args:
+        request: The webhook request
+        x_hub_signature: HMAC signature of the body, checked if a secret is set
+
+    Returns:
+        Whether the ticket was queued, merged into a waiting entry or ignored
+
+    Raises:
+        WebhookAuthError: If the signature is missing or invalid
+        InvalidWebhookPayloadError: If the body is not a valid issue event
+        TriageQueueFullError: If the triage queue is full
+    """
+    body = await request.body()
+    if not verify_signature(body, x_hub_signature):
+        raise WebhookAuthError()
+
+    try:
+        event = JiraWebhookEvent.model_validate_json(body)
+    except ValidationError as e:
+        logger.warning(
+            f"Rejecting webhook payload: {e.error_count()} validation errors, "
+            f"first: {e.errors()[0]['msg']}"
+        )
+        raise InvalidWebhookPayloadError() from e
+    if not needs_triage(event):
+        logger.debug(f"Ignoring webhook event {event.webhookEvent}")
+        return WebhookResponse(outcome="ignored")
+
+    response = triage_queue.submit(event.issue.key)
+    logger.info(
+        f"Webhook {event.webhookEvent} for {event.issue.key}: {response.outcome}"
+    )
+    return response
+
+
+@router.get("/queue", response_model=TriageQueueStats)
+async def get_queue_stats() -> TriageQueueStats:
+    """Get the depth, lag and throughput of the triage queue."""
+    return triage_queue.stats()
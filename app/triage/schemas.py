@@ -0,0 +1,41 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+WebhookOutcome = Literal["queued", "coalesced", "ignored"]
+
+
+class WebhookIssue(BaseModel):
+    key: str
+    fields: dict[str, Any] = Field(default_factory=dict)
+
+
+class WebhookChangelog(BaseModel):
+    items: list[dict[str, Any]] = Field(default_factory=list)
+
+
+class JiraWebhookEvent(BaseModel):
+    webhookEvent: str
+    timestamp: int | None = None
+    issue: WebhookIssue | None = None
+    changelog: WebhookChangelog | None = None
+
+
+class WebhookResponse(BaseModel):
+    outcome: WebhookOutcome
+    issue_key: str | None = None
+
+
+class TriageQueueStats(BaseModel):
+    pending: int
+    queued: int
+    in_flight: int
+    depth: int
+    max_size: int
+    oldest_pending_seconds: float
+    last_lag_seconds: float | None = None
+    max_lag_seconds: float
+    processed: int
+    failed: int
+    coalesced: int
+    rejected: int
@@ -0,0 +1,244 @@
+"""Debounced work queue that triages tickets reported by Jira webhooks."""
+import asyncio
+import hashlib
+import hmac
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+from config import settings
+from database import SessionLocal
+from exceptions import TriageQueueFullError
+from jira.services import get_triage_tool
+from logger import log_error, logger
+from triage.models import LinkDecision
+from triage.schemas import JiraWebhookEvent, TriageQueueStats, WebhookResponse
+
+TRIAGE_EVENTS = ("jira:issue_created", "jira:issue_updated")
+# Updates to other fields, including the comments and links triage itself
+# writes, do not change the outcome of a triage and are ignored
+TRIAGE_UPDATE_FIELDS = {"summary", "description"}
+
+
+def verify_signature(body: bytes, signature: str | None) -> bool:
+    """Check a webhook's X-Hub-Signature against the configured secret.
+
+    Args:
+        body: The raw request body
+        signature: The signature header, formatted as "sha256=<hex digest>"
+
+    Returns:
+        True if no secret is configured or the signature matches
+    """
+    if not settings.TRIAGE_WEBHOOK_SECRET:
+        return True
+    if not signature:
+        return False
+    digest = hmac.new(
+        settings.TRIAGE_WEBHOOK_SECRET.encode(), body, hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(signature.removeprefix("sha256="), digest)
+
+
+def needs_triage(event: JiraWebhookEvent) -> bool:
+    """Check whether a webhook event should (re)trigger triage of its issue."""
+    if event.webhookEvent not in TRIAGE_EVENTS or event.issue is None:
+        return False
+    if event.webhookEvent == "jira:issue_updated":
+        items = event.changelog.items if event.changelog else []
+        return bool({item.get("field") for item in items} & TRIAGE_UPDATE_FIELDS)
+    return True
+
+
+def record_link_decisions(decisions: list[dict[str, Any]]) -> None:
+    """Store LLM linking decisions as training data for the link classifier.
+
+    Args:
+        decisions: Column values of LinkDecision rows
+    """
+    if not decisions:
+        return
+    with SessionLocal() as db:
+        db.add_all(LinkDecision(**decision) for decision in decisions)
+        db.commit()
+    logger.debug(f"Recorded {len(decisions)} link decisions")
+
+
+@dataclass
+class PendingTicket:
+    """A ticket waiting for its burst of events to settle."""
+
+    first_seen: float
+    last_seen: float
+
+
+class TriageQueue:
+    """Coalesce webhook bursts per ticket and triage them with a fixed worker pool.
+
+    Events for the same ticket are merged while the ticket waits, and a ticket
+    is only queued once no event arrived for the debounce interval. Pending,
+    queued and in-flight tickets together are bounded by max_size; beyond that
+    new tickets are rejected so Jira retries them later.
+    """
+
+    def __init__(
+        self,
+        triage: Callable[[str], Awaitable[str]],
+        max_size: int,
+        debounce_seconds: float,
+        workers: int,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            triage: Coroutine function triaging one ticket by key
+            max_size: Maximum number of tickets held at once
+            debounce_seconds: Quiet period before a ticket is queued
+            workers: Number of tickets triaged concurrently
+        """
+        self.triage = triage
+        self.max_size = max_size
+        self.debounce_seconds = debounce_seconds
+        self.workers = workers
+        self._pending: dict[str, PendingTicket] = {}
+        self._queue: asyncio.Queue[tuple[str, float]] = asyncio.Queue(max_size)
+        self._queued: set[str] = set()
+        self._in_flight: set[str] = set()
+        self._tasks: list[asyncio.Task] = []
+        self._last_lag: float | None = None
+        self._max_lag = 0.0
+        self._counters = {"processed": 0, "failed": 0, "coalesced": 0, "rejected": 0}
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending) + len(self._queued) + len(self._in_flight)
+
+    def submit(self, issue_key: str) -> WebhookResponse:
+        """Register an event for a ticket.
+
+        Args:
+            issue_key: Key of the ticket to triage
+
+        Returns:
+            Whether the ticket was queued or merged into a waiting entry
+
+        Raises:
+            TriageQueueFullError: If the queue holds max_size tickets
+        """
+        now = time.monotonic()
+        if pending := self._pending.get(issue_key):
+            pending.last_seen = now
+        elif issue_key in self._queued:
+            pass
+        elif self.depth >= self.max_size:
+            self._counters["rejected"] += 1
+            logger.warning(f"Triage queue full, rejecting {issue_key}")
+            raise TriageQueueFullError(settings.TRIAGE_RETRY_AFTER_SECONDS)
+        else:
+            self._pending[issue_key] = PendingTicket(first_seen=now, last_seen=now)
+            return WebhookResponse(outcome="queued", issue_key=issue_key)
+        self._counters["coalesced"] += 1
+        return WebhookResponse(outcome="coalesced", issue_key=issue_key)
+
+    def stats(self) -> TriageQueueStats:
+        """Get the current depth, lag and throughput of the queue."""
+        now = time.monotonic()
+        return TriageQueueStats(
+            pending=len(self._pending),
+            queued=len(self._queued),
+            in_flight=len(self._in_flight),
+            depth=self.depth,
+            max_size=self.max_size,
+            oldest_pending_seconds=round(
+                max((now - p.first_seen for p in self._pending.values()), default=0.0),
+                3,
+            ),
+            last_lag_seconds=self._last_lag,
+            max_lag_seconds=self._max_lag,
+            **self._counters,
+        )
+
+    def start(self) -> None:
+        """Start the debounce loop and the workers."""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._release_settled()))
+        self._tasks += [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        logger.info(f"Triage queue started with {self.workers} workers")
+
+    async def stop(self, drain_timeout: float = 0.0) -> None:
+        """Cancel the debounce loop and the workers.
+
+        Args:
+            drain_timeout: Seconds to let in-flight triage runs finish before
+                they are cancelled; tickets not yet started stay unprocessed
+        """
+        if self._tasks:
+            self._tasks[0].cancel()  # Stop queueing settled tickets
+        deadline = time.monotonic() + drain_timeout
+        while self._in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+        logger.info(f"Triage queue stopped with {self.depth} tickets left")
+
+    async def _release_settled(self) -> None:
+        """Move tickets whose events have settled from pending to the work queue."""
+        while True:
+            await asyncio.sleep(min(self.debounce_seconds / 2, 1.0))
+            cutoff = time.monotonic() - self.debounce_seconds
+            settled = [
+                key
+                for key, pending in self._pending.items()
+                if pending.last_seen <= cutoff and key not in self._in_flight
+            ]
+            for key in settled:
+                pending = self._pending.pop(key)
+                self._queued.add(key)
+                # Admission in submit keeps the queue below its bound
+                self._queue.put_nowait((key, pending.first_seen))
+
+    async def _work(self) -> None:
+        while True:
+            key, first_seen = await self._queue.get()
+            self._queued.discard(key)
+            self._in_flight.add(key)
+            self._last_lag = round(time.monotonic() - first_seen, 3)
+            self._max_lag = max(self._max_lag, self._last_lag)
+            try:
+                logger.info(f"Triaging {key} after {self._last_lag}s in queue")
+                result = await self.triage(key)
+                logger.info(f"Webhook triage of {key}: {result}")
+                self._counters["processed"] += 1
+            except Exception as e:
+                self._counters["failed"] += 1
+                log_error(logger, e, {"issue_key": key})
+            finally:
+                self._in_flight.discard(key)
+                self._queue.task_done()
+
+
+async def triage_ticket(issue_key: str) -> str:
+    """Triage a ticket with the shared agent's triage tool.
+
+    Webhook triage runs in the batch lane, so chat requests keep priority on
+    the LLM and Jira clients.
+    """
+    from agent.core.lanes import lane
+
+    with lane("batch"):
+        return await get_triage_tool().arun(issue_key)
+
+
+triage_queue = TriageQueue(
+    triage=triage_ticket,
+    max_size=settings.TRIAGE_QUEUE_MAXSIZE,
+    debounce_seconds=settings.TRIAGE_DEBOUNCE_SECONDS,
+    workers=settings.TRIAGE_WORKERS,
+)
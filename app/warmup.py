@@ -0,0 +1,102 @@
+"""Startup warm-up that moves agent construction off the request path."""
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any
+
+from config import settings
+from database import engine
+from jira.services import get_jira_agent, get_jira_tool
+from logger import log_error, logger
+from sqlalchemy import text
+
+# Paths that stay reachable while the service is warming up
+UNGATED_PATH_PREFIXES = ("/api/health", "/api/docs", "/api/redoc", "/api/openapi.json")
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up, shared with the request gate."""
+
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    timings: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready.is_set()
+
+
+warmup_state = WarmupState()
+
+
+def is_gated(path: str) -> bool:
+    """Check whether a request path has to wait for the warm-up to finish."""
+    return not warmup_state.is_ready and not path.startswith(UNGATED_PATH_PREFIXES)
+
+
+def _open_database_pool() -> None:
+    """Check out as many connections as the pool keeps open and ping the server."""
+    pool_size = getattr(engine.pool, "size", lambda: 1)()
+    connections = [engine.connect() for _ in range(pool_size)]
+    try:
+        connections[0].execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def _build_agent() -> None:
+    """Construct the shared agent together with its executor."""
+    _ = get_jira_agent().executor
+
+
+async def _prime_project_cache() -> None:
+    """Open the Jira session and cache the configured project."""
+    await get_jira_tool().get_project_info(refresh=True)
+
+
+async def _run_phase(name: str, phase: Callable[[], Awaitable[Any]]) -> None:
+    started_at = time.perf_counter()
+    await phase()
+    warmup_state.timings[name] = round(time.perf_counter() - started_at, 3)
+    logger.info(f"Warm-up phase {name} took {warmup_state.timings[name]}s")
+
+
+async def _run_phases() -> None:
+    await _run_phase("import_agent", lambda: asyncio.to_thread(import_module, "agent"))
+    await _run_phase("build_agent", lambda: asyncio.to_thread(_build_agent))
+    await asyncio.gather(
+        _run_phase("database_pool", lambda: asyncio.to_thread(_open_database_pool)),
+        _run_phase("jira_project", _prime_project_cache),
+    )
+
+
+async def warm_up() -> None:
+    """Build the agent, open pooled connections and prime caches.
+
+    Blocking work runs in worker threads so health checks stay responsive.
+    A failed warm-up still opens the gate; the agent is then built lazily by
+    the first request as before. The warm-up is retried in the background
+    until it succeeds, which clears the error reported by the readiness check.
+    """
+    if not settings.WARMUP_ENABLED:
+        warmup_state.ready.set()
+        return
+
+    while True:
+        started_at = time.perf_counter()
+        try:
+            await _run_phases()
+            warmup_state.error = None
+            return
+        except Exception as e:
+            warmup_state.error = str(e)
+            log_error(logger, e, {"phase": "warm-up", "timings": warmup_state.timings})
+        finally:
+            warmup_state.timings["total"] = round(time.perf_counter() - started_at, 3)
+            warmup_state.ready.set()
+            logger.info(f"Warm-up finished: {warmup_state.timings}")
+        await asyncio.sleep(settings.WARMUP_RETRY_INTERVAL_SECONDS)
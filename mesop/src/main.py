@@ -2,12 +2,14 @@ import mesop as me
 
 # local imports
 try:
-    from .utils import ui_components
+    from .utils import metrics, ui_components
 except Exception:
-    from utils import ui_components
+    from utils import metrics, ui_components
 
+metrics.start_metrics_server()
 
-@me.page(path="/")
+
+@me.page(path="/", on_load=ui_components.on_page_load)
 def page(security_policy=me.SecurityPolicy(dangerously_disable_trusted_types=True)):
     with me.box(
         style=me.Style(
@@ -1,16 +1,22 @@
 import json
+import secrets
 
 import requests
 
 from . import config
 
 
-def call_jira_agent(request: str) -> str | None:
+def new_traceparent() -> str:
+    """Start a trace for an API call, as a W3C traceparent header value"""
+    return f"00-{secrets.token_hex(16)}-{secrets.token_hex(8)}-01"
+
+
+def call_jira_agent(request: str, session_id: str | None = None) -> dict | None:
     """Call the Jira agent API with proper request format"""
     try:
         # Prepare request data in JSON format
-        data = {"request": request}
-        headers = {"Content-Type": "application/json"}
+        data = {"request": request, "session_id": session_id}
+        headers = {"Content-Type": "application/json", "traceparent": new_traceparent()}
         url = f"{config.BASE_URL}api/jira/agent"
 
         # Log request details
@@ -28,8 +34,8 @@ def call_jira_agent(request: str) -> str | None:
 
         if response.status_code == 200:
             result = response.json()
-            if output := result.get("output"):
-                return f"Request: {request}<br>Output: {output}<br><br>"
+            if result.get("output"):
+                return result
 
         # Log error details for debugging
         print(f"API Response: Status={response.status_code}, Content={response.text}")
@@ -40,5 +46,30 @@ def call_jira_agent(request: str) -> str | None:
         return None
 
 
+def fetch_records(
+    limit: int, session_id: str, before_id: int | None = None
+) -> list[dict]:
+    """Fetch a page of a chat session's past agent requests, newest first"""
+    try:
+        params = {"limit": limit, "session_id": session_id}
+        if before_id is not None:
+            params["before_id"] = before_id
+        url = f"{config.BASE_URL}api/jira/records"
+        print(f"Fetching records from: {url} with params {params}")
+
+        response = requests.get(
+            url, params=params, headers={"traceparent": new_traceparent()}
+        )
+        if response.status_code == 200:
+            return response.json()
+
+        print(f"API Response: Status={response.status_code}, Content={response.text}")
+        return []
+
+    except Exception as e:
+        print(f"ERROR fetch_records: {e}")
+        return []
+
+
 if __name__ == "__main__":
     pass
@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass
 from typing import Optional
 
 import requests
@@ -8,6 +9,8 @@ import mesop as me
 # Configuration
 DOCKER_RUNNING = os.environ.get("DOCKER_RUNNING", "false").lower() == "true"
 BASE_URL = "http://api:8000/" if DOCKER_RUNNING else "http://localhost:8000/"
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "0"))
+SESSION_TTL_SECONDS = int(os.environ.get("SESSION_TTL_SECONDS", "1800"))
 
 
 def get_project_key() -> Optional[str]:
@@ -59,10 +62,28 @@ EXAMPLE_PROMPTS = [
 print(f"Using project key: {PROJECT_KEY or DEFAULT_PROJECT} for example prompts")
 
 
+# Chat history limits
+HISTORY_WINDOW = 10  # Messages rendered when the page is shown
+HISTORY_PAGE_SIZE = 10  # Messages revealed or fetched per "load older" click
+MAX_MESSAGES = 100  # Messages kept in a session before the oldest are dropped
+MAX_MESSAGE_CHARS = 4000  # Longer requests and responses are truncated
+
+
+@dataclass
+class ChatMessage:
+    request: str = ""
+    response: str = ""
+    is_error: bool = False
+    record_id: Optional[int] = None
+
+
 @me.stateclass
 class State:
+    session_id: str
     input: str
-    output: str
+    messages: list[ChatMessage]
+    visible_count: int = HISTORY_WINDOW
+    has_older: bool = True
     in_progress: bool
     project_key: Optional[str] = PROJECT_KEY
 
@@ -0,0 +1,85 @@
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import config
+
+
+class SessionGauges:
+    """Process-wide gauges for sizing frontend replicas"""
+
+    def __init__(self, session_ttl_seconds: float):
+        self.session_ttl_seconds = session_ttl_seconds
+        self._lock = threading.Lock()
+        self._last_seen: dict[str, float] = {}
+        self._in_flight = 0
+
+    def touch(self, session_id: str):
+        """Mark a session as active"""
+        with self._lock:
+            self._last_seen[session_id] = time.monotonic()
+
+    @contextmanager
+    def track_request(self):
+        """Count an agent request as in flight while the block runs"""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Get the current gauge values, forgetting sessions idle beyond the TTL"""
+        cutoff = time.monotonic() - self.session_ttl_seconds
+        with self._lock:
+            self._last_seen = {
+                session_id: last_seen
+                for session_id, last_seen in self._last_seen.items()
+                if last_seen >= cutoff
+            }
+            return {
+                "mesop_active_sessions": len(self._last_seen),
+                "mesop_in_flight_requests": self._in_flight,
+            }
+
+
+gauges = SessionGauges(config.SESSION_TTL_SECONDS)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = "".join(
+            f"# TYPE {name} gauge\n{name} {value}\n"
+            for name, value in gauges.snapshot().items()
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server():
+    """Serve the gauges in Prometheus text format on METRICS_PORT, if configured"""
+    if not config.METRICS_PORT:
+        return
+    try:
+        server = ThreadingHTTPServer(("0.0.0.0", config.METRICS_PORT), MetricsHandler)
+    except OSError as e:
+        print(f"WARNING: Metrics server not started on port {config.METRICS_PORT}: {e}")
+        return
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving metrics on port {config.METRICS_PORT}")
+
+
+if __name__ == "__main__":
+    pass
@@ -1,7 +1,17 @@
+import uuid
+
 import mesop as me
 
 # local imports
 from . import api_utils, config
+from .metrics import gauges
+
+
+def on_page_load(e: me.LoadEvent):
+    state = me.state(config.State)
+    if not state.session_id:
+        state.session_id = uuid.uuid4().hex
+    gauges.touch(state.session_id)
 
 
 def header_text():
@@ -55,7 +65,10 @@ def clear_output():
 
 
 def delete_state_helper(ClickEvent):
-    config.State.output = ""
+    state = me.state(config.State)
+    state.messages = []
+    state.visible_count = config.HISTORY_WINDOW
+    state.has_older = True
 
 
 def example_row():
@@ -92,10 +105,11 @@ def prompt_box(example: str, is_mobile: bool):
 
 
 def click_prompt_box(e: me.ClickEvent):
-    config.State.input = e.key
+    me.state(config.State).input = e.key
 
 
 def chat_input():
+    state = me.state(config.State)
     with me.box(
         style=me.Style(
             padding=me.Padding.all(8),
@@ -113,7 +127,7 @@ def chat_input():
             )
         ):
             me.native_textarea(
-                value=config.State.input,
+                value=state.input,
                 autosize=True,
                 min_rows=4,
                 placeholder="Enter your prompt",
@@ -134,33 +148,96 @@ def chat_input():
 
 
 def click_send(e: me.ClickEvent):
-    if not config.State.input:
+    state = me.state(config.State)
+    if not state.input:
         return
-    config.State.in_progress = True
-    input = config.State.input
-    config.State.input = ""
+    state.in_progress = True
+    input = state.input
+    state.input = ""
+    gauges.touch(state.session_id)
     yield
 
     try:
-        if result := api_utils.call_jira_agent(input):
-            config.State.output += result
+        with gauges.track_request():
+            result = api_utils.call_jira_agent(input, state.session_id)
+        if result:
+            message = config.ChatMessage(
+                request=truncate(input),
+                response=truncate(result["output"]),
+                record_id=result.get("record_id"),
+            )
         else:
-            config.State.output += (
-                f"Request: {input}<br>Error: Failed to get response from agent<br><br>"
+            message = config.ChatMessage(
+                request=truncate(input),
+                response="Failed to get response from agent",
+                is_error=True,
             )
     except Exception as e:
-        config.State.output += f"Request: {input}<br>Error: {str(e)}<br><br>"
+        message = config.ChatMessage(
+            request=truncate(input), response=str(e), is_error=True
+        )
 
-    config.State.in_progress = False
+    append_message(state, message)
+    state.in_progress = False
     yield
 
 
+def truncate(text: str) -> str:
+    if len(text) <= config.MAX_MESSAGE_CHARS:
+        return text
+    return f"{text[: config.MAX_MESSAGE_CHARS]} ... (truncated)"
+
+
+def append_message(state: config.State, message: config.ChatMessage):
+    """Append a message, dropping the oldest ones beyond the session cap"""
+    state.messages.append(message)
+    overflow = len(state.messages) - config.MAX_MESSAGES
+    if overflow > 0:
+        del state.messages[:overflow]
+        state.has_older = True
+
+
+def click_load_older(e: me.ClickEvent):
+    """Reveal hidden messages first, then page older ones in from the API"""
+    state = me.state(config.State)
+    hidden = len(state.messages) - state.visible_count
+    if hidden > 0:
+        state.visible_count += min(hidden, config.HISTORY_PAGE_SIZE)
+        return
+
+    room = min(config.HISTORY_PAGE_SIZE, config.MAX_MESSAGES - len(state.messages))
+    if room <= 0:
+        state.has_older = False
+        return
+
+    before_id = min(
+        (message.record_id for message in state.messages if message.record_id),
+        default=None,
+    )
+    records = api_utils.fetch_records(room, state.session_id, before_id)
+    older = [
+        config.ChatMessage(
+            request=truncate(record["request"] or ""),
+            response=truncate(record["response"] or ""),
+            record_id=record["id"],
+        )
+        for record in reversed(records)
+    ]
+    state.messages = older + state.messages
+    state.visible_count += len(older)
+    state.has_older = len(records) == room
+
+
 def textarea_on_blur(e: me.InputBlurEvent):
-    config.State.input = e.value
+    me.state(config.State).input = e.value
 
 
 def output():
-    if config.State.output or config.State.in_progress:
+    state = me.state(config.State)
+    if state.has_older or len(state.messages) > state.visible_count:
+        with me.box(style=me.Style(margin=me.Margin(top=36))):
+            me.button("Load older messages", type="flat", on_click=click_load_older)
+    if state.messages or state.in_progress:
         with me.box(
             style=me.Style(
                 background="#F0F4F9",
@@ -169,13 +246,22 @@ def output():
                 margin=me.Margin(top=36),
             )
         ):
-            if config.State.output:
-                me.markdown(config.State.output)
-            if config.State.in_progress:
+            for message in state.messages[-state.visible_count :]:
+                chat_message(message)
+            if state.in_progress:
                 with me.box(style=me.Style(margin=me.Margin(top=16))):
                     me.progress_spinner()
 
 
+def chat_message(message: config.ChatMessage):
+    with me.box(style=me.Style(margin=me.Margin(bottom=16))):
+        me.markdown(f"**Request:** {message.request}")
+        if message.is_error:
+            me.text(f"Error: {message.response}", style=me.Style(color="#DB4437"))
+        else:
+            me.markdown(message.response)
+
+
 def footer():
     with me.box(
         style=me.Style(